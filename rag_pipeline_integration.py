@@ -3,6 +3,7 @@ RAG Pipeline Integration with Smart Search Router
 Replace existing search.py implementation with optimized routing
 """
 
+import asyncio
 import logging
 
 from datetime import datetime
@@ -18,29 +19,109 @@ from smart_search_implementation import (
     SearchStrategy,
     RealEstateEntityExtractor
 )
+from src.trackrealties.core.config import settings
 from src.trackrealties.rag.embedders import DefaultEmbedder
+from src.trackrealties.rag.embedding_index import InMemoryEmbeddingIndex
+from src.trackrealties.rag.search import metadata_filter_clause
 from src.trackrealties.rag.synthesizer import ResponseSynthesizer
 from src.trackrealties.validation.hallucination import RealEstateHallucinationDetector
 from src.trackrealties.models.agent import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Chunk embeddings held in memory once per process and shared by every
+# vector search engine; the lock keeps concurrent warm-ups from loading the
+# table more than once
+_shared_memory_index = InMemoryEmbeddingIndex(quantization=settings.VECTOR_SEARCH_QUANTIZATION)
+_memory_index_warm_lock = asyncio.Lock()
+
 
 class OptimizedVectorSearch:
     """
     Optimized vector search with better error handling and performance
     """
     
-    def __init__(self):
+    def __init__(self, memory_index: Optional[InMemoryEmbeddingIndex] = None):
         self.embedder = DefaultEmbedder()
+        self.memory_index = memory_index if memory_index is not None else _shared_memory_index
+        self.use_memory_index = settings.VECTOR_SEARCH_MEMORY_INDEX
         self.initialized = False
     
     async def initialize(self):
         """Initialize the vector search client."""
         await db_pool.initialize()
         await self.embedder.initialize()
+        if self.use_memory_index:
+            await self._ensure_cache_warm()
         self.initialized = True
         logger.info("Optimized vector search initialized")
+
+    async def _ensure_cache_warm(self):
+        """Load every chunk embedding into the in-memory index once."""
+        if self.memory_index.loaded:
+            return
+        async with _memory_index_warm_lock:
+            if not self.memory_index.loaded:
+                await self._load_memory_index()
+
+    async def _load_memory_index(self):
+        async with db_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT
+                    'property_' || id::text AS result_id,
+                    content,
+                    'property' AS result_type,
+                    embedding::text AS embedding,
+                    metadata->>'address' AS title,
+                    'Property Listing' AS source,
+                    metadata
+                FROM property_chunks
+                UNION ALL
+                SELECT
+                    'market_' || id::text AS result_id,
+                    content,
+                    'market_data' AS result_type,
+                    embedding::text AS embedding,
+                    metadata->>'region_name' AS title,
+                    'Market Report' AS source,
+                    metadata
+                FROM market_chunks
+                """
+            )
+        self.memory_index.clear()
+        self.memory_index.add(dict(row) for row in rows)
+        self.memory_index.loaded = True
+        logger.info(f"Warmed in-memory vector index with {len(self.memory_index)} chunks")
+
+    def invalidate_cache(self):
+        """Drop the in-memory index; it is reloaded on the next search."""
+        self.memory_index.clear()
+
+    def add_to_cache(self, rows: List[Dict[str, Any]]):
+        """Append newly ingested chunks to a warm index without a full reload."""
+        if self.memory_index.loaded:
+            self.memory_index.add(rows)
+
+    def _search_memory_index(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        threshold: float,
+    ) -> List[SearchResult]:
+        index = self.memory_index
+        return [
+            SearchResult(
+                result_id=index.ids[row],
+                content=index.contents[row],
+                result_type=index.result_types[row],
+                similarity_score=similarity,
+                title=index.titles[row] or "No Title",
+                source=index.sources[row] or "No Source"
+            )
+            for row, similarity in index.search(query_embedding, limit, threshold, filters)
+        ]
     
     async def search(
         self,
@@ -57,48 +138,54 @@ class OptimizedVectorSearch:
         
         try:
             query_embedding = await self.embedder.embed_query(query)
+
+            if self.use_memory_index:
+                await self._ensure_cache_warm()
+                return self._search_memory_index(query_embedding, limit, filters, threshold)
+
             query_embedding_str = str(query_embedding)
 
-            # Build filter query more efficiently
-            filter_clauses = []
-            filter_values = []
-            if filters:
-                for key, value in filters.items():
-                    filter_clauses.append(f"metadata->>'{key}' = ${len(filter_values) + 3}")
-                    filter_values.append(value)
-            
-            filter_query = " AND " + " AND ".join(filter_clauses) if filter_clauses else ""
+            # Filters are pushed into each KNN scan; $1-$3 are embedding, threshold, limit
+            where_clause, filter_values = metadata_filter_clause(filters, first_param=4)
 
             async with db_pool.acquire() as conn:
-                # Optimized query with UNION for better performance
+                # Each branch orders by the raw distance operator so the ivfflat
+                # index can serve the KNN scan; the similarity threshold is applied
+                # to the k nearest rows afterwards instead of to every row.
                 results = await conn.fetch(
                     f"""
                     (
-                        SELECT
-                            'property_' || id::text as result_id,
-                            content,
-                            'property' as result_type,
-                            1 - (embedding <=> $1) AS similarity,
-                            metadata->>'address' as title,
-                            'Property Listing' as source
-                        FROM property_chunks
-                        WHERE 1 - (embedding <=> $1) > $2 {filter_query}
-                        ORDER BY similarity DESC
-                        LIMIT $3
+                        SELECT * FROM (
+                            SELECT
+                                'property_' || id::text as result_id,
+                                content,
+                                'property' as result_type,
+                                1 - (embedding <=> $1) AS similarity,
+                                metadata->>'address' as title,
+                                'Property Listing' as source
+                            FROM property_chunks
+                            {where_clause}
+                            ORDER BY embedding <=> $1
+                            LIMIT $3
+                        ) AS property_knn
+                        WHERE similarity > $2
                     )
                     UNION ALL
                     (
-                        SELECT
-                            'market_' || id::text as result_id,
-                            content,
-                            'market_data' as result_type,
-                            1 - (embedding <=> $1) AS similarity,
-                            metadata->>'region_name' as title,
-                            'Market Report' as source
-                        FROM market_chunks
-                        WHERE 1 - (embedding <=> $1) > $2 {filter_query}
-                        ORDER BY similarity DESC
-                        LIMIT $3
+                        SELECT * FROM (
+                            SELECT
+                                'market_' || id::text as result_id,
+                                content,
+                                'market_data' as result_type,
+                                1 - (embedding <=> $1) AS similarity,
+                                metadata->>'region_name' as title,
+                                'Market Report' as source
+                            FROM market_chunks
+                            {where_clause}
+                            ORDER BY embedding <=> $1
+                            LIMIT $3
+                        ) AS market_knn
+                        WHERE similarity > $2
                     )
                     ORDER BY similarity DESC
                     LIMIT $3
@@ -364,15 +451,23 @@ class OptimizedHybridSearch:
     Optimized hybrid search that intelligently combines vector and graph results
     """
     
-    def __init__(self):
-        self.vector_search = OptimizedVectorSearch()
-        self.graph_search = OptimizedGraphSearch()
+    def __init__(
+        self,
+        vector_search: Optional[OptimizedVectorSearch] = None,
+        graph_search: Optional[OptimizedGraphSearch] = None,
+    ):
+        # The RAG pipeline passes its own engines so their clients and
+        # in-memory index are not created twice
+        self.vector_search = vector_search or OptimizedVectorSearch()
+        self.graph_search = graph_search or OptimizedGraphSearch()
         self.initialized = False
     
     async def initialize(self):
         """Initialize both search engines"""
-        await self.vector_search.initialize()
-        await self.graph_search.initialize()
+        await asyncio.gather(
+            self.vector_search.initialize(),
+            self.graph_search.initialize()
+        )
         self.initialized = True
         logger.info("Optimized hybrid search initialized")
     
@@ -498,7 +593,7 @@ class EnhancedRAGPipeline:
         self.smart_router = SmartSearchRouter()
         self.vector_search = OptimizedVectorSearch()
         self.graph_search = OptimizedGraphSearch()
-        self.hybrid_search = OptimizedHybridSearch()
+        self.hybrid_search = OptimizedHybridSearch(self.vector_search, self.graph_search)
 
 
         self.analytics = analytics or search_analytics
@@ -512,13 +607,23 @@ class EnhancedRAGPipeline:
         self.smart_router.hybrid_search = self.hybrid_search
         
         self.initialized = False
+        # Serializes initialization so concurrent first requests don't each
+        # open their own clients
+        self._init_lock = asyncio.Lock()
     
     async def initialize(self):
-        """Initialize all components"""
-        await self.vector_search.initialize()
-        await self.graph_search.initialize()
-        await self.hybrid_search.initialize()
-        self.initialized = True
+        """Initialize all components (once, even if called concurrently)"""
+        async with self._init_lock:
+            if self.initialized:
+                return
+            # The hybrid search wraps these same two engines, so initializing
+            # them initializes it too
+            await asyncio.gather(
+                self.vector_search.initialize(),
+                self.graph_search.initialize(),
+            )
+            self.hybrid_search.initialized = True
+            self.initialized = True
         logger.info("Enhanced RAG pipeline initialized")
     
     async def search(self, query: str, user_context: Optional[Dict] = None, 
@@ -3,6 +3,7 @@ Agent-specific agent for the TrackRealties AI Platform.
 """
 from typing import List, Type, Optional
 from .base import BaseAgent, AgentDependencies, BaseTool
+from .roles import UserRole
 from .tools import (
     VectorSearchTool,
     GraphSearchTool,
@@ -16,31 +17,34 @@ from .tools import (
     FeasibilityAnalysisTool,
     SiteAnalysisTool,
 )
-from .prompts import BASE_SYSTEM_CONTEXT, AGENT_SYSTEM_PROMPT
+from .prompts import AGENT_FULL_PROMPT
 
 
 
 class AgentAgent(BaseAgent):
     """Agent specializing in real estate agent tasks."""
 
-    def __init__(self, deps: Optional[AgentDependencies] = None):
-        tools = self._get_tools(deps)
+    __slots__ = ()
 
-        role_models = getattr(deps.rag_pipeline, "role_models", {}) if deps else {}
-        model = role_models.get("agent") if role_models else None
-=======
     MODEL_PATH = "models/agent_llm"
+    _TOOL_CLASSES = (
+        VectorSearchTool,
+        GraphSearchTool,
+        MarketAnalysisTool,
+        PropertyRecommendationTool,
+        InvestmentOpportunityAnalysisTool,
+        ROIProjectionTool,
+        RiskAssessmentTool,
+        ZoningAnalysisTool,
+        ConstructionCostEstimationTool,
+        FeasibilityAnalysisTool,
+        SiteAnalysisTool,
+    )
 
     def __init__(self, deps: Optional[AgentDependencies] = None, model_path: Optional[str] = None):
-        tools = [
-            VectorSearchTool(deps=deps),
-            GraphSearchTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-            PropertyRecommendationTool(deps=deps),
-            InvestmentOpportunityAnalysisTool(deps=deps),
-            ROIProjectionTool(deps=deps),
-            RiskAssessmentTool(deps=deps),
-        ]
+        tools = self._get_tools(deps)
+
+        model = deps.model_for_role(UserRole.AGENT) if deps else None
 
         super().__init__(
             agent_name="agent_agent",
@@ -52,20 +56,8 @@ class AgentAgent(BaseAgent):
         )
 
     def get_role_specific_prompt(self) -> str:
-        return f"{BASE_SYSTEM_CONTEXT}\n{AGENT_SYSTEM_PROMPT}"
+        return AGENT_FULL_PROMPT
 
     def _get_tools(self, deps: Optional[AgentDependencies] = None) -> List[BaseTool]:
         """Returns the list of all tools available to the agent."""
-        return [
-            VectorSearchTool(deps=deps),
-            GraphSearchTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-            PropertyRecommendationTool(deps=deps),
-            InvestmentOpportunityAnalysisTool(deps=deps),
-            ROIProjectionTool(deps=deps),
-            RiskAssessmentTool(deps=deps),
-            ZoningAnalysisTool(deps=deps),
-            ConstructionCostEstimationTool(deps=deps),
-            FeasibilityAnalysisTool(deps=deps),
-            SiteAnalysisTool(deps=deps),
-        ]
+        return [tool_cls(deps=deps) for tool_cls in self._TOOL_CLASSES]
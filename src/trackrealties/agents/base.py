@@ -3,13 +3,15 @@ Base classes for all agents in the TrackRealties AI Platform.
 """
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Union, Type
+import asyncio
 import logging
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_ai.agent import Agent as PydanticAI
 from pydantic_ai.providers.openai import OpenAIProvider as OpenAI
 
 from ..core.config import settings
 from .context import ContextManager
+from .roles import UserRole
 from ..validation.base import ResponseValidator
 from ..models.agent import ValidationResult
 from pydantic_ai.models.openai import OpenAIModel
@@ -27,44 +29,103 @@ class AgentResponse(BaseModel):
     confidence_score: float = 1.0
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-from functools import partial
+from functools import cached_property, wraps
+
+
+async def _execute_tool_calls(calls: List[tuple], where: str) -> List[Dict[str, Any]]:
+    """
+    Executes ``(tool, arguments)`` pairs concurrently.
+
+    At most ``TOOL_CONCURRENCY_LIMIT`` calls run at once. Results are returned
+    in call order; a failing call yields an error result instead of cancelling
+    the others.
+    """
+    semaphore = asyncio.Semaphore(settings.TOOL_CONCURRENCY_LIMIT)
+
+    async def _invoke(tool: "BaseTool", arguments: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await tool.execute(**arguments)
+            except Exception as e:
+                logger.error(f"Tool {tool.name} failed {where}: {e}", exc_info=True)
+                return {"success": False, "error": str(e)}
+
+    return list(await asyncio.gather(*(_invoke(tool, arguments) for tool, arguments in calls)))
+
 
 class BaseTool(ABC):
     """Abstract base class for all tools."""
-    def __init__(self, name: str, description: str, deps: Optional['AgentDependencies'] = None):
-        self.name = name
-        self.description = description
+    # Subclasses declare their metadata once here rather than per instance
+    NAME: str = ""
+    DESCRIPTION: str = ""
+
+    def __init__(self, name: Optional[str] = None, description: Optional[str] = None, deps: Optional['AgentDependencies'] = None):
+        self.name = name or self.NAME
+        self.description = description or self.DESCRIPTION
         self.dependencies = deps or AgentDependencies()
 
     @abstractmethod
     async def execute(self, **kwargs) -> Dict[str, Any]:
         pass
 
-    def as_function(self):
-        """Returns the execute method with a unique name for PydanticAI."""
-        from functools import wraps
+    async def execute_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Executes this tool once per argument dict, concurrently.
+
+        Results are returned in input order; a failing call yields an error
+        result instead of cancelling the rest of the batch.
+        """
+        return await _execute_tool_calls([(self, arguments) for arguments in inputs], "in batch")
 
+    @cached_property
+    def _fn(self):
+        """Wrapper around ``execute`` built once per tool instance."""
         @wraps(self.execute)
         async def wrapper(**kwargs):
             return await self.execute(**kwargs)
-        
+
         wrapper.__name__ = self.name
         return wrapper
 
+    def as_function(self):
+        """Returns the execute method with a unique name for PydanticAI."""
+        return self._fn
+
 class AgentDependencies(BaseModel):
     """Dependencies needed by agents and tools."""
     context_manager: ContextManager = Field(default_factory=ContextManager)
     rag_pipeline: RAGPipeline = Field(default_factory=EnhancedRAGPipeline)
+
+    # Per-role fine-tuned models, resolved once from the pipeline at construction
+    _role_models: Dict[str, Any] = PrivateAttr(default_factory=dict)
     
     class Config:
         arbitrary_types_allowed = True
     # Add other dependencies like database connections, etc.
 
+    def model_post_init(self, __context: Any) -> None:
+        self._role_models = dict(getattr(self.rag_pipeline, "role_models", None) or {})
+
+    def model_for_role(self, role: UserRole) -> Optional[Any]:
+        """Returns the fine-tuned model registered for a role, if any."""
+        return self._role_models.get(role.value)
+
 class BaseAgent(ABC):
     """
     The BaseAgent class provides the foundational functionality that all
     role-specific agents inherit.
     """
+    __slots__ = (
+        "agent_name",
+        "system_prompt",
+        "dependencies",
+        "validator",
+        "tools",
+        "model_path",
+        "llm",
+        "agent",
+    )
+
     def __init__(
         self,
         agent_name: str,
@@ -100,7 +161,7 @@ class BaseAgent(ABC):
         self.agent = PydanticAI(
             llm=self.llm,
             system_prompt=self.get_role_specific_prompt(),
-            tools=[tool.as_function() for tool in self.tools.values()]
+            tools=[tool._fn for tool in self.tools.values()]
         )
 
     @abstractmethod
@@ -115,8 +176,26 @@ class BaseAgent(ABC):
         self.agent = PydanticAI(
             llm=self.llm,
             system_prompt=self.get_role_specific_prompt(),
-            tools=[t.as_function() for t in self.tools.values()]
+            tools=[t._fn for t in self.tools.values()]
+        )
+
+    async def run_tools_parallel(self, tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Executes independent tool calls concurrently.
+
+        Each call is a dict with a ``name`` and optional ``arguments``. Results are
+        returned in call order; a failing tool yields an error result instead of
+        cancelling its siblings.
+        """
+        results = [{"success": False, "error": f"Unknown tool: {call['name']}"} for call in tool_calls]
+        known = [index for index, call in enumerate(tool_calls) if call["name"] in self.tools]
+        executed = await _execute_tool_calls(
+            [(self.tools[tool_calls[index]["name"]], tool_calls[index].get("arguments", {})) for index in known],
+            f"in agent {self.agent_name}",
         )
+        for index, result in zip(known, executed):
+            results[index] = result
+        return results
 
     async def run(self, message: str, session_id: str, user_id: Optional[str] = None, user_role: Optional[str] = None) -> AgentResponse:
         """
@@ -140,7 +219,6 @@ class BaseAgent(ABC):
             )
 
             agent_response = AgentResponse(content=response_content)
-            """codex/implement-realestatehallucinationdetector-and-tests"""
             combined_result = validation
 
             # Append assistant message to history
@@ -151,9 +229,11 @@ class BaseAgent(ABC):
             )
             context.add_message(assistant_msg)
 
-            # Persist updated context
-             self.dependencies.context_manager.update_context(session_id, context)
-        """Planning-for-Phase-2-Docs"""
+            # Persist updated context; a failure here should not fail the turn
+            try:
+                self.dependencies.context_manager.update_context(session_id, context)
+            except Exception as e:
+                logger.warning(f"Failed to persist context for session {session_id}: {e}")
 
             if self.validator:
                 extra = await self.validator.validate_response(
@@ -3,35 +3,33 @@ Buyer-specific agent for the TrackRealties AI Platform.
 """
 from typing import List, Type, Optional
 from .base import BaseAgent, AgentDependencies, BaseTool
+from .roles import UserRole
 from .tools import (
     VectorSearchTool,
     PropertyRecommendationTool,
     MarketAnalysisTool,
 )
-from .prompts import BASE_SYSTEM_CONTEXT, BUYER_SYSTEM_PROMPT
+from .prompts import BUYER_FULL_PROMPT
 
 
 
 class BuyerAgent(BaseAgent):
     """Agent specialized in assisting home buyers."""
 
-    def __init__(self, deps: Optional[AgentDependencies] = None):
-        tools = self._get_tools(deps)
-
-        role_models = getattr(deps.rag_pipeline, "role_models", {}) if deps else {}
-        model = role_models.get("buyer") if role_models else None
-
-class BuyerAgent(BaseAgent):
-    """An agent specialized in assisting home buyers."""
+    __slots__ = ()
 
     MODEL_PATH = "models/buyer_llm"
+    _TOOL_CLASSES = (
+        VectorSearchTool,
+        PropertyRecommendationTool,
+        MarketAnalysisTool,
+    )
 
     def __init__(self, deps: Optional[AgentDependencies] = None, model_path: Optional[str] = None):
-        tools = [
-            VectorSearchTool(deps=deps),
-            PropertyRecommendationTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-        ]
+        tools = self._get_tools(deps)
+
+        model = deps.model_for_role(UserRole.BUYER) if deps else None
+
         super().__init__(
             agent_name="buyer_agent",
             model=model,
@@ -42,12 +40,8 @@ class BuyerAgent(BaseAgent):
         )
 
     def get_role_specific_prompt(self) -> str:
-        return f"{BASE_SYSTEM_CONTEXT}\n{BUYER_SYSTEM_PROMPT}"
+        return BUYER_FULL_PROMPT
 
     def _get_tools(self, deps: Optional[AgentDependencies] = None) -> List[BaseTool]:
         """Returns the list of tools available to the buyer agent."""
-        return [
-            VectorSearchTool(deps=deps),
-            PropertyRecommendationTool(deps=deps),
-            MarketAnalysisTool(deps=deps)
-        ]
+        return [tool_cls(deps=deps) for tool_cls in self._TOOL_CLASSES]
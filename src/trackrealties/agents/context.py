@@ -5,13 +5,15 @@ This module provides conversation context management, session handling,
 and user preference tracking for maintaining state across agent interactions.
 """
 
+import heapq
 import logging
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import json
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.trackrealties.models.conversation import ConversationMessage as Message
 from src.trackrealties.models.enums import MessageRole
@@ -40,6 +42,9 @@ class ConversationContext(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     expires_at: Optional[datetime] = None
+
+    # Callback installed by ContextManager to keep its message counter current
+    _on_message: Optional[Callable[[int], None]] = PrivateAttr(default=None)
     
     class Config:
         arbitrary_types_allowed = True
@@ -47,6 +52,8 @@ class ConversationContext(BaseModel):
         """Add a message to the conversation history."""
         self.messages.append(message)
         self.updated_at = datetime.utcnow()
+        if self._on_message is not None:
+            self._on_message(1)
     
     def get_recent_messages(self, limit: int = 10) -> List[Message]:
         """Get the most recent messages from the conversation."""
@@ -133,7 +140,34 @@ class ContextManager:
         self.contexts: Dict[str, ConversationContext] = {}
         self.user_profiles: Dict[str, UserProfile] = {}
         self.default_expiration_hours = default_expiration_hours
+        # Running counters so get_context_stats does not scan every context
+        self._total_messages = 0
+        self._role_counts: Counter = Counter()
+        # Min-heap of (expires_at, session_id) used by cleanup_expired_contexts
+        self._expiry_heap: List[Tuple[datetime, str]] = []
         logger.info("Initialized ContextManager")
+
+    def _count_messages(self, delta: int):
+        self._total_messages += delta
+
+    def _register_context(self, session_id: str, context: ConversationContext):
+        """Store a context and account for it in the running counters."""
+        previous = self.contexts.get(session_id)
+        if previous is context:
+            return
+        if previous is not None:
+            self._drop_context(session_id)
+        self.contexts[session_id] = context
+        self._total_messages += len(context.messages)
+        context._on_message = self._count_messages
+        if context.expires_at:
+            heapq.heappush(self._expiry_heap, (context.expires_at, session_id))
+
+    def _drop_context(self, session_id: str):
+        """Remove a context and undo its contribution to the running counters."""
+        context = self.contexts.pop(session_id)
+        self._total_messages -= len(context.messages)
+        context._on_message = None
     
     def get_or_create_context(
         self,
@@ -164,7 +198,7 @@ class ContextManager:
                 return context
             else:
                 # Remove expired context
-                del self.contexts[session_id]
+                self._drop_context(session_id)
         
         # Create new context
         context = ConversationContext(
@@ -179,7 +213,7 @@ class ContextManager:
             user_profile = self.get_or_create_user_profile(user_id, user_role)
             context.user_preferences = user_profile.preferences.copy()
         
-        self.contexts[session_id] = context
+        self._register_context(session_id, context)
         logger.info(f"Created new context for session {session_id}")
         return context
     
@@ -198,7 +232,7 @@ class ContextManager:
             if not context.is_expired():
                 return context
             else:
-                del self.contexts[session_id]
+                self._drop_context(session_id)
         return None
     
     def update_context(self, session_id: str, context: ConversationContext):
@@ -210,7 +244,7 @@ class ContextManager:
             context: Updated context
         """
         context.updated_at = datetime.utcnow()
-        self.contexts[session_id] = context
+        self._register_context(session_id, context)
         
         # Update user profile if user_id is available
         if context.user_id:
@@ -224,7 +258,7 @@ class ContextManager:
             session_id: Session identifier
         """
         if session_id in self.contexts:
-            del self.contexts[session_id]
+            self._drop_context(session_id)
             logger.info(f"Cleared context for session {session_id}")
     
     def get_or_create_user_profile(
@@ -248,11 +282,14 @@ class ContextManager:
             if role and not profile.role:
                 profile.role = role
                 profile.updated_at = datetime.utcnow()
+                self._role_counts["unknown"] -= 1
+                self._role_counts[role] += 1
             return profile
         
         # Create new profile
         profile = UserProfile(user_id=user_id, role=role)
         self.user_profiles[user_id] = profile
+        self._role_counts[role or "unknown"] += 1
         logger.info(f"Created new user profile for {user_id}")
         return profile
     
@@ -321,16 +358,30 @@ class ContextManager:
     
     def cleanup_expired_contexts(self):
         """Remove expired contexts from memory."""
-        expired_sessions = [
-            session_id for session_id, context in self.contexts.items()
-            if context.is_expired()
-        ]
-        
-        for session_id in expired_sessions:
-            del self.contexts[session_id]
+        now = datetime.utcnow()
+        heap = self._expiry_heap
+        expired_count = 0
+
+        while heap and heap[0][0] < now:
+            expires_at, session_id = heapq.heappop(heap)
+            context = self.contexts.get(session_id)
+            # Skip entries for contexts that were replaced or removed
+            if context is None or context.expires_at is None:
+                continue
+            if context.expires_at != expires_at:
+                # Expiration was extended (or the context replaced) after the
+                # entry was pushed; requeue under the current deadline.
+                if context.expires_at < now:
+                    self._drop_context(session_id)
+                    expired_count += 1
+                else:
+                    heapq.heappush(heap, (context.expires_at, session_id))
+                continue
+            self._drop_context(session_id)
+            expired_count += 1
         
-        if expired_sessions:
-            logger.info(f"Cleaned up {len(expired_sessions)} expired contexts")
+        if expired_count:
+            logger.info(f"Cleaned up {expired_count} expired contexts")
     
     def get_context_stats(self) -> Dict[str, Any]:
         """
@@ -339,21 +390,40 @@ class ContextManager:
         Returns:
             Statistics about active contexts and users
         """
-        active_contexts = len([c for c in self.contexts.values() if not c.is_expired()])
-        total_users = len(self.user_profiles)
+        total_contexts = len(self.contexts)
+        active_contexts = total_contexts - self._count_expired_contexts(datetime.utcnow())
         
-        role_distribution = {}
-        for profile in self.user_profiles.values():
-            role = profile.role or "unknown"
-            role_distribution[role] = role_distribution.get(role, 0) + 1
+        role_distribution = {role: count for role, count in self._role_counts.items() if count}
         
         return {
             "active_contexts": active_contexts,
-            "total_contexts": len(self.contexts),
-            "total_users": total_users,
+            "total_contexts": total_contexts,
+            "total_users": len(self.user_profiles),
             "role_distribution": role_distribution,
-            "average_messages_per_context": sum(len(c.messages) for c in self.contexts.values()) / max(len(self.contexts), 1)
+            "average_messages_per_context": self._total_messages / max(total_contexts, 1)
         }
+
+    def _count_expired_contexts(self, now: datetime) -> int:
+        """
+        Count stored contexts that have expired, without removing them.
+
+        Walks the expiry heap from its root and skips every subtree whose root
+        is not yet due, so only entries due before ``now`` are visited.
+        """
+        heap = self._expiry_heap
+        expired = set()
+        stack = [0] if heap else []
+        while stack:
+            index = stack.pop()
+            expires_at, session_id = heap[index]
+            if expires_at >= now:
+                continue
+            context = self.contexts.get(session_id)
+            # Entries can be stale: the context may be gone or extended since
+            if context is not None and context.expires_at is not None and context.expires_at < now:
+                expired.add(session_id)
+            stack.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(heap))
+        return len(expired)
     
     def export_user_data(self, user_id: str) -> Dict[str, Any]:
         """
@@ -3,6 +3,7 @@ Developer-specific agent for the TrackRealties AI Platform.
 """
 from typing import List, Type, Optional
 from .base import BaseAgent, AgentDependencies, BaseTool
+from .roles import UserRole
 from .tools import (
     ZoningAnalysisTool,
     ConstructionCostEstimationTool,
@@ -10,28 +11,28 @@ from .tools import (
     SiteAnalysisTool,
     MarketAnalysisTool,
 )
-from .prompts import BASE_SYSTEM_CONTEXT, DEVELOPER_SYSTEM_PROMPT
+from .prompts import DEVELOPER_FULL_PROMPT
 
 
 class DeveloperAgent(BaseAgent):
     """Agent specializing in real estate developer tasks."""
-    def __init__(self, deps: Optional[AgentDependencies] = None):
-        tools = self._get_tools(deps)
 
-        role_models = getattr(deps.rag_pipeline, "role_models", {}) if deps else {}
-        model = role_models.get("developer") if role_models else None
+    __slots__ = ()
 
-=======
     MODEL_PATH = "models/developer_llm"
+    _TOOL_CLASSES = (
+        ZoningAnalysisTool,
+        ConstructionCostEstimationTool,
+        FeasibilityAnalysisTool,
+        SiteAnalysisTool,
+        MarketAnalysisTool,
+    )
 
     def __init__(self, deps: Optional[AgentDependencies] = None, model_path: Optional[str] = None):
-        tools = [
-            ZoningAnalysisTool(deps=deps),
-            ConstructionCostEstimationTool(deps=deps),
-            FeasibilityAnalysisTool(deps=deps),
-            SiteAnalysisTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-        ]
+        tools = self._get_tools(deps)
+
+        model = deps.model_for_role(UserRole.DEVELOPER) if deps else None
+
         super().__init__(
             agent_name="developer_agent",
             model=model,
@@ -42,14 +43,8 @@ class DeveloperAgent(BaseAgent):
         )
 
     def get_role_specific_prompt(self) -> str:
-        return f"{BASE_SYSTEM_CONTEXT}\n{DEVELOPER_SYSTEM_PROMPT}"
+        return DEVELOPER_FULL_PROMPT
 
     def _get_tools(self, deps: Optional[AgentDependencies] = None) -> List[BaseTool]:
         """Returns the list of tools available to the developer agent."""
-        return [
-            ZoningAnalysisTool(deps=deps),
-            ConstructionCostEstimationTool(deps=deps),
-            FeasibilityAnalysisTool(deps=deps),
-            SiteAnalysisTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-        ]
+        return [tool_cls(deps=deps) for tool_cls in self._TOOL_CLASSES]
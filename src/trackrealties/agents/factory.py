@@ -1,31 +1,39 @@
 """Factory utilities for creating agent instances and loading fine-tuned models."""
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
 from typing import Type, Optional
 
 from .base import BaseAgent, AgentDependencies
 from .roles import UserRole
-from .investor import InvestorAgent
-from .developer import DeveloperAgent
-from .buyer import BuyerAgent
-from .agent import AgentAgent
 
+# Agent classes are imported on first use so only the roles actually served
+# pay for importing their modules and tools.
 _ROLE_TO_CLASS = {
-    UserRole.INVESTOR: InvestorAgent,
-    UserRole.DEVELOPER: DeveloperAgent,
-    UserRole.BUYER: BuyerAgent,
-    UserRole.AGENT: AgentAgent,
+    UserRole.INVESTOR: (".investor", "InvestorAgent"),
+    UserRole.DEVELOPER: (".developer", "DeveloperAgent"),
+    UserRole.BUYER: (".buyer", "BuyerAgent"),
+    UserRole.AGENT: (".agent", "AgentAgent"),
 }
 
 
+@lru_cache(maxsize=None)
 def get_agent_class(role: UserRole) -> Type[BaseAgent]:
     """Return the agent class for a user role."""
-    if role in _ROLE_TO_CLASS:
-        return _ROLE_TO_CLASS[role]
-    raise NotImplementedError(f"No agent implemented for role: {role.value}")
+    target = _ROLE_TO_CLASS.get(role)
+    if target is None:
+        raise NotImplementedError(f"No agent implemented for role: {role.value}")
+    module_name, class_name = target
+    return getattr(import_module(module_name, __package__), class_name)
 
 
+@lru_cache(maxsize=8)
 def _get_model_path(role: UserRole) -> Optional[str]:
-    """Return path to the fine-tuned model for the given role if available."""
+    """Return path to the fine-tuned model for the given role if available.
+
+    The result is cached for the lifetime of the process; call
+    ``_get_model_path.cache_clear()`` after adding or removing model directories.
+    """
     model_dir = Path(f"models/{role.value}_llm")
     return model_dir.as_posix() if model_dir.exists() else None
 
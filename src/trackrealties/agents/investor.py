@@ -3,6 +3,7 @@ Investor-specific agent for the TrackRealties AI Platform.
 """
 from typing import List, Type, Optional
 from .base import BaseAgent, AgentDependencies, BaseTool
+from .roles import UserRole
 from .tools import (
     VectorSearchTool,
     GraphSearchTool,
@@ -11,28 +12,28 @@ from .tools import (
     ROIProjectionTool,
     RiskAssessmentTool,
 )
-from .prompts import BASE_SYSTEM_CONTEXT, INVESTOR_SYSTEM_PROMPT
+from .prompts import INVESTOR_FULL_PROMPT
 
 class InvestorAgent(BaseAgent):
     """Agent specializing in real estate investor tasks."""
-    def __init__(self, deps: Optional[AgentDependencies] = None):
-        tools = self._get_tools(deps)
 
-        role_models = getattr(deps.rag_pipeline, "role_models", {}) if deps else {}
-        model = role_models.get("investor") if role_models else None
+    __slots__ = ()
 
-=======
     MODEL_PATH = "models/investor_llm"
+    _TOOL_CLASSES = (
+        VectorSearchTool,
+        GraphSearchTool,
+        MarketAnalysisTool,
+        InvestmentOpportunityAnalysisTool,
+        ROIProjectionTool,
+        RiskAssessmentTool,
+    )
 
     def __init__(self, deps: Optional[AgentDependencies] = None, model_path: Optional[str] = None):
-        tools = [
-            VectorSearchTool(deps=deps),
-            GraphSearchTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-            InvestmentOpportunityAnalysisTool(deps=deps),
-            ROIProjectionTool(deps=deps),
-            RiskAssessmentTool(deps=deps),
-        ]
+        tools = self._get_tools(deps)
+
+        model = deps.model_for_role(UserRole.INVESTOR) if deps else None
+
         super().__init__(
             agent_name="investor_agent",
             model=model,
@@ -43,15 +44,8 @@ class InvestorAgent(BaseAgent):
         )
 
     def get_role_specific_prompt(self) -> str:
-        return f"{BASE_SYSTEM_CONTEXT}\n{INVESTOR_SYSTEM_PROMPT}"
+        return INVESTOR_FULL_PROMPT
 
     def _get_tools(self, deps: Optional[AgentDependencies] = None) -> List[BaseTool]:
         """Returns the list of tools available to the investor agent."""
-        return [
-            VectorSearchTool(deps=deps),
-            GraphSearchTool(deps=deps),
-            MarketAnalysisTool(deps=deps),
-            InvestmentOpportunityAnalysisTool(deps=deps),
-            ROIProjectionTool(deps=deps),
-            RiskAssessmentTool(deps=deps),
-        ]
\ No newline at end of file
+        return [tool_cls(deps=deps) for tool_cls in self._TOOL_CLASSES]
\ No newline at end of file
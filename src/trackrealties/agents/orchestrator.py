@@ -2,15 +2,175 @@
 """
 Agent orchestration logic.
 """
+import asyncio
 import logging
-from uuid import UUID
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 from asyncpg import Connection
 
+from ..core.config import settings
 from ..data.repository import SessionRepository
+from ..models.db import ConversationMessage, MessageRole
+from ..rag.embedders import DefaultEmbedder
+from .base import AgentDependencies, AgentResponse, BaseAgent
 from .factory import create_agent, get_agent_class
+from .response_cache import SemanticResponseCache
+from .roles import UserRole
 
 logger = logging.getLogger(__name__)
 
+# Agents are reused across turns. Per-turn state lives in the context manager
+# keyed by session_id, so one instance can serve concurrent sessions. The key
+# includes id(deps); the pooled agent holds a reference to deps, so the id
+# cannot be recycled while the entry exists.
+_AGENT_POOL: Dict[Tuple[UserRole, int], BaseAgent] = {}
+
+
+def _get_or_create_agent(role: UserRole, deps: Optional[AgentDependencies] = None) -> BaseAgent:
+    """Return the pooled agent for ``role`` and ``deps``, creating it on first use."""
+    key = (role, id(deps))
+    agent = _AGENT_POOL.get(key)
+    if agent is None:
+        agent = create_agent(role, deps=deps)
+        _AGENT_POOL[key] = agent
+    return agent
+
+
+_AGENTS_PREWARMED = False
+
+
+def prewarm_agents():
+    """
+    Populate the agent pool for the roles in ``AGENT_PREWARM_ROLES``.
+
+    Called once during app startup; agents for other roles are still built
+    (and their modules imported) on first use. Later calls return immediately.
+    """
+    global _AGENTS_PREWARMED
+    if _AGENTS_PREWARMED:
+        return
+    _AGENTS_PREWARMED = True
+    for name in filter(None, (part.strip() for part in settings.AGENT_PREWARM_ROLES.split(","))):
+        try:
+            role = UserRole(name)
+            _get_or_create_agent(role)
+        except NotImplementedError:
+            continue
+        except Exception as e:
+            logger.warning(f"Could not prewarm agent for role {name}: {e}")
+
+
+# Streamed chunks are coalesced up to this many characters, or until a buffer
+# has been held this long, before being handed to the transport.
+STREAM_BUFFER_CHARS = 1024
+STREAM_MAX_HOLD_SECONDS = 0.02
+
+_STREAM_END = object()
+
+
+async def _coalesce_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Re-chunk a text stream into fewer, larger pieces.
+
+    The first chunk is passed through immediately. Later chunks are buffered
+    until ``STREAM_BUFFER_CHARS`` accumulate or the oldest buffered chunk has
+    waited ``STREAM_MAX_HOLD_SECONDS``; the hold limit is enforced with a
+    timeout, so a stalled producer never delays text already received. The
+    pending read runs as a task so a timeout does not cancel the producer.
+    """
+    iterator = chunks.__aiter__()
+    buffer: List[str] = []
+    buffered_chars = 0
+    held_since = 0.0
+    first_chunk = True
+    pending: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator, _STREAM_END))
+            if buffer:
+                hold = STREAM_MAX_HOLD_SECONDS - (time.monotonic() - held_since)
+                done, _ = await asyncio.wait((pending,), timeout=max(hold, 0.0))
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+                    continue
+
+            chunk = await pending
+            pending = None
+            if chunk is _STREAM_END:
+                break
+            if first_chunk:
+                first_chunk = False
+                yield chunk
+                continue
+
+            if not buffer:
+                held_since = time.monotonic()
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+            if buffered_chars >= STREAM_BUFFER_CHARS:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+_RESPONSE_CACHE = SemanticResponseCache(
+    threshold=settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+_QUERY_EMBEDDER = DefaultEmbedder()
+
+
+async def _embed_for_cache(query: str) -> Optional[List[float]]:
+    """Embed a query for the response cache; failures just disable caching for the turn."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+    try:
+        return await _QUERY_EMBEDDER.embed_query(query)
+    except Exception as e:
+        logger.warning(f"Could not embed query for response cache: {e}")
+        return None
+
+
+def _serve_cached_response(agent: BaseAgent, session, query: str, cached: AgentResponse) -> AgentResponse:
+    """
+    Adapt a cached response to this turn and record the turn in the session's context.
+
+    The cached object may have been produced for another session, so a copy is
+    returned with this session's id, query and a new response id in its metadata.
+    """
+    session_id = str(session.id)
+    context_manager = agent.dependencies.context_manager
+    context = context_manager.get_or_create_context(session_id, session.user_id, session.user_role.value)
+    context.add_message(ConversationMessage(session_id=session_id, role=MessageRole.USER, content=query))
+    context.add_message(ConversationMessage(session_id=session_id, role=MessageRole.ASSISTANT, content=cached.content))
+    try:
+        context_manager.update_context(session_id, context)
+    except Exception as e:
+        logger.warning(f"Failed to persist context for session {session_id}: {e}")
+
+    return cached.model_copy(
+        deep=True,
+        update={
+            "metadata": {
+                **cached.metadata,
+                "session_id": session_id,
+                "query": query,
+                "response_id": str(uuid4()),
+                "cached": True,
+            }
+        },
+    )
+
 async def run_agent_turn(
     session_id: UUID,
     query: str,
@@ -25,20 +185,32 @@ async def run_agent_turn(
     if not session:
         raise ValueError("Session not found or has expired.")
 
-    # 2. Instantiate the appropriate agent using the factory
+    # 2. Get the appropriate agent from the pool (created via the factory)
     try:
-        agent = create_agent(session.user_role)
+        agent = _get_or_create_agent(session.user_role)
     except NotImplementedError as e:
         logger.warning(f"Could not find agent for role {session.user_role}: {e}")
         raise
 
+    # 3. Serve semantically similar repeat queries from the response cache
+    role = session.user_role.value
+    query_embedding = await _embed_for_cache(query)
+    if query_embedding is not None:
+        cached = _RESPONSE_CACHE.get(role, query_embedding)
+        if cached is not None:
+            return _serve_cached_response(agent, session, query, cached)
+
     # 4. Run the agent
     response = await agent.run(
         message=query,
         session_id=str(session.id),
         user_id=session.user_id,
-        user_role=session.user_role.value
+        user_role=role
     )
+
+    # Only cache successful turns; failures are reported with zero confidence
+    if query_embedding is not None and response.confidence_score > 0:
+        _RESPONSE_CACHE.set(role, query_embedding, response)
     
     return response
 
@@ -56,7 +228,7 @@ async def stream_agent_turn(
         raise ValueError("Session not found or has expired.")
 
     try:
-        agent = create_agent(session.user_role)
+        agent = _get_or_create_agent(session.user_role)
     except NotImplementedError as e:
         logger.warning(f"Could not find agent for role {session.user_role}: {e}")
         raise
@@ -64,5 +236,9 @@ async def stream_agent_turn(
     # Pass session context to agent if needed
     agent.dependencies.context_manager.get_or_create_context(str(session.id), session.user_id, session.user_role.value)
 
-    async for chunk in agent.stream(query):
+    # The first chunk goes out immediately; later ones are coalesced so tiny
+    # token-sized chunks don't each cost a transport write.
+    async for chunk in _coalesce_chunks(
+        agent.stream(query, str(session.id), session.user_id, session.user_role.value)
+    ):
         yield chunk
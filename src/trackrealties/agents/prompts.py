@@ -1,4 +1,6 @@
 """Prompt templates extracted from trackrealities_prompt_engineering_doc.md."""
+import sys
+from typing import Final
 
 BASE_SYSTEM_CONTEXT = """
 You are TrackRealities AI, an expert real estate intelligence assistant with access to comprehensive market data and property listings. Your responses should be:
@@ -161,3 +163,9 @@ RESPONSE FORMAT:
 📋 **Action Plan** (immediate priorities and implementation steps)
 """
 
+# Full per-role system prompts, assembled once at import time and interned so
+# prompt-keyed caches can compare them by identity.
+INVESTOR_FULL_PROMPT: Final[str] = sys.intern("\n".join((BASE_SYSTEM_CONTEXT, INVESTOR_SYSTEM_PROMPT)))
+DEVELOPER_FULL_PROMPT: Final[str] = sys.intern("\n".join((BASE_SYSTEM_CONTEXT, DEVELOPER_SYSTEM_PROMPT)))
+BUYER_FULL_PROMPT: Final[str] = sys.intern("\n".join((BASE_SYSTEM_CONTEXT, BUYER_SYSTEM_PROMPT)))
+AGENT_FULL_PROMPT: Final[str] = sys.intern("\n".join((BASE_SYSTEM_CONTEXT, AGENT_SYSTEM_PROMPT)))
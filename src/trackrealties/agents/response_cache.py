@@ -0,0 +1,126 @@
+"""
+Semantic response cache for agent turns.
+
+Stores agent responses keyed by role and query embedding so that repeat or
+near-identical questions can be answered without another LLM round-trip.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .base import AgentResponse
+
+logger = logging.getLogger(__name__)
+
+
+class _RoleEntries:
+    """
+    Cached responses of one role, with their embeddings kept as matrix rows.
+
+    Rows are slots: a freed slot is marked unoccupied and reused by the next
+    insert, so lookups never rebuild the matrix. Capacity doubles as needed.
+    """
+
+    def __init__(self, dim: int):
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.occupied = np.zeros(0, dtype=bool)
+        self.stored_at = np.zeros(0, dtype=np.float64)
+        # slot -> response, least recently used first
+        self.slots: "OrderedDict[int, AgentResponse]" = OrderedDict()
+        self.free: List[int] = []
+
+    def add(self, vector: np.ndarray, response: AgentResponse, now: float):
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        self.matrix[slot] = vector
+        self.occupied[slot] = True
+        self.stored_at[slot] = now
+        self.slots[slot] = response
+
+    def remove(self, slot: int):
+        del self.slots[slot]
+        self.occupied[slot] = False
+        self.free.append(slot)
+
+    def _grow(self):
+        size = len(self.matrix)
+        capacity = max(2 * size, 16)
+        self.matrix = np.concatenate([self.matrix, np.zeros((capacity - size, self.matrix.shape[1]), dtype=np.float32)])
+        self.occupied = np.concatenate([self.occupied, np.zeros(capacity - size, dtype=bool)])
+        self.stored_at = np.concatenate([self.stored_at, np.zeros(capacity - size)])
+        # Popped from the end, so the lowest free slot is used first
+        self.free.extend(range(capacity - 1, size - 1, -1))
+
+
+class SemanticResponseCache:
+    """
+    Bounded, TTL-aware LRU of agent responses per role.
+
+    Lookups compare the query embedding against every cached embedding for the
+    role with a single matrix-vector product and return the best match whose
+    cosine similarity reaches ``threshold``. Returned responses are the cached
+    objects themselves; callers that modify them must copy first.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024, ttl_seconds: int = 3600):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, _RoleEntries] = {}
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def _evict_expired(self, entries: _RoleEntries, now: float):
+        expired = np.flatnonzero(entries.occupied & (now - entries.stored_at > self.ttl_seconds))
+        for slot in expired.tolist():
+            entries.remove(slot)
+
+    def get(self, role: str, embedding: List[float]) -> Optional[AgentResponse]:
+        """Return a cached response for a semantically similar query, if any."""
+        entries = self._entries.get(role)
+        if not entries or not entries.slots:
+            return None
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != entries.matrix.shape[1]:
+            return None
+
+        self._evict_expired(entries, time.monotonic())
+        if not entries.slots:
+            return None
+
+        similarities = entries.matrix @ query
+        similarities[~entries.occupied] = -np.inf
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        entries.slots.move_to_end(best)
+        logger.debug(f"Semantic cache hit for role {role} (similarity={similarities[best]:.3f})")
+        return entries.slots[best]
+
+    def set(self, role: str, embedding: List[float], response: AgentResponse):
+        """Cache a response under the query embedding for a role."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        entries = self._entries.get(role)
+        if entries is None or entries.matrix.shape[1] != vector.shape[0]:
+            # First entry for the role, or the embedding model changed
+            entries = self._entries[role] = _RoleEntries(vector.shape[0])
+        while entries.slots and len(entries.slots) >= self.max_entries:
+            entries.remove(next(iter(entries.slots)))
+        entries.add(vector, response, time.monotonic())
+
+    def clear(self):
+        """Drop every cached response."""
+        self._entries.clear()
@@ -1,22 +1,30 @@
 """
 Core tools for the TrackRealties AI Platform agents.
 """
-from typing import Dict, Any, List, Optional
+import logging
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+import numpy as np
+
+from ..analytics._projections import project_cashflows
 from .base import BaseTool
 
+logger = logging.getLogger(__name__)
+
+# Construction cost per square foot by build quality
+_COST_PER_SQFT: Mapping[str, int] = MappingProxyType({"low": 150, "medium": 250, "high": 400})
+_DEFAULT_COST_PER_SQFT = _COST_PER_SQFT["medium"]
+
 class VectorSearchTool(BaseTool):
     """A tool for performing vector-based searches."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="vector_search",
-            description="Performs a vector search for properties or market data.",
-            deps=deps
-        )
+    NAME = "vector_search"
+    DESCRIPTION = "Performs a vector search for properties or market data."
 
     async def execute(self, query: str, limit: int = 5) -> Dict[str, Any]:
         """Executes the vector search."""
         # Placeholder implementation
-        print(f"--- Performing vector search for: {query} ---")
+        logger.debug("Performing vector search for: %s", query)
         return {
             "success": True,
             "data": [
@@ -27,17 +35,13 @@ class VectorSearchTool(BaseTool):
 
 class GraphSearchTool(BaseTool):
     """A tool for performing graph-based searches."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="graph_search",
-            description="Performs a graph search to find relationships between entities.",
-            deps=deps
-        )
+    NAME = "graph_search"
+    DESCRIPTION = "Performs a graph search to find relationships between entities."
 
     async def execute(self, query: str) -> Dict[str, Any]:
         """Executes the graph search."""
         # Placeholder implementation
-        print(f"--- Performing graph search for: {query} ---")
+        logger.debug("Performing graph search for: %s", query)
         return {
             "success": True,
             "data": [
@@ -47,17 +51,13 @@ class GraphSearchTool(BaseTool):
 
 class MarketAnalysisTool(BaseTool):
     """A tool for analyzing market trends."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="market_analysis",
-            description="Analyzes market trends for a given location.",
-            deps=deps
-        )
+    NAME = "market_analysis"
+    DESCRIPTION = "Analyzes market trends for a given location."
 
     async def execute(self, location: str) -> Dict[str, Any]:
         """Executes the market analysis."""
         # Placeholder implementation
-        print(f"--- Analyzing market for: {location} ---")
+        logger.debug("Analyzing market for: %s", location)
         return {
             "success": True,
             "data": {
@@ -70,17 +70,13 @@ class MarketAnalysisTool(BaseTool):
 
 class PropertyRecommendationTool(BaseTool):
     """A tool for recommending properties."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="property_recommendation",
-            description="Recommends properties based on user criteria.",
-            deps=deps
-        )
+    NAME = "property_recommendation"
+    DESCRIPTION = "Recommends properties based on user criteria."
 
     async def execute(self, criteria: Dict[str, Any]) -> Dict[str, Any]:
         """Executes the property recommendation."""
         # Placeholder implementation
-        print(f"--- Recommending properties for criteria: {criteria} ---")
+        logger.debug("Recommending properties for criteria: %s", criteria)
         return {
             "success": True,
             "data": [
@@ -93,17 +89,13 @@ class PropertyRecommendationTool(BaseTool):
 
 class InvestmentOpportunityAnalysisTool(BaseTool):
     """A tool for comprehensive cash flow and investment analysis."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="investment_opportunity_analysis",
-            description="Analyzes a potential investment property, including cash flow, cash-on-cash return, and cap rate.",
-            deps=deps
-        )
+    NAME = "investment_opportunity_analysis"
+    DESCRIPTION = "Analyzes a potential investment property, including cash flow, cash-on-cash return, and cap rate."
 
     async def execute(self, purchase_price: float, monthly_rent: float, annual_expenses: float) -> Dict[str, Any]:
         """Executes the investment analysis."""
         # Placeholder implementation
-        print(f"--- Analyzing investment opportunity ---")
+        logger.debug("Analyzing investment opportunity")
         net_operating_income = (monthly_rent * 12) - annual_expenses
         cap_rate = (net_operating_income / purchase_price) * 100
         return {
@@ -117,43 +109,45 @@ class InvestmentOpportunityAnalysisTool(BaseTool):
 
 class ROIProjectionTool(BaseTool):
     """A tool for projecting return on investment over time."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="roi_projection",
-            description="Projects the Return on Investment (ROI) for a property over several years.",
-            deps=deps
-        )
+    NAME = "roi_projection"
+    DESCRIPTION = "Projects the Return on Investment (ROI) for a property over several years."
 
-    async def execute(self, purchase_price: float, initial_rent: float, annual_appreciation: float, years: int = 5) -> Dict[str, Any]:
+    async def execute(self, purchase_price: float, initial_rent: float, annual_appreciation: float, years: int = 5,
+                      annual_rent_growth: float = 0.0) -> Dict[str, Any]:
         """Executes the ROI projection."""
         # Placeholder implementation
-        print(f"--- Projecting ROI over {years} years ---")
-        projected_value = purchase_price * ((1 + annual_appreciation) ** years)
-        total_rent = initial_rent * 12 * years # Simplified
-        total_return = (projected_value - purchase_price) + total_rent
-        roi = (total_return / purchase_price) * 100
+        logger.debug("Projecting ROI over %s years", years)
+        year_numbers = np.arange(1, years + 1)
+        projection = project_cashflows(
+            float(purchase_price), float(initial_rent), float(annual_appreciation), float(annual_rent_growth), years
+        )
+        projected_values = projection[:, 0]
+        total_returns = projection[:, 1]
+        rois = (total_returns / purchase_price) * 100
         return {
             "success": True,
             "data": {
-                "projected_value": projected_value,
-                "total_return": total_return,
-                "annualized_roi": round(roi / years, 2)
+                "projected_value": float(projected_values[-1]),
+                "total_return": float(total_returns[-1]),
+                "annualized_roi": round(float(rois[-1]) / years, 2),
+                "yearly_projections": {
+                    "year": year_numbers.tolist(),
+                    "projected_value": projected_values.tolist(),
+                    "total_return": total_returns.tolist(),
+                    "roi": np.round(rois, 2).tolist(),
+                }
             }
         }
 
 class RiskAssessmentTool(BaseTool):
     """A tool for assessing the risks of an investment."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="risk_assessment",
-            description="Assesses the risks associated with a real estate investment.",
-            deps=deps
-        )
+    NAME = "risk_assessment"
+    DESCRIPTION = "Assesses the risks associated with a real estate investment."
 
     async def execute(self, location: str, property_type: str) -> Dict[str, Any]:
         """Executes the risk assessment."""
         # Placeholder implementation
-        print(f"--- Assessing risk for {property_type} in {location} ---")
+        logger.debug("Assessing risk for %s in %s", property_type, location)
         return {
             "success": True,
             "data": {
@@ -167,17 +161,13 @@ class RiskAssessmentTool(BaseTool):
 
 class ZoningAnalysisTool(BaseTool):
     """A tool for analyzing zoning regulations."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="zoning_analysis",
-            description="Analyzes zoning regulations for a specific property or area.",
-            deps=deps
-        )
+    NAME = "zoning_analysis"
+    DESCRIPTION = "Analyzes zoning regulations for a specific property or area."
 
     async def execute(self, address: str) -> Dict[str, Any]:
         """Executes the zoning analysis."""
         # Placeholder implementation
-        print(f"--- Analyzing zoning for: {address} ---")
+        logger.debug("Analyzing zoning for: %s", address)
         return {
             "success": True,
             "data": {
@@ -189,40 +179,47 @@ class ZoningAnalysisTool(BaseTool):
 
 class ConstructionCostEstimationTool(BaseTool):
     """A tool for estimating construction costs."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="construction_cost_estimation",
-            description="Estimates construction costs for a development project.",
-            deps=deps
-        )
+    NAME = "construction_cost_estimation"
+    DESCRIPTION = "Estimates construction costs for a development project."
 
     async def execute(self, square_footage: int, quality: str = "medium") -> Dict[str, Any]:
         """Executes the construction cost estimation."""
         # Placeholder implementation
-        print(f"--- Estimating construction cost for {square_footage} sqft ---")
-        cost_per_sqft = {"low": 150, "medium": 250, "high": 400}
-        total_cost = square_footage * cost_per_sqft.get(quality, 250)
+        logger.debug("Estimating construction cost for %s sqft", square_footage)
+        cost_per_sqft = _COST_PER_SQFT.get(quality, _DEFAULT_COST_PER_SQFT)
         return {
             "success": True,
             "data": {
-                "estimated_cost": total_cost,
-                "cost_per_sqft": cost_per_sqft.get(quality, 250)
+                "estimated_cost": square_footage * cost_per_sqft,
+                "cost_per_sqft": cost_per_sqft
             }
         }
 
+    @staticmethod
+    def estimate_costs(square_footages: np.ndarray, qualities: np.ndarray) -> np.ndarray:
+        """
+        Estimates construction costs for many parcels at once.
+
+        ``qualities`` holds one quality name per parcel; unknown names are
+        priced at the medium rate, as in ``execute``.
+        """
+        qualities = np.asarray(qualities)
+        cost_per_sqft = np.select(
+            [qualities == quality for quality in _COST_PER_SQFT],
+            list(_COST_PER_SQFT.values()),
+            default=_DEFAULT_COST_PER_SQFT,
+        )
+        return np.asarray(square_footages) * cost_per_sqft
+
 class FeasibilityAnalysisTool(BaseTool):
     """A tool for conducting a development feasibility study."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="feasibility_analysis",
-            description="Conducts a feasibility study for a development project.",
-            deps=deps
-        )
+    NAME = "feasibility_analysis"
+    DESCRIPTION = "Conducts a feasibility study for a development project."
 
     async def execute(self, land_cost: float, construction_cost: float, projected_sale_value: float) -> Dict[str, Any]:
         """Executes the feasibility analysis."""
         # Placeholder implementation
-        print(f"--- Conducting feasibility analysis ---")
+        logger.debug("Conducting feasibility analysis")
         profit = projected_sale_value - (land_cost + construction_cost)
         roi = (profit / (land_cost + construction_cost)) * 100
         return {
@@ -236,17 +233,13 @@ class FeasibilityAnalysisTool(BaseTool):
 
 class SiteAnalysisTool(BaseTool):
     """A tool for analyzing a potential development site."""
-    def __init__(self, deps: Optional['AgentDependencies'] = None):
-        super().__init__(
-            name="site_analysis",
-            description="Analyzes a potential development site for its suitability.",
-            deps=deps
-        )
+    NAME = "site_analysis"
+    DESCRIPTION = "Analyzes a potential development site for its suitability."
 
     async def execute(self, address: str) -> Dict[str, Any]:
         """Executes the site analysis."""
         # Placeholder implementation
-        print(f"--- Analyzing site at: {address} ---")
+        logger.debug("Analyzing site at: %s", address)
         return {
             "success": True,
             "data": {
@@ -0,0 +1,52 @@
+"""
+Compiled Newton-Raphson IRR kernel.
+
+Numba is an optional dependency. When it is installed the kernel is compiled
+to native code (and cached on disk); otherwise ``irr_newton`` is ``None`` and
+callers fall back to the NumPy implementation.
+"""
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit
+
+
+def _irr_newton_kernel(cash_flows: np.ndarray, max_iterations: int) -> float:
+    """
+    Newton-Raphson IRR over a contiguous ``float64`` array.
+
+    NPV and its derivative are accumulated in one pass, with the discount
+    factor advanced by a running product instead of a power per period.
+    Returns NaN if the iteration diverges or steps to a rate at or below -100%.
+    """
+    rate = 0.1
+    for _ in range(max_iterations):
+        step = 1.0 / (1.0 + rate)
+        discount = 1.0
+        npv = 0.0
+        npv_derivative = 0.0
+        for i in range(cash_flows.shape[0]):
+            term = cash_flows[i] * discount
+            npv += term
+            npv_derivative -= i * term
+            discount *= step
+        npv_derivative *= step
+
+        if not np.isfinite(npv) or not np.isfinite(npv_derivative):
+            return np.nan
+        if abs(npv_derivative) < 1e-10:
+            break
+
+        new_rate = rate - npv / npv_derivative
+
+        if not np.isfinite(new_rate) or new_rate <= -1:
+            return np.nan
+        if abs(new_rate - rate) < 1e-10:
+            break
+
+        rate = new_rate
+
+    return rate
+
+
+irr_newton = njit(cache=True)(_irr_newton_kernel) if NUMBA_AVAILABLE else None
@@ -0,0 +1,46 @@
+"""
+Numeric kernels for market intelligence.
+
+With Numba installed ``volatility`` is compiled (and warmed at import so the
+first request does not pay for compilation); otherwise the NumPy version is
+used.
+"""
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit
+
+
+def _volatility_numpy(prices: np.ndarray) -> float:
+    """Population standard deviation of period-over-period returns, skipping zero prices."""
+    previous, current = prices[:-1], prices[1:]
+    nonzero = previous != 0
+    returns = current[nonzero] / previous[nonzero] - 1
+    if not returns.size:
+        return 0.0
+    return float(returns.std())
+
+
+def _volatility_kernel(prices: np.ndarray) -> float:
+    """Single-pass (Welford) form of :func:`_volatility_numpy`."""
+    count = 0
+    mean = 0.0
+    squares = 0.0
+    for i in range(1, prices.shape[0]):
+        if prices[i - 1] == 0:
+            continue
+        value = prices[i] / prices[i - 1] - 1
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        squares += delta * (value - mean)
+    if count == 0:
+        return 0.0
+    return np.sqrt(squares / count)
+
+
+if NUMBA_AVAILABLE:
+    volatility = njit(cache=True)(_volatility_kernel)
+    volatility(np.ones(4))
+else:
+    volatility = _volatility_numpy
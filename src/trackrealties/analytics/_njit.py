@@ -0,0 +1,21 @@
+"""
+Optional Numba support for the analytics kernels.
+
+``njit`` and ``prange`` are Numba's when it is installed (the ``perf`` extra);
+otherwise ``njit`` is a no-op decorator and ``prange`` is ``range``, and
+callers check ``NUMBA_AVAILABLE`` to pick their NumPy implementation instead.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,65 @@
+"""
+Per-year ROI projection kernels.
+
+When the optional Numba dependency is installed the loop kernels are compiled
+to native code (``project_many`` runs scenarios in parallel); otherwise the
+NumPy implementation is used for single projections and scenarios are
+projected one after another.
+"""
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit, prange
+
+
+def _project_cashflows_numpy(purchase_price: float, initial_rent: float, appreciation: float,
+                             rent_growth: float, years: int) -> np.ndarray:
+    """
+    Project property value and cumulative total return for each year.
+
+    Returns a ``(years, 2)`` array: column 0 is the property value at the end
+    of the year, column 1 the appreciation plus rent collected to date.
+    """
+    year_numbers = np.arange(1, years + 1)
+    values = purchase_price * np.power(1 + appreciation, year_numbers)
+    annual_rents = initial_rent * 12 * np.power(1 + rent_growth, year_numbers - 1)
+    return np.column_stack((values, (values - purchase_price) + np.cumsum(annual_rents)))
+
+
+def _project_cashflows_kernel(purchase_price: float, initial_rent: float, appreciation: float,
+                              rent_growth: float, years: int) -> np.ndarray:
+    """Loop form of :func:`_project_cashflows_numpy`, advancing each growth factor by one multiply per year."""
+    out = np.empty((years, 2))
+    value = purchase_price
+    annual_rent = initial_rent * 12
+    collected_rent = 0.0
+    for year in range(years):
+        value *= 1 + appreciation
+        collected_rent += annual_rent
+        annual_rent *= 1 + rent_growth
+        out[year, 0] = value
+        out[year, 1] = (value - purchase_price) + collected_rent
+    return out
+
+
+project_cashflows = (
+    njit(cache=True)(_project_cashflows_kernel) if NUMBA_AVAILABLE else _project_cashflows_numpy
+)
+
+
+def _project_many_kernel(params: np.ndarray, years: int) -> np.ndarray:
+    """
+    Project many scenarios at once.
+
+    ``params`` is an ``(m, 4)`` array of purchase price, monthly rent, annual
+    appreciation and annual rent growth; returns an ``(m, years, 2)`` array.
+    """
+    out = np.empty((params.shape[0], years, 2))
+    for i in prange(params.shape[0]):
+        out[i] = project_cashflows(params[i, 0], params[i, 1], params[i, 2], params[i, 3], years)
+    return out
+
+
+project_many = (
+    njit(cache=True, parallel=True)(_project_many_kernel) if NUMBA_AVAILABLE else _project_many_kernel
+)
@@ -1,6 +1,23 @@
 """
 This module provides analytics tools specifically for the Real Estate Agent role.
 """
+from functools import lru_cache
+from itertools import repeat
+from typing import Tuple
+
+import numpy as np
+
+from .financial_metrics import round_floats
+
+# In a real implementation, this would fetch data from a database.
+# For this placeholder, we simulate access to property data, stored as
+# columns with a row index per property id.
+_MOCK_PROPERTY_IDS = ("prop1", "prop2", "prop3", "prop4")
+_MOCK_PROPERTY_ROWS = {property_id: row for row, property_id in enumerate(_MOCK_PROPERTY_IDS)}
+_MOCK_PRICES = np.array([300000, 350000, 320000, 400000], dtype=np.float64)
+_MOCK_SQFT = np.array([1500, 1600, 1550, 1800], dtype=np.float64)
+_MOCK_PRICE_PER_SQFT = _MOCK_PRICES / _MOCK_SQFT
+
 
 class AgentAnalyticsTools:
     """
@@ -23,35 +40,36 @@ class AgentAnalyticsTools:
             dict: A dictionary containing the CMA results, including
                   estimated_value, price_per_sqft, and a summary.
         """
-        # In a real implementation, this would fetch data from a database.
-        # For this placeholder, we simulate access to property data.
-        mock_db = {
-            "prop1": {"price": 300000, "sqft": 1500},
-            "prop2": {"price": 350000, "sqft": 1600},
-            "prop3": {"price": 320000, "sqft": 1550},
-            "prop4": {"price": 400000, "sqft": 1800},
-        }
-
-        comparable_prices = []
-        comparable_sqft_prices = []
-
-        for comp_id in comparable_property_ids:
-            if comp_id in mock_db:
-                comp_data = mock_db[comp_id]
-                comparable_prices.append(comp_data["price"])
-                comparable_sqft_prices.append(comp_data["price"] / comp_data["sqft"])
-
-        if not comparable_prices:
+        # The result only depends on which comparables are used (not their
+        # order), so the ids are sorted into a hashable cache key.
+        return round_floats(AgentAnalyticsTools._perform_cma_cached(
+            subject_property_id, tuple(sorted(comparable_property_ids))
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _perform_cma_cached(subject_property_id: str, comparable_property_ids: Tuple[str, ...]) -> dict:
+        """Compute the CMA for a subject and a sorted tuple of comparable ids."""
+        # One C-level pass maps ids to rows (-1 for unknown ids); duplicates are
+        # kept so a repeated comparable still counts once per occurrence.
+        rows = np.fromiter(
+            map(_MOCK_PROPERTY_ROWS.get, comparable_property_ids, repeat(-1)),
+            dtype=np.intp,
+            count=len(comparable_property_ids),
+        )
+        rows = rows[rows >= 0]
+
+        if not rows.size:
             estimated_value = 0
             price_per_sqft = 0
         else:
-            estimated_value = sum(comparable_prices) / len(comparable_prices)
-            price_per_sqft = sum(comparable_sqft_prices) / len(comparable_sqft_prices)
+            estimated_value = float(_MOCK_PRICES[rows].mean())
+            price_per_sqft = float(_MOCK_PRICE_PER_SQFT[rows].mean())
 
         summary = "The estimated value is based on the average of comparable properties in the area."
 
         return {
-            "estimated_value": round(estimated_value, 2),
-            "price_per_sqft": round(price_per_sqft, 2),
+            "estimated_value": estimated_value,
+            "price_per_sqft": price_per_sqft,
             "summary": summary,
         }
\ No newline at end of file
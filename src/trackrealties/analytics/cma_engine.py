@@ -6,12 +6,96 @@ for generating comprehensive CMA reports for property valuation.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from ..models.property import PropertyListing
 from ..models.market import MarketDataPoint
 
+# Numeric listing fields used by the CMA, in column order. Missing or zero
+# values are stored as NaN so the adjustment for that field is skipped.
+_CMA_FIELDS = ("price", "squareFootage", "bedrooms", "bathrooms", "yearBuilt")
+_PRICE, _SQFT, _BEDROOMS, _BATHROOMS, _YEAR_BUILT = range(len(_CMA_FIELDS))
+
+# Adjustments, the listing column each is driven by, and the dollar value of a
+# one-unit difference (subject minus comparable). Square footage is weighted by
+# the comparable's own price per square foot instead of a fixed amount.
+_ADJUSTMENT_NAMES = ("squareFootage", "bedrooms", "bathrooms", "age")
+_ADJUSTED_FIELDS = [_SQFT, _BEDROOMS, _BATHROOMS, _YEAR_BUILT]
+_ADJUSTMENT_UNIT_VALUES = (
+    15000,   # $15k per bedroom
+    10000,   # $10k per bathroom
+    -1000,   # $1k per year, newer is better
+)
+
+# Column bundles per live listing, keyed by id(listing). Entries are removed
+# when the listing is garbage collected, so an id is never reused while cached.
+_LISTING_COLUMNS: Dict[int, np.ndarray] = {}
+
+
+def _listing_columns(listing: PropertyListing) -> np.ndarray:
+    """
+    Return the listing's numeric CMA fields as a read-only float64 row.
+
+    The row is built on first use and reused by later CMAs over the same
+    listing object; it reflects the listing's values at that first call.
+    """
+    key = id(listing)
+    columns = _LISTING_COLUMNS.get(key)
+    if columns is None:
+        columns = np.array(
+            [float(value) if value else np.nan for value in (getattr(listing, field) for field in _CMA_FIELDS)],
+            dtype=np.float64,
+        )
+        columns.flags.writeable = False
+        _LISTING_COLUMNS[key] = columns
+        weakref.finalize(listing, _LISTING_COLUMNS.pop, key, None)
+    return columns
+
+
+@dataclass(frozen=True)
+class PropertyListingBatch:
+    """
+    Columnar collection of listings for vectorised CMAs.
+
+    ``columns`` is an ``(n, len(_CMA_FIELDS))`` float64 matrix of the numeric
+    CMA fields (NaN where missing) and ``zip_codes`` an object array of ZIP
+    codes; indexing the batch returns the original listing.
+    """
+    columns: np.ndarray
+    zip_codes: np.ndarray
+    listings: Tuple[PropertyListing, ...]
+
+    @classmethod
+    def from_listings(cls, listings: Sequence[PropertyListing]) -> "PropertyListingBatch":
+        """Build a batch from listings, reusing their cached column rows."""
+        listings = tuple(listings)
+        if listings:
+            columns = np.vstack([_listing_columns(listing) for listing in listings])
+        else:
+            columns = np.empty((0, len(_CMA_FIELDS)))
+        zip_codes = np.empty(len(listings), dtype=object)
+        zip_codes[:] = [listing.zipCode for listing in listings]
+        return cls(columns=columns, zip_codes=zip_codes, listings=listings)
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def __getitem__(self, index: int) -> PropertyListing:
+        return self.listings[index]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self.columns[:, _PRICE]
+
+    @property
+    def square_footage(self) -> np.ndarray:
+        return self.columns[:, _SQFT]
+
 
 class ComparativeMarketAnalysis:
     """Comparative Market Analysis (CMA) engine for property valuation."""
@@ -23,35 +107,41 @@ class ComparativeMarketAnalysis:
                      comparable_properties: List[PropertyListing],
                      market_data: Optional[List[MarketDataPoint]] = None) -> Dict[str, Any]:
         """Generate comprehensive CMA report."""
+        return self.generate_cma_batch(
+            subject_property, PropertyListingBatch.from_listings(comparable_properties), market_data
+        )
+
+    def generate_cma_batch(self, subject_property: PropertyListing,
+                           comparables: PropertyListingBatch,
+                           market_data: Optional[List[MarketDataPoint]] = None) -> Dict[str, Any]:
+        """Generate a CMA report against a columnar batch of comparables."""
         try:
-            if not comparable_properties:
+            if not len(comparables):
                 raise ValueError("No comparable properties provided for CMA generation.")
 
-            # Calculate adjustments for each comparable
-            adjusted_comps = []
-            for comp in comparable_properties:
-                adjustments = self._calculate_adjustments(subject_property, comp)
-                adjusted_price = comp.price + sum(adjustments.values())
+            subject_columns = _listing_columns(subject_property)
 
-                adjusted_comps.append({
-                    "property": comp,
-                    "original_price": comp.price,
-                    "adjustments": adjustments,
-                    "adjusted_price": adjusted_price,
-                    "price_per_sqft": adjusted_price / comp.squareFootage if comp.squareFootage and comp.squareFootage > 0 else 0
-                })
+            # Calculate adjustments for all comparables at once
+            adjustments = self._calculate_adjustments(subject_columns, comparables.columns)
+            adjusted_prices = comparables.prices + np.nansum(adjustments, axis=1)
+            sqft = comparables.square_footage
+            with np.errstate(invalid="ignore"):
+                price_per_sqft = np.where(sqft > 0, adjusted_prices / sqft, 0.0)
+
+            adjusted_comps = self._build_adjusted_comps(
+                subject_property, comparables, adjustments, adjusted_prices, price_per_sqft
+            )
 
             # Calculate estimated value range
-            adjusted_prices = [comp["adjusted_price"] for comp in adjusted_comps]
-            estimated_value = sum(adjusted_prices) / len(adjusted_prices)
+            estimated_value = float(adjusted_prices.mean())
             value_range = {
-                "low": min(adjusted_prices),
-                "high": max(adjusted_prices),
+                "low": float(adjusted_prices.min()),
+                "high": float(adjusted_prices.max()),
                 "average": estimated_value
             }
 
             # Market position analysis
-            market_position = self._analyze_market_position(subject_property, adjusted_comps, market_data)
+            market_position = self._analyze_market_position(subject_property, price_per_sqft, market_data)
             
             # Suggested listing price
             suggested_price = self.suggest_listing_price(estimated_value, market_position)
@@ -63,7 +153,7 @@ class ComparativeMarketAnalysis:
                 "value_range": value_range,
                 "market_position": market_position,
                 "suggested_listing_price": suggested_price,
-                "confidence_score": self._calculate_confidence_score(adjusted_comps),
+                "confidence_score": round(self._calculate_confidence_score(adjusted_prices), 2),
                 "analysis_date": datetime.utcnow().isoformat()
             }
 
@@ -71,45 +161,57 @@ class ComparativeMarketAnalysis:
             self.logger.error(f"CMA generation failed: {e}")
             raise
 
-    def _calculate_adjustments(self, subject: PropertyListing, comparable: PropertyListing) -> Dict[str, float]:
-        """Calculate price adjustments between subject and comparable properties."""
-        adjustments = {}
-
-        # Square footage adjustment
-        if subject.squareFootage and comparable.squareFootage and comparable.price and comparable.squareFootage > 0:
-            sqft_diff = subject.squareFootage - comparable.squareFootage
-            price_per_sqft = comparable.price / comparable.squareFootage
-            adjustments["squareFootage"] = sqft_diff * price_per_sqft * 0.8  # 80% adjustment factor
-
-        # Bedroom adjustment
-        if subject.bedrooms and comparable.bedrooms:
-            bedroom_diff = subject.bedrooms - comparable.bedrooms
-            adjustments["bedrooms"] = bedroom_diff * 15000  # $15k per bedroom
+    @staticmethod
+    def _calculate_adjustments(subject: np.ndarray, comparables: np.ndarray) -> np.ndarray:
+        """
+        Calculate price adjustments between the subject and every comparable.
 
-        # Bathroom adjustment
-        if subject.bathrooms and comparable.bathrooms:
-            bathroom_diff = subject.bathrooms - comparable.bathrooms
-            adjustments["bathrooms"] = bathroom_diff * 10000  # $10k per bathroom
-
-        # Age adjustment
-        if subject.yearBuilt and comparable.yearBuilt:
-            age_diff = comparable.yearBuilt - subject.yearBuilt  # Newer is better
-            adjustments["age"] = age_diff * 1000  # $1k per year
+        ``subject`` is one row and ``comparables`` an ``(n, len(_CMA_FIELDS))``
+        matrix of listing columns. Returns an ``(n, len(_ADJUSTMENT_NAMES))``
+        matrix computed in a single broadcast, with NaN wherever either side
+        lacks the field.
+        """
+        weights = np.empty((comparables.shape[0], len(_ADJUSTMENT_NAMES)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 80% adjustment factor on the comparable's price per square foot
+            weights[:, 0] = comparables[:, _PRICE] / comparables[:, _SQFT] * 0.8
+        weights[:, 1:] = _ADJUSTMENT_UNIT_VALUES
+        return (subject[_ADJUSTED_FIELDS] - comparables[:, _ADJUSTED_FIELDS]) * weights
 
+    def _build_adjusted_comps(self, subject: PropertyListing, comparables: PropertyListingBatch,
+                              adjustments: np.ndarray, adjusted_prices: np.ndarray,
+                              price_per_sqft: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialise the per-comparable report entries from the adjustment matrix."""
+        adjustment_rows = dict(zip(_ADJUSTMENT_NAMES, adjustments.T.tolist()))
+        adjusted_list = adjusted_prices.tolist()
+        price_per_sqft_list = price_per_sqft.tolist()
         # Location adjustment (simplified)
-        if hasattr(subject, 'zipCode') and hasattr(comparable, 'zipCode') and subject.zipCode != comparable.zipCode:
-            adjustments["location"] = 0  # Would need market data for proper adjustment
+        other_location = (comparables.zip_codes != subject.zipCode).tolist()
+
+        adjusted_comps = []
+        for i, comp in enumerate(comparables.listings):
+            comp_adjustments = {
+                name: values[i] for name, values in adjustment_rows.items() if not np.isnan(values[i])
+            }
+            if other_location[i]:
+                comp_adjustments["location"] = 0  # Would need market data for proper adjustment
 
-        return adjustments
+            adjusted_comps.append({
+                "property": comp,
+                "original_price": comp.price,
+                "adjustments": comp_adjustments,
+                "adjusted_price": adjusted_list[i],
+                "price_per_sqft": price_per_sqft_list[i]
+            })
+        return adjusted_comps
 
-    def _analyze_market_position(self, subject: PropertyListing, comps: List[Dict],
+    def _analyze_market_position(self, subject: PropertyListing, comp_price_per_sqft: np.ndarray,
                                market_data: Optional[List[MarketDataPoint]]) -> Dict[str, Any]:
         """Analyze subject property's position in the market."""
-        if not comps:
+        if not comp_price_per_sqft.size:
             return {}
-            
-        avg_price = sum(comp["adjusted_price"] for comp in comps) / len(comps)
-        avg_price_per_sqft = sum(comp["price_per_sqft"] for comp in comps if comp["price_per_sqft"] > 0) / len(comps) if len(comps) > 0 else 0
+
+        avg_price_per_sqft = float(comp_price_per_sqft[comp_price_per_sqft > 0].sum()) / comp_price_per_sqft.size
 
         position = {
             "relative_to_comps": "average",
@@ -118,7 +220,7 @@ class ComparativeMarketAnalysis:
         }
 
         # Determine relative position
-        subject_price_per_sqft = subject.price / subject.squareFootage if subject.squareFootage and subject.squareFootage > 0 else 0
+        subject_price_per_sqft = float(subject.price) / subject.squareFootage if subject.squareFootage and subject.squareFootage > 0 else 0
         if avg_price_per_sqft > 0:
             if subject_price_per_sqft > avg_price_per_sqft * 1.1:
                 position["relative_to_comps"] = "above_market"
@@ -140,20 +242,17 @@ class ComparativeMarketAnalysis:
         else:
             return round(estimated_value, -2) # Round to nearest 100
 
-    def _calculate_confidence_score(self, comps: List[Dict]) -> float:
+    def _calculate_confidence_score(self, adjusted_prices: np.ndarray) -> float:
         """Calculate confidence score for the CMA."""
-        if not comps or len(comps) < 3:
+        if adjusted_prices.size < 3:
             return 0.6  # Lower confidence with fewer comps
 
-        # Calculate price variance
-        prices = [comp["adjusted_price"] for comp in comps]
-        avg_price = sum(prices) / len(prices)
+        # Coefficient of variation of the adjusted prices
+        avg_price = adjusted_prices.mean()
         if avg_price == 0:
             return 0.5
-            
-        variance = sum((p - avg_price) ** 2 for p in prices) / len(prices)
-        cv = (variance ** 0.5) / avg_price if avg_price > 0 else 1
+        cv = adjusted_prices.std() / avg_price if avg_price > 0 else 1
 
         # Higher variance = lower confidence
         confidence = max(0.5, 1 - cv)
-        return round(confidence, 2)
\ No newline at end of file
+        return float(confidence)
\ No newline at end of file
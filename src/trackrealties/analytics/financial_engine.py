@@ -14,7 +14,7 @@ from ..models.financial import InvestmentParams, ROIProjection, CashFlowAnalysis
 from ..models.market import MarketDataPoint
 from ..models.property import PropertyListing
 from ..core.config import get_settings
-from .financial_metrics import FinancialCalculator
+from .financial_metrics import FinancialCalculator, round_floats
 from .market_intelligence import MarketIntelligenceEngine, MarketTrend
 from .cma_engine import ComparativeMarketAnalysis
 
@@ -87,7 +87,7 @@ class FinancialAnalyticsEngine:
                 cash_on_cash_return=cash_on_cash_return,
                 irr=irr,
                 five_year_roi=(projections[4]['total_return'] / total_investment) * 100,
-                projections=projections
+                projections=round_floats(projections)
             )
             
         except Exception as e:
@@ -256,12 +256,12 @@ class FinancialAnalyticsEngine:
             
             projections.append({
                 'year': year,
-                'property_value': round(current_property_value, 2),
-                'noi': round(current_noi, 2),
-                'cash_flow': round(annual_cash_flow, 2),
-                'equity': round(current_equity, 2),
-                'total_return': round(total_return, 2),
-                'remaining_loan': round(remaining_loan, 2)
+                'property_value': current_property_value,
+                'noi': current_noi,
+                'cash_flow': annual_cash_flow,
+                'equity': current_equity,
+                'total_return': total_return,
+                'remaining_loan': remaining_loan
             })
         
         return projections
\ No newline at end of file
@@ -9,10 +9,31 @@ import logging
 from typing import List, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ._irr_numba import irr_newton
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def round_floats(value: Any, ndigits: int = 2) -> Any:
+    """
+    Round every float in a (possibly nested) dict/list result for presentation.
+
+    Calculations keep full precision internally; this is applied once where a
+    report leaves the analytics layer.
+    """
+    if isinstance(value, float):
+        return round(value, ndigits)
+    if isinstance(value, dict):
+        return {key: round_floats(item, ndigits) for key, item in value.items()}
+    if isinstance(value, list):
+        return [round_floats(item, ndigits) for item in value]
+    return value
+
+
+@dataclass(slots=True, frozen=True)
 class FinancialMetrics:
     """Container for financial analysis results."""
     roi: float
@@ -45,38 +66,109 @@ class FinancialCalculator:
         
         return payment
     
+    @staticmethod
+    def calculate_mortgage_payment_batch(
+        loan_amounts: ArrayLike, annual_rates: ArrayLike, term_years: ArrayLike
+    ) -> np.ndarray:
+        """
+        Calculate monthly mortgage payments for many loan scenarios at once.
+
+        Arguments are broadcast against each other, so any of them may be a
+        scalar. Scenarios with a non-positive loan amount or term pay 0.0,
+        matching :meth:`calculate_mortgage_payment`.
+        """
+        loans = np.asarray(loan_amounts, dtype=np.float64)
+        monthly_rates = np.asarray(annual_rates, dtype=np.float64) / 1200
+        num_payments = np.asarray(term_years, dtype=np.float64) * 12
+        loans, monthly_rates, num_payments = np.broadcast_arrays(loans, monthly_rates, num_payments)
+
+        valid = (loans > 0) & (num_payments > 0)
+        interest_free = monthly_rates == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.power(1 + monthly_rates, num_payments)
+            amortized = loans * monthly_rates * factor / (factor - 1)
+            payments = np.where(interest_free, loans / num_payments, amortized)
+        return np.where(valid, payments, 0.0)
+
+    # Above this many cash flows the O(n^3) companion-matrix solve behind
+    # np.roots costs more than a handful of Newton-Raphson iterations.
+    IRR_ROOTS_MAX_CASH_FLOWS = 50
+
     @staticmethod
     def calculate_irr(cash_flows: List[float], max_iterations: int = 100) -> float:
-        """Calculate Internal Rate of Return using Newton-Raphson method."""
-        try:
-            # Initial guess
-            rate = 0.1
-            
+        """
+        Calculate Internal Rate of Return.
+
+        NPV is a polynomial in ``x = 1 / (1 + rate)``, so short cash-flow series
+        are solved directly with ``np.roots`` and the real positive root closest
+        to a zero rate is returned. Long series, or series with no such root,
+        use vectorised Newton-Raphson instead.
+        """
+        flows = np.asarray(cash_flows, dtype=np.float64)
+        if flows.size < 2:
+            return 0.0
+
+        if flows.size <= FinancialCalculator.IRR_ROOTS_MAX_CASH_FLOWS:
+            try:
+                roots = np.roots(flows[::-1])
+            except np.linalg.LinAlgError:
+                roots = np.empty(0)
+            candidates = roots.real[(np.abs(roots.imag) < 1e-9) & (roots.real > 0)]
+            if candidates.size:
+                best = candidates[np.argmin(np.abs(candidates - 1.0))]
+                return float(1.0 / best - 1.0)
+
+        return FinancialCalculator._newton_irr(flows, max_iterations)
+
+    @staticmethod
+    def _newton_irr(flows: np.ndarray, max_iterations: int = 100) -> float:
+        """
+        Newton-Raphson IRR.
+
+        Uses the compiled kernel from ``_irr_numba`` when Numba is installed,
+        otherwise computes NPV and its derivative as NumPy dot products.
+        """
+        if irr_newton is not None:
+            rate = irr_newton(np.ascontiguousarray(flows, dtype=np.float64), max_iterations)
+            return float(rate) if np.isfinite(rate) else 0.0
+
+        periods = np.arange(flows.size, dtype=np.float64)
+        weighted_flows = -periods * flows
+        rate = 0.1
+
+        with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
             for _ in range(max_iterations):
-                npv = sum(cf / (1 + rate) ** i for i, cf in enumerate(cash_flows))
-                npv_derivative = sum(-i * cf / (1 + rate) ** (i + 1) for i, cf in enumerate(cash_flows))
-                
+                discount = np.power(1.0 + rate, -periods)
+                npv = np.dot(flows, discount)
+                npv_derivative = np.dot(weighted_flows, discount) / (1.0 + rate)
+
+                if not np.isfinite(npv) or not np.isfinite(npv_derivative):
+                    return 0.0
                 if abs(npv_derivative) < 1e-10:
                     break
-                
+
                 new_rate = rate - npv / npv_derivative
-                
+
+                # A rate at or below -100% has no meaningful discount factor
+                if not np.isfinite(new_rate) or new_rate <= -1:
+                    return 0.0
                 if abs(new_rate - rate) < 1e-10:
                     break
-                
+
                 rate = new_rate
-            
-            return rate
-            
-        except (ZeroDivisionError, OverflowError):
-            return 0.0
+
+        return float(rate)
     
     @staticmethod
     def calculate_npv(initial_investment: float, cash_flows: List[float], discount_rate: float) -> float:
         """Calculate Net Present Value."""
         npv = -initial_investment
-        for i, cf in enumerate(cash_flows):
-            npv += cf / ((1 + discount_rate) ** (i + 1))
+        base = 1 + discount_rate
+        factor = 1.0
+        for cf in cash_flows:
+            # (1 + r) ** (i + 1), advanced by one multiply per period
+            factor *= base
+            npv += cf / factor
         return npv
     
     @staticmethod
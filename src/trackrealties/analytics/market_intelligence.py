@@ -6,18 +6,72 @@ for real estate market data analysis.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..models.market import MarketDataPoint
+from ._kernels import volatility
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Series cache entry: the list, its length when cached, the extracted
+# ``(prices, volumes, timestamps, dated)`` arrays and its computed trends keyed
+# by the start of the recent window
+_SeriesEntry = Tuple[List[MarketDataPoint], int, Tuple[np.ndarray, ...], Dict[int, "MarketTrend"]]
+
+
+def _float_or_nan(value: Any) -> float:
+    return float(value) if value is not None else np.nan
+
+
+def _to_arrays(market_data: List[MarketDataPoint]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract median prices, sales volumes and dates into float64 arrays.
+
+    Points are expected to be ``MarketDataPoint`` instances (or expose the
+    same attributes); fields are read directly rather than probed. Missing
+    values are NaN. Dates are POSIX timestamps rather than ``datetime64`` so
+    naive and timezone-aware datetimes can be mixed.
+    """
+    count = len(market_data)
+    prices = np.fromiter(
+        (_float_or_nan(d.median_price) for d in market_data), dtype=np.float64, count=count
+    )
+    volumes = np.fromiter(
+        (_float_or_nan(d.sales_volume) for d in market_data), dtype=np.float64, count=count
+    )
+    timestamps = np.fromiter(
+        (d.date.timestamp() if d.date else np.nan for d in market_data),
+        dtype=np.float64,
+        count=count,
+    )
+    return prices, volumes, timestamps
+
+
+def _chronological_order(timestamps: np.ndarray) -> np.ndarray:
+    """Indices of the dated points in date order (undated points are dropped)."""
+    # Market data usually arrives already in date order; a single comparison
+    # pass detects that and skips the sort
+    if not np.isnan(timestamps).any() and np.all(timestamps[:-1] <= timestamps[1:]):
+        return np.arange(len(timestamps))
+    order = np.argsort(timestamps, kind="stable")
+    return order[~np.isnan(timestamps[order])]
+
+
+def _percent_change(values: np.ndarray) -> float:
+    """Percent change from the first to the last value, 0 if undefined."""
+    if len(values) < 2 or values[0] == 0:
+        return 0.0
+    return float((values[-1] - values[0]) / values[0] * 100)
+
+
+@dataclass(frozen=True)
 class MarketTrend:
-    """Container for market trend analysis."""
+    """Container for market trend analysis. Instances are shared by the trend cache."""
     trend_direction: str  # 'up', 'down', 'stable'
     trend_strength: float  # 0-1 scale
     price_change_percent: float
@@ -25,43 +79,94 @@ class MarketTrend:
     forecast_confidence: float
 
 
+# Trend reported when there are fewer than two data points
+_EMPTY_TREND = MarketTrend(
+    trend_direction='stable',
+    trend_strength=0.0,
+    price_change_percent=0.0,
+    volume_change_percent=0.0,
+    forecast_confidence=0.0
+)
+
+
 class MarketIntelligenceEngine:
     """Market intelligence and trend analysis engine."""
 
+    # Number of market data series whose extracted arrays are kept per engine
+    SERIES_CACHE_SIZE = 32
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._series_cache: "OrderedDict[int, _SeriesEntry]" = OrderedDict()
+
+    def _series_entry(self, market_data: List[MarketDataPoint]) -> "_SeriesEntry":
+        """
+        Return the cache entry ``(market_data, length, arrays, trends)`` for a list.
+
+        Entries are keyed by list identity (the entry keeps the list alive so
+        its id cannot be reused) and revalidated by length. A list mutated in
+        place without changing length is not detected: callers that edit
+        points in place must pass a new list to get fresh results.
+        """
+        key = id(market_data)
+        entry = self._series_cache.get(key)
+        if entry is not None and entry[0] is market_data and entry[1] == len(market_data):
+            self._series_cache.move_to_end(key)
+            return entry
+
+        prices, volumes, timestamps = _to_arrays(market_data)
+        arrays = (prices, volumes, timestamps, _chronological_order(timestamps))
+        for array in arrays:
+            array.flags.writeable = False
+        entry = (market_data, len(market_data), arrays, {})
+        self._series_cache[key] = entry
+        if len(self._series_cache) > self.SERIES_CACHE_SIZE:
+            self._series_cache.popitem(last=False)
+        return entry
+
+    def _series_arrays(self, market_data: List[MarketDataPoint]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return ``(prices, volumes, timestamps, dated)`` for a market data list.
+
+        ``dated`` holds the indices of dated points in chronological order.
+        The arrays are cached as described in ``_series_entry``.
+        """
+        return self._series_entry(market_data)[2]
 
     def analyze_market_trends(self, market_data: List[MarketDataPoint],
                             timeframe_days: int = 90) -> MarketTrend:
         """Analyze market trends from historical data."""
         try:
             if len(market_data) < 2:
-                return MarketTrend(
-                    trend_direction='stable',
-                    trend_strength=0.0,
-                    price_change_percent=0.0,
-                    volume_change_percent=0.0,
-                    forecast_confidence=0.0
-                )
-
-            # Filter recent data
-            cutoff_date = datetime.now() - timedelta(days=timeframe_days)
-            recent_data = [d for d in market_data if hasattr(d, 'date') and d.date >= cutoff_date]
+                return _EMPTY_TREND
+
+            _, _, arrays, trends = self._series_entry(market_data)
+            prices, volumes, timestamps, dated = arrays
+
+            # Filter recent data: binary search for the cutoff on the date-sorted points
+            if dated.size:
+                cutoff = (datetime.now() - timedelta(days=timeframe_days)).timestamp()
+                start = int(np.searchsorted(timestamps[dated], cutoff))
+                if dated.size - start < 2:
+                    start = max(dated.size - 10, 0)
+                recent = dated[start:]
+            else:
+                start = -1
+                recent = np.arange(len(market_data))[-10:]
 
-            if len(recent_data) < 2:
-                recent_data = sorted(market_data, key=lambda x: x.date)[-10:] if hasattr(market_data[0], 'date') else market_data[-10:]
+            # The trend depends only on the window, so it is reused until the
+            # cutoff moves past another data point
+            trend = trends.get(start)
+            if trend is not None:
+                return trend
 
             # Calculate price trend
-            prices = [d.median_price for d in recent_data if hasattr(d, 'median_price')]
-            price_change = 0.0
-            if len(prices) >= 2:
-                price_change = (prices[-1] - prices[0]) / prices[0] * 100 if prices[0] != 0 else 0
+            recent_prices = prices[recent]
+            price_change = _percent_change(recent_prices[~np.isnan(recent_prices)])
 
             # Calculate volume trend
-            volumes = [d.sales_volume for d in recent_data if hasattr(d, 'sales_volume') and d.sales_volume]
-            volume_change = 0.0
-            if len(volumes) >= 2:
-                volume_change = (volumes[-1] - volumes[0]) / volumes[0] * 100 if volumes[0] != 0 else 0
+            recent_volumes = volumes[recent]
+            volume_change = _percent_change(recent_volumes[~np.isnan(recent_volumes) & (recent_volumes != 0)])
 
             # Determine trend direction and strength
             if abs(price_change) < 2:
@@ -75,16 +180,18 @@ class MarketIntelligenceEngine:
                 trend_strength = min(abs(price_change) / 10, 1.0)
 
             # Calculate forecast confidence
-            data_points = len(recent_data)
+            data_points = len(recent)
             confidence = min(data_points / 20, 1.0) * 0.8  # Max 80% confidence
 
-            return MarketTrend(
+            trend = MarketTrend(
                 trend_direction=trend_direction,
                 trend_strength=trend_strength,
                 price_change_percent=price_change,
                 volume_change_percent=volume_change,
                 forecast_confidence=confidence
             )
+            trends[start] = trend
+            return trend
 
         except Exception as e:
             self.logger.error(f"Market trend analysis failed: {e}")
@@ -95,19 +202,12 @@ class MarketIntelligenceEngine:
         if len(market_data) < 2:
             return 0.0
 
-        prices = [d.median_price for d in market_data if hasattr(d, 'median_price')]
+        prices, _, _, _ = self._series_arrays(market_data)
+        prices = prices[~np.isnan(prices)]
         if len(prices) < 2:
             return 0.0
             
-        returns = [(prices[i] / prices[i-1] - 1) for i in range(1, len(prices)) if prices[i-1] != 0]
-
-        if not returns:
-            return 0.0
-
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-
-        return variance ** 0.5
+        return float(volatility(np.ascontiguousarray(prices)))
 
     def forecast_property_value(self, current_value: float, market_data: List[MarketDataPoint],
                               forecast_months: int = 12) -> dict:
@@ -121,8 +221,9 @@ class MarketIntelligenceEngine:
                 }
 
             # Calculate historical appreciation rate
-            sorted_data = sorted(market_data, key=lambda x: x.date) if hasattr(market_data[0], 'date') else market_data
-            prices = [d.median_price for d in sorted_data if hasattr(d, 'median_price')]
+            prices, _, _, dated = self._series_arrays(market_data)
+            ordered_prices = prices[dated] if dated.size else prices
+            prices = ordered_prices[~np.isnan(ordered_prices)]
             if len(prices) < 2:
                 return {
                     "forecasted_value": current_value,
@@ -131,11 +232,15 @@ class MarketIntelligenceEngine:
                 }
 
             # Calculate monthly appreciation rate
-            first_date = sorted_data[0].date if hasattr(sorted_data[0], 'date') else datetime.now() - timedelta(days=len(sorted_data))
-            last_date = sorted_data[-1].date if hasattr(sorted_data[-1], 'date') else datetime.now()
+            if dated.size:
+                first_date = market_data[dated[0]].date
+                last_date = market_data[dated[-1]].date
+            else:
+                first_date = datetime.now() - timedelta(days=len(market_data))
+                last_date = datetime.now()
             months_diff = max(1, (last_date.year - first_date.year) * 12 + last_date.month - first_date.month)
 
-            total_appreciation = (prices[-1] / prices[0]) - 1 if prices[0] != 0 else 0
+            total_appreciation = float(prices[-1] / prices[0]) - 1 if prices[0] != 0 else 0
             monthly_appreciation_rate = ((1 + total_appreciation) ** (1 / months_diff)) - 1
 
             # Apply forecast
@@ -173,15 +278,16 @@ class MarketIntelligenceEngine:
         if not market_data:
             return {"summary": "No market data available to generate a summary."}
             
-        latest_data = sorted(market_data, key=lambda x: x.date, reverse=True)[0] if hasattr(market_data[0], 'date') else market_data[-1]
+        _, _, _, dated = self._series_arrays(market_data)
+        latest_data = market_data[dated[-1]] if dated.size else market_data[-1]
         trends = self.analyze_market_trends(market_data)
         
         summary = {
-            "location": latest_data.location if hasattr(latest_data, 'location') else "N/A",
-            "latest_date": latest_data.date.isoformat() if hasattr(latest_data, 'date') else "N/A",
-            "median_price": latest_data.median_price if hasattr(latest_data, 'median_price') else "N/A",
-            "inventory_count": latest_data.inventory_count if hasattr(latest_data, 'inventory_count') else "N/A",
-            "days_on_market": latest_data.days_on_market if hasattr(latest_data, 'days_on_market') else "N/A",
+            "location": latest_data.location or "N/A",
+            "latest_date": latest_data.date.isoformat() if latest_data.date else "N/A",
+            "median_price": latest_data.median_price,
+            "inventory_count": latest_data.inventory_count,
+            "days_on_market": latest_data.days_on_market,
             "trend_direction": trends.trend_direction,
             "price_change_percent": round(trends.price_change_percent, 2),
             "forecast_confidence": round(trends.forecast_confidence, 2)
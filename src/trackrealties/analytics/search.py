@@ -1,28 +1,62 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from enum import Enum
 
+import numpy as np
+
 from ..models.search import SearchResult
 
 logger = logging.getLogger(__name__)
 
 
 class InMemoryAnalyticsStore:
-    """Simple in-memory store for analytics data."""
+    """
+    Simple in-memory store for analytics data.
+
+    Only the most recent ``max_logs`` searches are kept. Response times and
+    strategies are also written to fixed-size circular NumPy buffers, with
+    strategy names interned to small integer codes, so per-strategy totals
+    are computed without walking the log dicts.
+    """
+
+    DEFAULT_MAX_LOGS = 100_000
 
-    def __init__(self) -> None:
-        self._search_logs: List[Dict[str, Any]] = []
+    def __init__(self, max_logs: int = DEFAULT_MAX_LOGS) -> None:
+        self._search_logs: Deque[Dict[str, Any]] = deque(maxlen=max_logs)
+        self._strategy_ids: Dict[str, int] = {}
+        self._strategy_codes = np.zeros(max_logs, dtype=np.int32)
+        self._response_times = np.zeros(max_logs, dtype=np.float64)
+        self._head = 0
+        self._size = 0
 
     async def log_search(self, data: Dict[str, Any]) -> None:
         self._search_logs.append(data)
+        code = self._strategy_ids.setdefault(data["strategy"], len(self._strategy_ids))
+        self._strategy_codes[self._head] = code
+        self._response_times[self._head] = data["response_time"]
+        self._head = (self._head + 1) % len(self._response_times)
+        self._size = min(self._size + 1, len(self._response_times))
 
     async def get_all_searches(self) -> List[Dict[str, Any]]:
         return list(self._search_logs)
 
+    async def get_strategy_totals(self) -> Dict[str, Tuple[int, float]]:
+        """Return ``(search count, total response time)`` per strategy in the retained logs."""
+        codes = self._strategy_codes[:self._size]
+        num_strategies = len(self._strategy_ids)
+        counts = np.bincount(codes, minlength=num_strategies)
+        time_sums = np.bincount(codes, weights=self._response_times[:self._size], minlength=num_strategies)
+        return {
+            strategy: (int(counts[code]), float(time_sums[code]))
+            for strategy, code in self._strategy_ids.items()
+            if counts[code]
+        }
+
 
 class SearchAnalytics:
     """Monitors and analyzes search performance."""
@@ -53,24 +87,20 @@ class SearchAnalytics:
 
     async def generate_performance_report(self) -> Dict[str, Any]:
         """Generate search performance analytics report."""
+        failure_analysis = await self._analyze_failed_searches()
         return {
             "strategy_performance": await self._analyze_strategy_performance(),
             "query_patterns": await self._analyze_query_patterns(),
-            "failure_analysis": await self._analyze_failed_searches(),
-            "recommendations": await self._generate_optimization_recommendations(),
+            "failure_analysis": failure_analysis,
+            "recommendations": await self._generate_optimization_recommendations(failure_analysis),
         }
 
     async def _analyze_strategy_performance(self) -> Dict[str, Any]:
-        searches = await self.analytics_store.get_all_searches()
-        performance: Dict[str, Dict[str, Any]] = {}
-        for entry in searches:
-            strategy = entry["strategy"]
-            perf = performance.setdefault(strategy, {"count": 0, "avg_response_time": 0.0})
-            perf["count"] += 1
-        for strategy, perf in performance.items():
-            times = [s["response_time"] for s in searches if s["strategy"] == strategy]
-            perf["avg_response_time"] = sum(times) / len(times) if times else 0.0
-        return performance
+        totals = await self.analytics_store.get_strategy_totals()
+        return {
+            strategy: {"count": count, "avg_response_time": time_sum / count}
+            for strategy, (count, time_sum) in totals.items()
+        }
 
     async def _analyze_query_patterns(self) -> Dict[str, Any]:
         searches = await self.analytics_store.get_all_searches()
@@ -82,14 +112,23 @@ class SearchAnalytics:
 
     async def _analyze_failed_searches(self) -> Dict[str, Any]:
         searches = await self.analytics_store.get_all_searches()
-        failures = [s for s in searches if not s["has_results"]]
+        # Only the last five failed queries are reported, so keep just those
+        failed_queries: Deque[str] = deque(maxlen=5)
+        failed_count = 0
+        for entry in searches:
+            if not entry["has_results"]:
+                failed_count += 1
+                failed_queries.append(entry["query"])
         return {
-            "failed_count": len(failures),
-            "failed_queries": [f["query"] for f in failures][-5:],
+            "failed_count": failed_count,
+            "failed_queries": list(failed_queries),
         }
 
-    async def _generate_optimization_recommendations(self) -> Dict[str, Any]:
-        failures = await self._analyze_failed_searches()
+    async def _generate_optimization_recommendations(
+        self, failures: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        if failures is None:
+            failures = await self._analyze_failed_searches()
         if failures["failed_count"] > 0:
             return {
                 "message": "Review failed queries for potential data gaps and tune search thresholds."
@@ -6,14 +6,22 @@ from typing import AsyncGenerator, Optional
 from uuid import UUID
 
 from asyncpg import Connection
-from fastapi import Depends, HTTPException, Header
+from fastapi import Depends, HTTPException, Header, Request
 from starlette import status
 
+from ..core.config import settings
 from ..core.database import db_pool
 from ..analytics.cma_engine import ComparativeMarketAnalysis
 from ..data.repository import SessionRepository
+from ..data.session_cache import SessionCache
 from ..models.session import ChatSession
 
+# Sessions resolved by get_current_session, shared across requests
+session_cache = SessionCache(
+    max_entries=settings.SESSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SESSION_CACHE_TTL_SECONDS,
+)
+
 
 async def get_db_connection() -> AsyncGenerator[Connection, None]:
     """
@@ -22,20 +30,22 @@ async def get_db_connection() -> AsyncGenerator[Connection, None]:
     async with db_pool.acquire() as connection:
         yield connection
 
-def get_cma_engine(
-    db: Connection = Depends(get_db_connection)
-) -> ComparativeMarketAnalysis:
+def get_cma_engine() -> ComparativeMarketAnalysis:
     """
     Dependency to get a CMA engine instance.
     """
-    return ComparativeMarketAnalysis(db)
+    return ComparativeMarketAnalysis()
 
 async def get_current_session(
+    request: Request,
     session_id: Optional[str] = Header(None, alias="X-Session-ID"),
     db: Connection = Depends(get_db_connection)
 ) -> ChatSession:
     """
     Dependency to get the current user session from the request headers.
+
+    Uses the UUID parsed by ``SessionMiddleware`` when it is installed, and
+    serves recently seen sessions from ``session_cache``.
     """
     if not session_id:
         raise HTTPException(
@@ -43,16 +53,17 @@ async def get_current_session(
             detail="Session ID not provided in X-Session-ID header",
         )
     
-    try:
-        session_uuid = UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid session ID format.",
-        )
+    session_uuid = getattr(request.state, "session_uuid", None)
+    if session_uuid is None:
+        try:
+            session_uuid = UUID(session_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid session ID format.",
+            )
 
-    repo = SessionRepository(db)
-    session = await repo.get_session(session_uuid)
+    session = await session_cache.get_or_load(session_uuid, SessionRepository(db).get_session)
     
     if not session:
         raise HTTPException(
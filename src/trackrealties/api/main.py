@@ -2,28 +2,51 @@
 Main FastAPI application file.
 """
 
+import asyncio
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 from ..core.config import settings
 from ..core.database import db_pool, test_connection
 from ..core.graph import graph_manager
-from .routes import rag
+from ..agents.orchestrator import prewarm_agents
+from .middleware import SessionMiddleware
+from rag_pipeline_integration import EnhancedRAGPipeline
 
-# Configure logging
+# Configure logging. Records are handed to a queue and written to the file
+# and console by a listener thread, so log I/O never blocks the event loop.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler("app.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
 logging.basicConfig(
     level=settings.LOG_LEVEL.upper(),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+async def _warm_up_rag_pipeline(rag_pipeline: EnhancedRAGPipeline):
+    """
+    Exercise the embedding client and both search backends once.
+
+    Goes through the hybrid search directly rather than the routed search so
+    the warm-up query isn't recorded in search analytics. Failures are
+    logged, not raised.
+    """
+    try:
+        await asyncio.wait_for(rag_pipeline.hybrid_search.search("warmup", limit=1), timeout=10.0)
+        logger.info("RAG pipeline warm-up complete.")
+    except Exception as e:
+        logger.warning(f"RAG pipeline warm-up failed: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for the FastAPI app."""
+    _log_listener.start()
     logger.info("Starting up TrackRealties AI API...")
     try:
         await db_pool.initialize()
@@ -36,12 +59,22 @@ async def lifespan(app: FastAPI):
         if not graph_ok:
             logger.error("Graph database connection failed on startup.")
 
-        # Initialize the RAG pipeline
-        await rag.pipeline.initialize()
+        # Initialize the RAG pipeline once; routes read it from app.state
+        rag_pipeline = EnhancedRAGPipeline()
+        await rag_pipeline.initialize()
+        app.state.rag_pipeline = rag_pipeline
+        if settings.RAG_WARMUP:
+            await _warm_up_rag_pipeline(rag_pipeline)
+
+        # Build the pooled agents now so the first chat request doesn't pay
+        # for agent and tool construction. Runs synchronously before the app
+        # serves requests; prewarm_agents logs per-role failures itself.
+        prewarm_agents()
 
         logger.info("TrackRealties AI API startup complete.")
     except Exception as e:
         logger.error(f"Startup failed: {e}")
+        _log_listener.stop()
         raise
     
     yield
@@ -50,6 +83,7 @@ async def lifespan(app: FastAPI):
     await db_pool.close()
     await graph_manager.close()
     logger.info("Connections closed.")
+    _log_listener.stop()
 
 app = FastAPI(
     title="TrackRealties AI",
@@ -58,6 +92,8 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+app.add_middleware(SessionMiddleware)
+
 # Placeholder for root endpoint
 @app.get("/")
 async def root():
@@ -4,7 +4,9 @@ Custom middleware for the FastAPI application.
 
 import logging
 import time
-from typing import Callable
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+from uuid import UUID
 from datetime import datetime, timedelta
 import json
 
@@ -12,36 +14,39 @@ from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 import redis
+import redis.asyncio as aioredis
 
 from ..core.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Length of a rate limit window; counters outlive their window slightly so a
+# request at the boundary never reads an expired key
+RATE_LIMIT_WINDOW_SECONDS = 60
+_RATE_LIMIT_KEY_TTL_SECONDS = RATE_LIMIT_WINDOW_SECONDS + 5
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests and responses."""
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Log request
+        # Log request; %-style arguments are only formatted if the record is emitted
         logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
+            "Request: %s %s from %s",
+            request.method, request.url.path, request.client.host if request.client else 'unknown'
         )
         
         # Process request
         response = await call_next(request)
         
         # Calculate processing time
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         
         # Log response
-        logger.info(
-            f"Response: {response.status_code} "
-            f"processed in {process_time:.3f}s"
-        )
+        logger.info("Response: %s processed in %.3fs", response.status_code, process_time)
         
         # Add processing time header
         response.headers["X-Process-Time"] = str(process_time)
@@ -50,17 +55,37 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware for rate limiting API requests."""
+    """
+    Middleware for rate limiting API requests.
+
+    Each worker keeps a token bucket per client (capacity and refill rate
+    both ``requests_per_minute`` per minute) so well-behaved clients are
+    admitted without a Redis round-trip. Locally admitted requests are
+    reported to the shared Redis counter every ``REDIS_SYNC_EVERY`` requests,
+    and whenever the bucket runs dry. Once Redis reports the shared window
+    full, the bucket is drained and every request from that client is checked
+    against Redis until the window rolls over, so the limit still holds
+    across workers.
+    """
+
+    # Locally admitted requests per client between Redis reconciliations
+    REDIS_SYNC_EVERY = 10
+    # Number of client buckets kept per worker (least recently used evicted)
+    LOCAL_BUCKETS_MAX = 10_000
     
     def __init__(self, app, requests_per_minute: int = 60):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.redis_client = None
+        # client_id -> [tokens, last refill time, requests not yet sent to Redis,
+        # window in which Redis refused the client]. Only touched between
+        # awaits on the event loop, so no lock is needed.
+        self._local_buckets: "OrderedDict[str, List[float]]" = OrderedDict()
         
         # Initialize Redis if available
         try:
             if settings.redis_url:
-                self.redis_client = redis.from_url(settings.redis_url)
+                self.redis_client = aioredis.from_url(settings.redis_url)
         except Exception as e:
             logger.warning(f"Redis not available for rate limiting: {e}")
     
@@ -102,25 +127,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # If Redis not available, allow all requests
             return True
         
+        window = int(time.time()) // RATE_LIMIT_WINDOW_SECONDS
+        allowed_locally, unsynced = self._take_local_token(client_id, window)
+        if allowed_locally and unsynced < self.REDIS_SYNC_EVERY:
+            return True
+
         try:
-            current_time = int(time.time())
-            window_start = current_time - 60  # 1 minute window
-            
-            # Use Redis sorted set to track requests
-            key = f"rate_limit:{client_id}"
-            
-            # Remove old entries
-            # Use a pipeline for atomic operations
-            pipe = self.redis_client.pipeline()
-            pipe.zremrangebyscore(key, 0, window_start)
-            pipe.zadd(key, {str(current_time): current_time})
-            pipe.expire(key, 60)
-            pipe.zcard(key)
-            results = await pipe.execute()
-
-            current_requests = results[-1]
-            
-            return current_requests <= self.requests_per_minute
+            # A request the local bucket refused is still counted, so Redis
+            # decides on the shared total including it
+            pending = unsynced if allowed_locally else unsynced + 1
+            current_requests = await self._add_to_window(client_id, window, pending)
+            if current_requests <= self.requests_per_minute:
+                return True
+
+            # The shared window is full: stop admitting this client locally
+            # until it rolls over, or other workers' requests go uncounted
+            bucket = self._local_buckets.get(client_id)
+            if bucket is not None:
+                bucket[0] = 0.0
+                bucket[3] = window
+            return False
             
         except redis.exceptions.ConnectionError as e:
             logger.warning(f"Could not connect to Redis for rate limiting: {e}")
@@ -130,6 +156,66 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             logger.error(f"An unexpected error occurred during rate limiting check: {e}")
             return True # Allow request on other unexpected errors
 
+    def _take_local_token(self, client_id: str, window: int) -> Tuple[bool, int]:
+        """
+        Refill and draw from the client's local bucket.
+
+        Returns whether a token was available and how many admitted requests
+        are due to be reported to Redis; when that count is returned for a
+        sync, the bucket's unsynced counter is reset. No token is available
+        in a ``window`` Redis has already refused the client in.
+        """
+        now = time.monotonic()
+        bucket = self._local_buckets.get(client_id)
+        if bucket is None:
+            bucket = [float(self.requests_per_minute), now, 0, -1]
+            self._local_buckets[client_id] = bucket
+            if len(self._local_buckets) > self.LOCAL_BUCKETS_MAX:
+                self._local_buckets.popitem(last=False)
+        else:
+            self._local_buckets.move_to_end(client_id)
+            refill = (now - bucket[1]) * self.requests_per_minute / RATE_LIMIT_WINDOW_SECONDS
+            bucket[0] = min(float(self.requests_per_minute), bucket[0] + refill)
+            bucket[1] = now
+
+        allowed = bucket[0] >= 1 and bucket[3] != window
+        if allowed:
+            bucket[0] -= 1
+            bucket[2] += 1
+        unsynced = int(bucket[2])
+        if not allowed or unsynced >= self.REDIS_SYNC_EVERY:
+            bucket[2] = 0
+        return allowed, unsynced
+
+    async def _add_to_window(self, client_id: str, window: int, requests: int) -> int:
+        """Add requests to the client's shared fixed-window counter and return its total."""
+        # Fixed-window counter: one integer per client per window, with
+        # INCRBY and EXPIRE sent together in a single round-trip
+        key = f"rate_limit:{client_id}:{window}"
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.incrby(key, requests)
+        pipe.expire(key, _RATE_LIMIT_KEY_TTL_SECONDS)
+        current_requests, _ = await pipe.execute()
+        return current_requests
+
+
+class SessionMiddleware(BaseHTTPMiddleware):
+    """Middleware that parses the X-Session-ID header once per request."""
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # request.state.session_uuid is None when the header is missing or
+        # malformed; get_current_session reports those cases
+        session_uuid = None
+        session_id = request.headers.get("x-session-id")
+        if session_id:
+            try:
+                session_uuid = UUID(session_id)
+            except ValueError:
+                pass
+        request.state.session_uuid = session_uuid
+        
+        return await call_next(request)
+
 
 class ErrorHandlingMiddleware(BaseHTTPMiddleware):
     """Middleware for centralized error handling."""
@@ -8,8 +8,10 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from asyncpg import Connection
+from pydantic import TypeAdapter
 from sqlalchemy import text
 
+from ...core.database import register_prepared_statement
 from ...models.property import PropertyListing
 from ...analytics.cma_engine import ComparativeMarketAnalysis
 from ..dependencies import get_cma_engine, get_db_connection
@@ -18,6 +20,41 @@ from ...analytics.search import search_analytics
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Listing columns used for a CMA, aliased to PropertyListing field names
+_CMA_LISTING_COLUMNS = """
+    id::text AS "id", formatted_address AS "formattedAddress", city, state,
+    zip_code AS "zipCode", property_type AS "propertyType", bedrooms, bathrooms,
+    square_footage AS "squareFootage", year_built AS "yearBuilt", status, price, source
+"""
+
+# Subject property and its comparables in one round-trip; the subject row is
+# flagged with is_subject. Prepared once per pooled connection.
+_CMA_LISTINGS_QUERY = f"""
+    WITH subject AS (
+        SELECT {_CMA_LISTING_COLUMNS} FROM property_listings WHERE id = $1
+    )
+    SELECT TRUE AS is_subject, * FROM subject
+    UNION ALL
+    (
+        SELECT FALSE AS is_subject, {_CMA_LISTING_COLUMNS}
+        FROM property_listings
+        WHERE id != $1 AND EXISTS (SELECT 1 FROM subject)
+        LIMIT 5
+    )
+"""
+_CMA_LISTINGS = register_prepared_statement("cma_listings", _CMA_LISTINGS_QUERY)
+
+
+# Validates a whole result set in one pydantic-core call
+_LISTINGS_ADAPTER = TypeAdapter(List[PropertyListing])
+
+
+def _listing_fields(record) -> dict:
+    """PropertyListing keyword arguments from a CMA listings row."""
+    fields = dict(record)
+    del fields["is_subject"]
+    return fields
+
 
 @router.get("/cma/{property_id}", summary="Generate Comparative Market Analysis")
 async def generate_cma_endpoint(
@@ -29,32 +66,29 @@ async def generate_cma_endpoint(
     """
     Generate a Comparative Market Analysis (CMA) for a given property.
     """
-    # Note: This is a simplified example. A real implementation would need a more robust
-    # way to fetch and interact with data using asyncpg. The `db.get` and `db.execute`
-    # methods used here are illustrative and assume an SQLAlchemy-like async interface
-    # that doesn't exist by default with asyncpg.
-    
-    # Placeholder for fetching the subject property
-    subject_property_record = await db.fetchrow(
-        "SELECT * FROM property_listings WHERE id = $1", property_id
-    )
-    if not subject_property_record:
+    # Fetch the subject property and placeholder comparables together
+    # (radius filtering is not implemented yet)
+    statement = await db.prepared(_CMA_LISTINGS)
+    records = await statement.fetch(property_id)
+    listings = _LISTINGS_ADAPTER.validate_python([_listing_fields(rec) for rec in records])
+    subject_property = None
+    comparable_properties = []
+    for rec, listing in zip(records, listings):
+        if rec["is_subject"]:
+            subject_property = listing
+        else:
+            comparable_properties.append(listing)
+
+    if not subject_property:
         raise HTTPException(status_code=404, detail="Property not found")
-    subject_property = PropertyListing(**dict(subject_property_record))
 
-    # Placeholder for fetching comparable properties
-    query = "SELECT * FROM property_listings WHERE id != $1 LIMIT 5"
-    comparable_properties_records = await db.fetch(query, property_id)
-    
-    if not comparable_properties_records:
+    if not comparable_properties:
         raise HTTPException(
             status_code=404, detail="No comparable properties found within the specified radius"
         )
-        
-    comparable_properties = [PropertyListing(**dict(rec)) for rec in comparable_properties_records]
 
     try:
-        cma_report = await cma_engine.generate_cma(
+        cma_report = cma_engine.generate_cma(
             subject_property=subject_property,
             comparable_properties=comparable_properties,
         )
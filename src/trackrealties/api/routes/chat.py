@@ -1,23 +1,37 @@
 """
 API route for chat interactions.
 """
-import json
 import logging
+from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from asyncpg import Connection
 
-from ...models.api import ChatRequest, ChatResponse, ToolCall, StreamDelta
+from ...models.api import ChatRequest, ChatResponse
 from ...models.db import MessageRole
-from ...data.repository import MessageRepository
+from ...data.repository import MessageRepository, SessionRepository
 from ...agents.orchestrator import run_agent_turn, stream_agent_turn
-from ..dependencies import get_db_connection
+from ..dependencies import get_db_connection, session_cache
 from ...core.database import db_pool
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_SSE_FRAME = b"data: %s\n\n"
+
+
+def _sse_event(event_type: str, content: Any) -> bytes:
+    """Encode a ``StreamDelta``-shaped payload as a server-sent event frame."""
+    return _SSE_FRAME % orjson.dumps({"type": event_type, "content": content})
+
+
+_SSE_END = _sse_event("end", None)
+_SSE_INTERNAL_ERROR = _sse_event("error", {"error": "An internal error occurred."})
+
 @router.post("/", response_model=ChatResponse)
 async def chat(
     request: ChatRequest,
@@ -46,12 +60,17 @@ async def chat(
             metadata={"tools_used": agent_response.tools_used}
         )
 
-        return ChatResponse(
+        # Validate once while building the model (tool dicts are coerced to
+        # ToolCall in pydantic-core) and serialize it directly; returning a
+        # Response skips FastAPI's dump-and-revalidate of response_model,
+        # which is kept for the OpenAPI schema.
+        response = ChatResponse(
             message=agent_response.content,
             session_id=str(session_id),
             assistant_message_id=str(assistant_message.id),
-            tools_used=[ToolCall(**tool) for tool in agent_response.tools_used]
+            tools_used=agent_response.tools_used
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
 
     except ValueError as e:
         logger.warning(f"Value error in chat endpoint: {e}")
@@ -69,47 +88,63 @@ async def chat_stream(
     async def generate_stream():
         session_id = None
         conn = None
+        # The user and assistant messages are written in one INSERT at the end
+        user_message = None
+        messages_logged = False
         try:
             session_id = UUID(request.session_id)
             conn = await db_pool.pool.acquire()
-            msg_repo = MessageRepository(conn)
 
             # 1. Yield session ID
-            yield f"data: {json.dumps(StreamDelta(type='session', content={'session_id': str(session_id)}).dict())}\n\n"
+            yield _sse_event("session", {"session_id": str(session_id)})
 
-            # 2. Log user message
-            await msg_repo.add_conversation_message(
-                session_id=session_id,
-                role=MessageRole.USER,
-                content=request.message
-            )
+            # 2. Record the user message; it is timestamped now so it still
+            # sorts before the reply. Only a message for an existing session
+            # is recorded, as it could not be inserted otherwise.
+            session = await session_cache.get_or_load(session_id, SessionRepository(conn).get_session)
+            if not session:
+                raise ValueError("Session not found or has expired.")
+            user_message = {
+                "session_id": session_id,
+                "role": MessageRole.USER,
+                "content": request.message,
+                "created_at": datetime.now(timezone.utc),
+            }
 
             # 3. Stream agent response
-            full_response = ""
+            response_chunks = []
             async for chunk in stream_agent_turn(session_id, request.message, conn):
-                full_response += chunk
-                yield f"data: {json.dumps(StreamDelta(type='text', content=chunk).dict())}\n\n"
-
-            # 4. Log full assistant message
-            await msg_repo.add_conversation_message(
-                session_id=session_id,
-                role=MessageRole.ASSISTANT,
-                content=full_response,
-                metadata={"streamed": True}
-            )
+                response_chunks.append(chunk)
+                yield _sse_event("text", chunk)
+
+            # 4. Log user and full assistant message
+            assistant_message = {
+                "session_id": session_id,
+                "role": MessageRole.ASSISTANT,
+                "content": "".join(response_chunks),
+                "metadata": {"streamed": True},
+            }
+            # Set before the INSERT on purpose: if it fails part-way, the user
+            # message is not retried on its own in the finally block
+            messages_logged = True
+            await MessageRepository(conn).add_conversation_messages([user_message, assistant_message])
             
-            yield f"data: {json.dumps(StreamDelta(type='end', content=None).dict())}\n\n"
+            yield _SSE_END
 
         except ValueError as e:
             logger.warning(f"Value error in chat stream: {e}")
-            error_content = {"error": str(e)}
-            yield f"data: {json.dumps(StreamDelta(type='error', content=error_content).dict())}\n\n"
+            yield _sse_event("error", {"error": str(e)})
         except Exception as e:
             logger.error(f"Chat stream failed: {e}", exc_info=True)
-            error_content = {"error": "An internal error occurred."}
-            yield f"data: {json.dumps(StreamDelta(type='error', content=error_content).dict())}\n\n"
+            yield _SSE_INTERNAL_ERROR
         finally:
             if conn:
+                # Persist the user message even when the reply failed
+                if user_message and not messages_logged:
+                    try:
+                        await MessageRepository(conn).add_conversation_messages([user_message])
+                    except Exception as e:
+                        logger.error(f"Failed to log chat stream messages: {e}")
                 await db_pool.pool.release(conn)
 
     return StreamingResponse(generate_stream(), media_type="text/event-stream")
\ No newline at end of file
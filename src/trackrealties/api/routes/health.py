@@ -3,8 +3,11 @@
 API route for health checks.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
+from typing import Optional, Tuple
 from fastapi import APIRouter, HTTPException
 from ...core.database import test_connection
 from ...core.graph import test_graph_connection
@@ -13,12 +16,43 @@ from ...models.api import HealthStatus
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Probes arriving within this many seconds of a check share its result, so
+# probe traffic costs the backends at most one check per interval
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_cached_status: Optional[Tuple[float, HealthStatus]] = None
+_check_lock = asyncio.Lock()
+
+
+def _fresh_cached_status() -> Optional[HealthStatus]:
+    if _cached_status is not None and time.monotonic() - _cached_status[0] < HEALTH_CACHE_TTL_SECONDS:
+        return _cached_status[1]
+    return None
+
+
 @router.get("/", response_model=HealthStatus)
 async def health_check():
     """Health check endpoint."""
+    global _cached_status
+
+    status = _fresh_cached_status()
+    if status is not None:
+        return status
+
+    # Concurrent probes that miss the cache wait for a single check
+    async with _check_lock:
+        status = _fresh_cached_status()
+        if status is None:
+            status = await _check_health()
+            _cached_status = (time.monotonic(), status)
+    return status
+
+
+async def _check_health() -> HealthStatus:
     try:
-        db_status = await test_connection()
-        graph_status = await test_graph_connection()
+        # The two backends are probed concurrently
+        db_status, graph_status = await asyncio.gather(
+            test_connection(), test_graph_connection()
+        )
         
         # Placeholder for other checks
         llm_status = True # Assume ok for now
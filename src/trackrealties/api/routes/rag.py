@@ -2,28 +2,111 @@
 API endpoints for RAG search functionality.
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Tuple
 import time
 
+from ...core.config import settings
 from ...models.search import QueryRequest, SearchRequest, SearchResponse, SearchResult
-from ...rag.router import QueryRouter
+from ...rag.router import QueryRouter, SearchStrategy
 from ...rag.synthesizer import ResponseSynthesizer
 from ...rag.entity_extractor import EntityExtractor
 from rag_pipeline_integration import EnhancedRAGPipeline
+from .chat import _SSE_END, _SSE_INTERNAL_ERROR, _sse_event
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-pipeline = EnhancedRAGPipeline()
 
+async def get_search_engine(request: Request) -> EnhancedRAGPipeline:
+    """Dependency returning the RAG pipeline initialized at application startup."""
+    return request.app.state.rag_pipeline
 
-async def get_search_engine() -> EnhancedRAGPipeline:
-    """Dependency to get an initialized EnhancedRAGPipeline instance."""
-    if not pipeline.initialized:
-        await pipeline.initialize()
-    return pipeline
+
+# Bounds the searches in flight per worker so a slow backend can't pile up
+# unbounded tasks and connections
+_search_semaphore = asyncio.Semaphore(settings.RAG_MAX_CONCURRENCY)
+
+
+async def _limited_search(search_engine: EnhancedRAGPipeline, **kwargs) -> List[SearchResult]:
+    async with _search_semaphore:
+        return await search_engine.search(**kwargs)
+
+
+async def _bounded_search(search_engine: EnhancedRAGPipeline, **kwargs) -> List[SearchResult]:
+    """
+    Run a pipeline search under the concurrency limit and time budget.
+
+    Raises:
+        asyncio.TimeoutError: If waiting for a slot plus the search exceeds
+            ``RAG_CLIENT_TIMEOUT_MS``
+    """
+    return await asyncio.wait_for(
+        _limited_search(search_engine, **kwargs),
+        timeout=settings.RAG_CLIENT_TIMEOUT_MS / 1000,
+    )
+
+
+# Query components are stateless between requests, so one instance of each is
+# built on first use and shared. The dependencies are async so FastAPI calls
+# them on the event loop instead of a threadpool.
+
+@lru_cache(maxsize=None)
+def _shared_query_router() -> QueryRouter:
+    return QueryRouter()
+
+
+@lru_cache(maxsize=None)
+def _shared_response_synthesizer() -> ResponseSynthesizer:
+    return ResponseSynthesizer()
+
+
+@lru_cache(maxsize=None)
+def _shared_entity_extractor() -> EntityExtractor:
+    return EntityExtractor()
+
+
+# Routing decisions for repeated queries: route_search classifies the text
+# with regexes and keeps no per-request state, so its strategy is reused.
+# Keyed by router id too, so an overridden dependency gets its own entries;
+# the entry holds the router so the id cannot be recycled while cached.
+_ROUTE_CACHE_SIZE = 4096
+_route_cache: "OrderedDict[Tuple[int, str], Tuple[QueryRouter, SearchStrategy]]" = OrderedDict()
+
+
+async def _route(query_router: QueryRouter, query: str) -> SearchStrategy:
+    """Return the router's strategy for a query, reusing earlier decisions."""
+    key = (id(query_router), query)
+    entry = _route_cache.get(key)
+    if entry is not None and entry[0] is query_router:
+        _route_cache.move_to_end(key)
+        return entry[1]
+    # Concurrent misses for one query may both route; the results are equal
+    strategy = await query_router.route_search(query)
+    _route_cache[key] = (query_router, strategy)
+    if len(_route_cache) > _ROUTE_CACHE_SIZE:
+        _route_cache.popitem(last=False)
+    return strategy
+
+
+async def get_query_router() -> QueryRouter:
+    """Dependency to get the shared QueryRouter."""
+    return _shared_query_router()
+
+
+async def get_response_synthesizer() -> ResponseSynthesizer:
+    """Dependency to get the shared ResponseSynthesizer."""
+    return _shared_response_synthesizer()
+
+
+async def get_entity_extractor() -> EntityExtractor:
+    """Dependency to get the shared EntityExtractor."""
+    return _shared_entity_extractor()
 
 @router.post("/search", response_model=SearchResponse)
 async def search(
@@ -33,28 +116,37 @@ async def search(
     """
     Perform a search using the RAG engine.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         logger.info(f"Performing search for query: {request.query}")
         
-        results: List[SearchResult] = await search_engine.search(
+        results = await _bounded_search(
+            search_engine,
             query=request.query,
             limit=request.limit,
             filters=request.filters,
         )
         
-        end_time = time.time()
-        search_time_ms = int((end_time - start_time) * 1000)
+        search_time_ms = int((time.perf_counter() - start_time) * 1000)
 
-        return SearchResponse(
+        # Every field comes from the validated request or from SearchResult
+        # instances built by the pipeline, so validation is skipped; only the
+        # model's relevance ordering of results is applied
+        response = SearchResponse.model_construct(
             query=request.query,
             search_type=request.search_type,
-            results=results,
+            results=SearchResponse.validate_results(results),
             total_results=len(results),
             search_time_ms=search_time_ms,
             filters_applied=request.filters,
             sources_searched=["vector_db", "graph_db"], # Placeholder
         )
+        # Serialized by pydantic-core directly, skipping FastAPI's
+        # response_model re-validation and jsonable_encoder pass
+        return Response(content=response.model_dump_json(), media_type="application/json")
+    except asyncio.TimeoutError:
+        logger.warning(f"Search timed out for query: {request.query}")
+        raise HTTPException(status_code=504, detail="The search timed out.")
     except Exception as e:
         logger.error(f"Error during search: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="An error occurred during the search.")
@@ -64,32 +156,28 @@ async def search(
 async def intelligent_query(
     request: QueryRequest,
     search_engine: EnhancedRAGPipeline = Depends(get_search_engine),
+    query_router: QueryRouter = Depends(get_query_router),
+    response_synthesizer: ResponseSynthesizer = Depends(get_response_synthesizer),
 ):
     """
     Perform an intelligent search using a query router.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     try:
         logger.info(f"Performing intelligent query: {request.query}")
 
-        # Instantiate components
-        query_router = QueryRouter()
-        response_synthesizer = ResponseSynthesizer()
-
-        # Route query to determine search strategy
-        search_strategy = query_router.route_query(request.query)
+        # The routed strategy is reported but doesn't change the search call,
+        # so routing runs alongside the search
+        search_strategy, search_results = await asyncio.gather(
+            _route(query_router, request.query),
+            _bounded_search(search_engine, query=request.query),
+        )
         logger.info(f"Routed query to strategy: {search_strategy}")
 
-        # Perform search using the chosen strategy
-        search_results: List[SearchResult] = await search_engine.search(
-            query=request.query
-        )
-
-        # Synthesize the response
-        # Extracting 'content' from each SearchResult
-        result_content = [result.content for result in search_results]
-        synthesized_text = response_synthesizer.synthesize_response(
-            query=request.query, search_results=result_content
+        # Synthesize the response. This is an awaited LLM call, not CPU work,
+        # so it stays on the event loop.
+        synthesized_text = await response_synthesizer.synthesize_response(
+            query=request.query, search_results=search_results
         )
 
         # Create a single SearchResult for the synthesized response
@@ -102,28 +190,59 @@ async def intelligent_query(
             source="RAG Engine",
         )
 
-        end_time = time.time()
-        search_time_ms = int((end_time - start_time) * 1000)
+        search_time_ms = int((time.perf_counter() - start_time) * 1000)
 
-        return SearchResponse(
+        response = SearchResponse(
             query=request.query,
-            search_type=search_strategy,
+            search_type=search_strategy.value,
             results=[synthesized_result],
             total_results=1,
             search_time_ms=search_time_ms,
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
+    except asyncio.TimeoutError:
+        logger.warning(f"Search timed out for query: {request.query}")
+        raise HTTPException(status_code=504, detail="The search timed out.")
     except Exception as e:
         logger.error(f"Error during intelligent query: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="An error occurred during the query.")
 
 
+@router.post("/query/stream")
+async def intelligent_query_stream(
+    request: QueryRequest,
+    search_engine: EnhancedRAGPipeline = Depends(get_search_engine),
+    response_synthesizer: ResponseSynthesizer = Depends(get_response_synthesizer),
+):
+    """
+    Stream the synthesized answer to a query as server-sent events.
+
+    Uses the same ``text``/``end``/``error`` events as the chat stream, so
+    clients can render the answer from its first token.
+    """
+    async def generate_stream():
+        try:
+            logger.info(f"Performing streaming query: {request.query}")
+            search_results = await _bounded_search(search_engine, query=request.query)
+            async for chunk in response_synthesizer.stream_response(request.query, search_results):
+                yield _sse_event("text", chunk)
+            yield _SSE_END
+        except Exception as e:
+            logger.error(f"Error during streaming query: {e}", exc_info=True)
+            yield _SSE_INTERNAL_ERROR
+
+    return StreamingResponse(generate_stream(), media_type="text/event-stream")
+
+
 @router.post("/query-router")
-async def query_router_diagnostics(request: QueryRequest):
+async def query_router_diagnostics(
+    request: QueryRequest,
+    query_router: QueryRouter = Depends(get_query_router),
+    extractor: EntityExtractor = Depends(get_entity_extractor),
+):
     """Return router diagnostics for a query."""
     try:
-        router = QueryRouter()
-        extractor = EntityExtractor()
-        strategy = router.route_query(request.query)
+        strategy = await _route(query_router, request.query)
         entities = await extractor.extract_entities(request.query)
         return {"strategy": strategy, "entities": entities}
     except Exception as e:
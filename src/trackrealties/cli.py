@@ -7,23 +7,33 @@ and maintenance tasks.
 
 import asyncio
 import logging
-import json
+import random
 import sys
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 import click
 
-from .data.ingestion import DataIngestionEngine, IncrementalUpdateManager, DataQualityMonitor
-from .data.migration import DataMigrationUtility, MigrationRunner
-from .data.enhanced_ingestion import EnhancedDataIngestionEngine, ListingType
-from .data.enhanced_ingestion_pipeline import EnhancedIngestionPipeline
+# The ingestion, migration and database modules pull in the OpenAI, Neo4j
+# and database drivers, so they are imported inside the commands that use
+# them; commands such as `system info` start without loading them
+from .data.utils import ValidationCache, batched, iter_json_records, load_json_file
 from .core.config import get_settings
-from .core.database import get_db_session
+
+if TYPE_CHECKING:
+    from .data.enhanced_ingestion_pipeline import IngestionResult
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Upper bound of the random delay before a batch starts, so concurrent
+# batches don't hit the embedding API in lockstep
+_BATCH_START_JITTER_SECONDS = 0.05
+
+# Dry-run validation results from earlier runs, keyed by file contents
+validation_cache = ValidationCache(settings.VALIDATION_CACHE_DIR)
+
 
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -45,7 +55,10 @@ def data():
               help='Type of data to ingest (market data or property listings)')
 @click.option('--source', default='cli', help='Source of the data')
 @click.option('--batch-size', default=100, type=int, help='Number of records to process in a batch')
+@click.option('--max-concurrent-batches', default=4, type=int, help='Number of batches ingested at once')
+@click.option('--embedding-batch-size', default=256, type=int, help='Number of chunks sent per embeddings API call')
 @click.option('--dry-run', is_flag=True, help='Validate data without saving to database')
+@click.option('--no-cache', is_flag=True, help='Re-validate even if the file was validated before')
 @click.option('--skip-embeddings', is_flag=True, help='Skip generating embeddings')
 @click.option('--skip-graph', is_flag=True, help='Skip building knowledge graph')
 @click.option('--max-chunk-size', default=1000, type=int, help='Maximum size of chunks in characters')
@@ -54,8 +67,9 @@ def data():
               help='OpenAI embedding model to use (default: text-embedding-3-small)')
 @click.option('--embedding-dimensions', default=1536, type=int, 
               help='Dimensions for embeddings (default: 1536 for text-embedding-3-small)')
-def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embeddings, skip_graph, 
-                max_chunk_size, chunk_overlap, embedding_model, embedding_dimensions):
+def enhanced_ingest(file_path, data_type, source, batch_size, max_concurrent_batches, embedding_batch_size,
+                dry_run, no_cache,
+                skip_embeddings, skip_graph, max_chunk_size, chunk_overlap, embedding_model, embedding_dimensions):
     """
     Ingest data using the enhanced ingestion pipeline with JSON chunking.
     
@@ -72,33 +86,26 @@ def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embe
     """
     async def _ingest():
         try:
-            # Load data from file
-            click.echo(f"Loading data from {file_path}...")
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            # Check if data is a list
-            if not isinstance(data, list):
-                data = [data]  # Convert single object to list
-            
-            click.echo(f"Loaded {len(data)} records from {file_path}")
-            
             # Create and initialize the pipeline with custom settings
             click.echo("Initializing enhanced ingestion pipeline...")
             
-            # Override settings with command line options
-            from ..core.config import get_settings
-            settings = get_settings()
-            
-            # Apply custom chunking and embedding settings
-            settings.max_chunk_size = max_chunk_size
-            settings.chunk_overlap = chunk_overlap
-            settings.embedding_model = embedding_model
-            settings.embedding_dimensions = embedding_dimensions
+            # Apply custom chunking and embedding settings to a copy of the
+            # module settings, so other commands keep the configured values
+            pipeline_settings = settings.model_copy(update={
+                "MAX_CHUNK_SIZE": max_chunk_size,
+                "CHUNK_OVERLAP": chunk_overlap,
+                "EMBEDDING_MODEL": embedding_model,
+                "EMBEDDING_DIMENSIONS": embedding_dimensions,
+            })
             
             # Create pipeline with custom settings
-            pipeline = EnhancedIngestionPipeline(batch_size=batch_size)
-            await pipeline.initialize()
+            from .data.enhanced_ingestion_pipeline import EnhancedIngestionPipeline
+            pipeline = EnhancedIngestionPipeline(
+                batch_size=batch_size, embedding_batch_size=embedding_batch_size, settings=pipeline_settings
+            )
+            # Validation only needs the chunker, so a dry run does not connect
+            # the embedder, database or graph clients
+            await pipeline.initialize(dry_run=dry_run)
             
             # Configure pipeline based on flags
             if skip_embeddings:
@@ -117,13 +124,22 @@ def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embe
                 click.echo(f"Chunking settings: max_size={max_chunk_size}, overlap={chunk_overlap}")
                 click.echo(f"Embedding settings: model={embedding_model}, dimensions={embedding_dimensions}")
                 
-                # Validate data without saving
-                if data_type == 'market':
-                    click.echo(f"Validating {len(data)} market data records...")
-                    validation_result = await pipeline.validate_market_data(source, data)
-                else:  # property
+                # Validate data without saving; the whole file is only read
+                # when there is no cached result for it
+                async def validate():
+                    click.echo(f"Loading data from {file_path}...")
+                    data = list(iter_json_records(file_path))
+                    click.echo(f"Loaded {len(data)} records from {file_path}")
+                    if data_type == 'market':
+                        click.echo(f"Validating {len(data)} market data records...")
+                        return await pipeline.validate_market_data(source, data)
                     click.echo(f"Validating {len(data)} property listings...")
-                    validation_result = await pipeline.validate_property_listings(source, data)
+                    return await pipeline.validate_property_listings(source, data)
+                
+                validation_result = await _validate_with_cache(
+                    file_path, ("enhanced", data_type, source, max_chunk_size, chunk_overlap),
+                    validate, not no_cache
+                )
                 
                 # Display validation results
                 click.echo("\nValidation Results:")
@@ -131,8 +147,8 @@ def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embe
                 click.echo(f"Total Records: {validation_result['total']}")
                 click.echo(f"Valid Records: {validation_result['valid']}")
                 click.echo(f"Invalid Records: {validation_result['invalid']}")
-                click.echo(f"Success Rate: {validation_result['success_rate']:.2%}")
-                click.echo(f"Total Chunks: {validation_result['chunking_stats']['total_chunks']}")
+                total = validation_result['total']
+                click.echo(f"Success Rate: {validation_result['valid'] / total if total else 0:.2%}")
                 
                 if validation_result['errors']:
                     click.echo("\nErrors:")
@@ -144,13 +160,19 @@ def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embe
                 
                 return
             
-            # Process data
+            # Process data batch by batch as it is read
             if data_type == 'market':
-                click.echo(f"Processing {len(data)} market data records...")
-                result = await pipeline.ingest_market_data(source, data)
+                click.echo(f"Processing market data records from {file_path}...")
+                result = await _ingest_in_batches(
+                    pipeline.ingest_market_data, source, iter_json_records(file_path),
+                    batch_size, max_concurrent_batches
+                )
             else:  # property
-                click.echo(f"Processing {len(data)} property listings...")
-                result = await pipeline.ingest_property_listings(source, data)
+                click.echo(f"Processing property listings from {file_path}...")
+                result = await _ingest_in_batches(
+                    pipeline.ingest_property_listings, source, iter_json_records(file_path),
+                    batch_size, max_concurrent_batches
+                )
             
             # Display results
             _display_results(result)
@@ -163,75 +185,180 @@ def enhanced_ingest(file_path, data_type, source, batch_size, dry_run, skip_embe
     asyncio.run(_ingest())
 
 
+async def _validate_with_cache(file_path: str, params: tuple, validate, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Return the validation result for a file, reusing one from an earlier run.
+
+    Results are keyed by the file's contents and ``params``, so editing the
+    file or changing a validation option invalidates them. ``validate`` is
+    awaited on a miss and its result stored; it loads the file itself, so a
+    hit never parses it. With ``use_cache`` False the cache is neither read
+    nor written.
+    """
+    if not use_cache:
+        return await validate()
+    key = validation_cache.key(file_path, *params)
+    result = validation_cache.get(key)
+    if result is not None:
+        click.echo("Using cached validation results (file unchanged since last run)")
+        return result
+    result = await validate()
+    validation_cache.set(key, result)
+    return result
+
+
+async def _ingest_in_batches(
+    ingest, source: str, records, batch_size: int, max_in_flight: int = 1
+) -> "IngestionResult":
+    """
+    Feed records to a pipeline ingest method in concurrent batches.
+
+    Up to ``max_in_flight`` batches are ingested at once, so embedding API
+    latency overlaps across batches. The next batch is only read once a slot
+    is free, which keeps at most ``max_in_flight`` batches in memory. The
+    per-batch results are summed into a single IngestionResult in file order.
+
+    A batch whose ingest call raises counts all of its records as failed.
+    No further batches are read after a failure; batches already in flight
+    finish and their results are kept.
+    """
+    from .data.enhanced_ingestion_pipeline import IngestionResult
+    
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+    ingested = 0
+    batch_failed = False
+    stopped = False
+
+    async def run(batch):
+        nonlocal ingested, batch_failed
+        try:
+            await asyncio.sleep(random.random() * _BATCH_START_JITTER_SECONDS)
+            batch_result = await ingest(source, batch)
+        except Exception:
+            batch_failed = True
+            raise
+        finally:
+            semaphore.release()
+        ingested += len(batch)
+        click.echo(f"Processed {ingested} records...")
+        return batch_result
+
+    batch_sizes = []
+    tasks = []
+    batches = batched(records, batch_size)
+    while True:
+        # A slot is taken before the next batch is read from the file
+        await semaphore.acquire()
+        batch = next(batches, None)
+        if batch is None or batch_failed:
+            semaphore.release()
+            stopped = batch is not None
+            break
+        batch_sizes.append(len(batch))
+        tasks.append(asyncio.create_task(run(batch)))
+    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    result = IngestionResult(
+        total=0,
+        processed=0,
+        failed=0,
+        chunks_created=0,
+        embeddings_generated=0,
+        graph_nodes_created=0
+    )
+    for size, batch_result in zip(batch_sizes, batch_results):
+        if isinstance(batch_result, Exception):
+            result.total += size
+            result.failed += size
+            result.errors.append(f"Error processing batch: {batch_result}")
+            continue
+        result.total += batch_result.total
+        result.processed += batch_result.processed
+        result.failed += batch_result.failed
+        result.chunks_created += batch_result.chunks_created
+        result.embeddings_generated += batch_result.embeddings_generated
+        result.graph_nodes_created += batch_result.graph_nodes_created
+        result.errors.extend(batch_result.errors)
+        result.per_record_ms.extend(batch_result.per_record_ms)
+    if stopped:
+        result.errors.append("Error processing batch: ingestion stopped, later records were not ingested")
+    return result
+
+
 def _display_results(result):
     """Display the results of an ingestion operation."""
-    click.echo("\nIngestion Results:")
-    click.echo("=" * 60)
+    # Lines are collected and written with a single echo
+    lines = []
+    lines.append("\nIngestion Results:")
+    lines.append("=" * 60)
     
     # Basic statistics
-    click.echo(f"Total Records: {result.total}")
-    click.echo(f"Processed Records: {result.processed}")
-    click.echo(f"Failed Records: {result.failed}")
+    lines.append(f"Total Records: {result.total}")
+    lines.append(f"Processed Records: {result.processed}")
+    lines.append(f"Failed Records: {result.failed}")
     
     # Calculate success rate
     success_rate = result.processed / result.total * 100 if result.total > 0 else 0
-    click.echo(f"Success Rate: {success_rate:.2f}%")
+    lines.append(f"Success Rate: {success_rate:.2f}%")
     
     # Chunking and embedding statistics
-    click.echo("\nChunking and Embedding:")
-    click.echo("-" * 60)
-    click.echo(f"Chunks Created: {result.chunks_created}")
-    click.echo(f"Embeddings Generated: {result.embeddings_generated}")
-    click.echo(f"Average Chunks per Record: {result.chunks_created / result.total:.2f}" if result.total > 0 else "Average Chunks per Record: 0")
+    lines.append("\nChunking and Embedding:")
+    lines.append("-" * 60)
+    lines.append(f"Chunks Created: {result.chunks_created}")
+    lines.append(f"Embeddings Generated: {result.embeddings_generated}")
+    lines.append(f"Average Chunks per Record: {result.chunks_created / result.total:.2f}" if result.total > 0 else "Average Chunks per Record: 0")
     
     # Graph statistics
-    click.echo("\nKnowledge Graph:")
-    click.echo("-" * 60)
-    click.echo(f"Graph Nodes Created: {result.graph_nodes_created}")
-    click.echo(f"Average Nodes per Record: {result.graph_nodes_created / result.processed:.2f}" if result.processed > 0 else "Average Nodes per Record: 0")
+    lines.append("\nKnowledge Graph:")
+    lines.append("-" * 60)
+    lines.append(f"Graph Nodes Created: {result.graph_nodes_created}")
+    lines.append(f"Average Nodes per Record: {result.graph_nodes_created / result.processed:.2f}" if result.processed > 0 else "Average Nodes per Record: 0")
     
     # Error summary
     if result.errors:
-        click.echo("\nError Summary:")
-        click.echo("-" * 60)
-        click.echo(f"Total Errors: {len(result.errors)}")
+        lines.append("\nError Summary:")
+        lines.append("-" * 60)
+        lines.append(f"Total Errors: {len(result.errors)}")
         
-        # Group errors by type
-        error_types = {}
-        for error in result.errors:
-            error_type = error.split(":")[0] if ":" in error else "Unknown"
-            if error_type not in error_types:
-                error_types[error_type] = 0
-            error_types[error_type] += 1
+        # Group errors by type, most frequent first
+        error_types = Counter(
+            error.partition(":")[0] if ":" in error else "Unknown" for error in result.errors
+        )
         
-        click.echo("\nError Types:")
-        for error_type, count in error_types.items():
-            click.echo(f"  {error_type}: {count}")
+        lines.append("\nError Types:")
+        for error_type, count in error_types.most_common():
+            lines.append(f"  {error_type}: {count}")
         
-        click.echo("\nSample Errors:")
+        lines.append("\nSample Errors:")
         for i, error in enumerate(result.errors[:5]):  # Show first 5 errors
-            click.echo(f"  {i+1}. {error}")
+            lines.append(f"  {i+1}. {error}")
         
         if len(result.errors) > 5:
-            click.echo(f"  ... and {len(result.errors) - 5} more errors")
+            lines.append(f"  ... and {len(result.errors) - 5} more errors")
     
     # Performance summary
-    click.echo("\nPerformance Summary:")
-    click.echo("-" * 60)
-    
-    # If we had timing information, we would display it here
-    # For now, just display a placeholder
-    click.echo("Processing completed successfully.")
+    lines.append("\nPerformance Summary:")
+    lines.append("-" * 60)
+    if result.per_record_ms:
+        import numpy as np
+        
+        timings = np.asarray(result.per_record_ms, dtype=np.float64)
+        p50, p95 = np.percentile(timings, [50, 95])
+        lines.append(f"Time per Record: p50={p50:.1f}ms p95={p95:.1f}ms mean={timings.mean():.1f}ms")
+    else:
+        lines.append("Processing completed successfully.")
     
     # Final summary
-    click.echo("\nFinal Status:")
-    click.echo("-" * 60)
+    lines.append("\nFinal Status:")
+    lines.append("-" * 60)
     if result.failed == 0:
-        click.echo("✅ All records processed successfully!")
+        lines.append("✅ All records processed successfully!")
     elif result.failed < result.total * 0.1:  # Less than 10% failed
-        click.echo("⚠️ Most records processed successfully, but some failed. Check errors for details.")
+        lines.append("⚠️ Most records processed successfully, but some failed. Check errors for details.")
     else:  # More than 10% failed
-        click.echo("❌ Significant number of records failed to process. Check errors for details.")
+        lines.append("❌ Significant number of records failed to process. Check errors for details.")
+    
+    click.echo("\n".join(lines))
 
 
 @data.command("ingest-market-data")
@@ -239,29 +366,43 @@ def _display_results(result):
 @click.option('--source', '-s', required=True, help='Data source identifier')
 @click.option('--batch-size', '-b', default=1000, help='Batch size for processing')
 @click.option('--dry-run', is_flag=True, help='Validate data without ingesting')
+@click.option('--no-cache', is_flag=True, help='Re-validate even if the file was validated before')
 @click.option('--enhanced', is_flag=True, help='Use enhanced ingestion pipeline')
 @click.option('--use-json-chunking', is_flag=True, help='Use the new JSON chunking pipeline')
-def ingest_market_data(file_path, source, batch_size, dry_run, enhanced, use_json_chunking):
+@click.option('--max-concurrent-batches', default=4, type=int,
+              help='Number of batches ingested at once with --use-json-chunking')
+@click.option('--embedding-batch-size', default=256, type=int,
+              help='Number of chunks sent per embeddings API call with --use-json-chunking')
+def ingest_market_data(file_path, source, batch_size, dry_run, no_cache, enhanced, use_json_chunking,
+                       max_concurrent_batches, embedding_batch_size):
     """Ingest market data from JSON file."""
     async def _ingest():
         try:
-            # Load data from file
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            if not isinstance(data, list):
-                click.echo("Error: File must contain a JSON array of records")
-                return
-            
-            click.echo(f"Loading {len(data)} market data records from {file_path}")
+            # The JSON chunking pipeline streams records from the file in
+            # batches and a dry run only reads it on a validation cache miss;
+            # the legacy engines need the whole list
+            if not dry_run and not use_json_chunking:
+                data = load_json_file(file_path)
+                
+                if not isinstance(data, list):
+                    click.echo("Error: File must contain a JSON array of records")
+                    return
+                
+                click.echo(f"Loading {len(data)} market data records from {file_path}")
             
             if dry_run:
                 # Validate only
                 from .data.validation import DataValidator
                 validator = DataValidator()
                 
-                click.echo("Validating data...")
-                validation_result = await validator.validate_batch(data, 'market_data')
+                async def validate():
+                    data = list(iter_json_records(file_path, require_array=True))
+                    click.echo(f"Validating {len(data)} records from {file_path}...")
+                    return await validator.validate_batch(data, 'market_data')
+                
+                validation_result = await _validate_with_cache(
+                    file_path, ("market_data",), validate, not no_cache
+                )
                 
                 click.echo(f"Validation Results:")
                 click.echo(f"  Total records: {validation_result['total_records']}")
@@ -280,16 +421,24 @@ def ingest_market_data(file_path, source, batch_size, dry_run, enhanced, use_jso
             if use_json_chunking:
                 # Use the new EnhancedIngestionPipeline with JSON chunking
                 click.echo("Using EnhancedIngestionPipeline with JSON chunking...")
-                pipeline = EnhancedIngestionPipeline(batch_size=batch_size)
+                from .data.enhanced_ingestion_pipeline import EnhancedIngestionPipeline
+                pipeline = EnhancedIngestionPipeline(
+                    batch_size=batch_size, embedding_batch_size=embedding_batch_size
+                )
                 await pipeline.initialize()
                 
-                click.echo(f"Processing {len(data)} market data records...")
-                result = await pipeline.ingest_market_data(source, data)
+                click.echo(f"Processing market data records from {file_path}...")
+                records = iter_json_records(file_path, require_array=True)
+                result = await _ingest_in_batches(
+                    pipeline.ingest_market_data, source, records, batch_size, max_concurrent_batches
+                )
                 
                 # Display results
                 _display_results(result)
             else:
                 # Use the legacy ingestion engines
+                from .data.ingestion import DataIngestionEngine
+                from .data.enhanced_ingestion import EnhancedDataIngestionEngine
                 if enhanced:
                     engine = EnhancedDataIngestionEngine(batch_size=batch_size)
                 else:
@@ -346,29 +495,43 @@ def ingest_market_data(file_path, source, batch_size, dry_run, enhanced, use_jso
               help='Type of property listings to ingest')
 @click.option('--batch-size', '-b', default=1000, help='Batch size for processing')
 @click.option('--dry-run', is_flag=True, help='Validate data without ingesting')
+@click.option('--no-cache', is_flag=True, help='Re-validate even if the file was validated before')
 @click.option('--enhanced', is_flag=True, help='Use enhanced ingestion pipeline')
 @click.option('--use-json-chunking', is_flag=True, help='Use the new JSON chunking pipeline')
-def ingest_properties(file_path, source, listing_type, batch_size, dry_run, enhanced, use_json_chunking):
+@click.option('--max-concurrent-batches', default=4, type=int,
+              help='Number of batches ingested at once with --use-json-chunking')
+@click.option('--embedding-batch-size', default=256, type=int,
+              help='Number of chunks sent per embeddings API call with --use-json-chunking')
+def ingest_properties(file_path, source, listing_type, batch_size, dry_run, no_cache, enhanced,
+                      use_json_chunking, max_concurrent_batches, embedding_batch_size):
     """Ingest property listings from JSON file."""
     async def _ingest():
         try:
-            # Load data from file
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            if not isinstance(data, list):
-                click.echo("Error: File must contain a JSON array of records")
-                return
-            
-            click.echo(f"Loading {len(data)} property listings from {file_path}")
+            # The JSON chunking pipeline streams records from the file in
+            # batches and a dry run only reads it on a validation cache miss;
+            # the legacy engines need the whole list
+            if not dry_run and not use_json_chunking:
+                data = load_json_file(file_path)
+                
+                if not isinstance(data, list):
+                    click.echo("Error: File must contain a JSON array of records")
+                    return
+                
+                click.echo(f"Loading {len(data)} property listings from {file_path}")
             
             if dry_run:
                 # Validate only
                 from .data.validation import DataValidator
                 validator = DataValidator()
                 
-                click.echo("Validating data...")
-                validation_result = await validator.validate_batch(data, 'property_listing')
+                async def validate():
+                    data = list(iter_json_records(file_path, require_array=True))
+                    click.echo(f"Validating {len(data)} records from {file_path}...")
+                    return await validator.validate_batch(data, 'property_listing')
+                
+                validation_result = await _validate_with_cache(
+                    file_path, ("property_listing",), validate, not no_cache
+                )
                 
                 click.echo(f"Validation Results:")
                 click.echo(f"  Total records: {validation_result['total_records']}")
@@ -387,16 +550,24 @@ def ingest_properties(file_path, source, listing_type, batch_size, dry_run, enha
             if use_json_chunking:
                 # Use the new EnhancedIngestionPipeline with JSON chunking
                 click.echo("Using EnhancedIngestionPipeline with JSON chunking...")
-                pipeline = EnhancedIngestionPipeline(batch_size=batch_size)
+                from .data.enhanced_ingestion_pipeline import EnhancedIngestionPipeline
+                pipeline = EnhancedIngestionPipeline(
+                    batch_size=batch_size, embedding_batch_size=embedding_batch_size
+                )
                 await pipeline.initialize()
                 
-                click.echo(f"Processing {len(data)} property listings...")
-                result = await pipeline.ingest_property_listings(source, data)
+                click.echo(f"Processing property listings from {file_path}...")
+                records = iter_json_records(file_path, require_array=True)
+                result = await _ingest_in_batches(
+                    pipeline.ingest_property_listings, source, records, batch_size, max_concurrent_batches
+                )
                 
                 # Display results
                 _display_results(result)
             else:
                 # Use the legacy ingestion engines
+                from .data.ingestion import DataIngestionEngine
+                from .data.enhanced_ingestion import EnhancedDataIngestionEngine, ListingType
                 # Convert listing_type string to enum if using enhanced pipeline
                 listing_type_enum = None
                 if enhanced:
@@ -498,6 +669,7 @@ def migrate(batch_size, property_only, market_only):
         try:
             click.echo("Starting data migration...")
             
+            from .data.migration import MigrationRunner
             runner = MigrationRunner()
             
             if property_only:
@@ -568,6 +740,7 @@ def health():
             
             # Check database
             try:
+                from .core.database import get_db_session
                 async with get_db_session() as db:
                     await db.execute("SELECT 1")
                 click.echo("✓ Database: Connected")
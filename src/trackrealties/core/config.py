@@ -44,6 +44,22 @@ class Settings(BaseSettings):
     EMBEDDING_BASE_URL: str = os.getenv("EMBEDDING_BASE_URL", "https://api.openai.com/v1")
     EMBEDDING_CACHE_DIR: str = os.getenv("EMBEDDING_CACHE_DIR", "./cache/embeddings")
     EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", 100))
+    # Concurrent query embeddings are sent to the API together, up to this many
+    # per call, waiting at most this long for the batch to fill
+    EMBEDDING_QUERY_BATCH_MAX: int = int(os.getenv("EMBEDDING_QUERY_BATCH_MAX", 64))
+    EMBEDDING_QUERY_BATCH_WAIT_MS: float = float(os.getenv("EMBEDDING_QUERY_BATCH_WAIT_MS", 5.0))
+    
+    # Load chunk embeddings into memory and score queries there instead of in Postgres
+    VECTOR_SEARCH_MEMORY_INDEX: bool = os.getenv("VECTOR_SEARCH_MEMORY_INDEX", "false").lower() == "true"
+    VECTOR_SEARCH_QUANTIZATION: str = os.getenv("VECTOR_SEARCH_QUANTIZATION", "none")
+    
+    # RAG route limits: searches running at once per worker, and how long a
+    # search may take (including the wait for a slot) before a 504
+    RAG_MAX_CONCURRENCY: int = int(os.getenv("RAG_MAX_CONCURRENCY", 64))
+    RAG_CLIENT_TIMEOUT_MS: int = int(os.getenv("RAG_CLIENT_TIMEOUT_MS", 2500))
+    # Run a throwaway hybrid search at startup so the first request doesn't
+    # pay for cold clients and connections
+    RAG_WARMUP: bool = os.getenv("RAG_WARMUP", "false").lower() == "true"
     
     # Chunking Settings
     MAX_CHUNK_SIZE: int = int(os.getenv("MAX_CHUNK_SIZE", 1000))
@@ -62,6 +78,8 @@ class Settings(BaseSettings):
     
     # Validation Settings
     VALIDATION_ENABLED: bool = os.getenv("VALIDATION_ENABLED", "true").lower() == "true"
+    # Dry-run validation results, keyed by input file contents
+    VALIDATION_CACHE_DIR: str = os.getenv("VALIDATION_CACHE_DIR", "./cache/validation")
     VALIDATION_REQUIRED_FIELDS_MARKET: List[str] = ["region_id", "region_name", "date", "median_price"]
     VALIDATION_REQUIRED_FIELDS_PROPERTY: List[str] = ["property_id", "price", "status", "property_type"]
     
@@ -71,10 +89,22 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = os.getenv("AWS_SECRET_ACCESS_KEY")
     S3_BUCKET_NAME: Optional[str] = os.getenv("S3_BUCKET_NAME", "trackrealties-data")
     
+    # Agent Settings
+    TOOL_CONCURRENCY_LIMIT: int = int(os.getenv("TOOL_CONCURRENCY_LIMIT", 4))
+    # Comma-separated roles whose agents are built at startup
+    AGENT_PREWARM_ROLES: str = os.getenv("AGENT_PREWARM_ROLES", "investor,buyer")
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("RESPONSE_CACHE_SIMILARITY_THRESHOLD", 0.95))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 3600))
+    SESSION_CACHE_MAX_ENTRIES: int = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", 50000))
+    SESSION_CACHE_TTL_SECONDS: int = int(os.getenv("SESSION_CACHE_TTL_SECONDS", 60))
+    
     # Rate Limiting Settings
     RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
     RATE_LIMIT_MAX_REQUESTS: int = int(os.getenv("RATE_LIMIT_MAX_REQUESTS", 100))
     RATE_LIMIT_WINDOW_SECONDS: int = int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", 60))
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
     
     # Feature Flags
     FEATURE_ENHANCED_INGESTION: bool = os.getenv("FEATURE_ENHANCED_INGESTION", "true").lower() == "true"
@@ -130,6 +160,10 @@ class Settings(BaseSettings):
     def neo4j_database(self) -> str:
         return self.NEO4J_DATABASE
 
+    @property
+    def redis_url(self) -> Optional[str]:
+        return self.REDIS_URL
+
     class Config:
         env_file = ".env"
         env_file_encoding = 'utf-8'
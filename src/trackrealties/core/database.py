@@ -1,18 +1,80 @@
 """Database utilities for PostgreSQL connection and operations.
 """
 
+import asyncio
 import os
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional, AsyncContextManager
+from typing import Dict, Optional, AsyncContextManager
 
 import asyncpg
 from asyncpg.pool import Pool
 from asyncpg import Connection
+from asyncpg.prepared_stmt import PreparedStatement
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Hot queries prepared on every pooled connection, by name
+_PREPARED_STATEMENTS: Dict[str, str] = {}
+
+
+def register_prepared_statement(name: str, query: str) -> str:
+    """
+    Register a query to be prepared on every pooled connection.
+
+    Call at import time, before the pool opens connections; connections
+    created earlier prepare the statement on first use instead.
+
+    Args:
+        name: Statement name passed to ``PreparedConnection.prepared``
+        query: SQL text
+
+    Returns:
+        The statement name
+    """
+    _PREPARED_STATEMENTS[name] = query
+    return name
+
+
+class PreparedConnection(Connection):
+    """
+    Connection that keeps its registered prepared statements.
+
+    Prepared statements belong to one server session, so each pooled
+    connection holds its own; they survive the pool's reset on release, so
+    a statement is parsed and planned once per connection lifetime.
+    """
+
+    __slots__ = ("_prepared",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prepared: Dict[str, PreparedStatement] = {}
+
+    async def prepared(self, name: str) -> PreparedStatement:
+        """Return the registered statement ``name``, preparing it on first use."""
+        statement = self._prepared.get(name)
+        if statement is None:
+            statement = await self.prepare(_PREPARED_STATEMENTS[name])
+            self._prepared[name] = statement
+        return statement
+
+
+async def _prepare_registered_statements(connection: PreparedConnection) -> None:
+    """
+    Pool ``init`` hook: prepare every registered statement on a new connection.
+
+    A statement the server rejects (e.g. its table does not exist until the
+    migrations have run) is logged and left to be prepared on first use, so
+    it fails only the queries that need it rather than the whole pool.
+    """
+    for name in _PREPARED_STATEMENTS:
+        try:
+            await connection.prepared(name)
+        except asyncpg.PostgresError as e:
+            logger.warning(f"Could not prepare statement {name!r}; it will be prepared on first use: {e}")
+
 
 class DatabasePool:
     """Manages PostgreSQL connection pool."""
@@ -29,17 +91,25 @@ class DatabasePool:
             raise ValueError("DATABASE_URL not set in environment or config")
         
         self.pool: Optional[Pool] = None
+        # Concurrent first callers would otherwise each create a pool
+        self._init_lock = asyncio.Lock()
     
     async def initialize(self):
-        """Create connection pool."""
-        if not self.pool:
+        """Create connection pool (once, even if called concurrently)."""
+        if self.pool:
+            return
+        async with self._init_lock:
+            if self.pool:
+                return
             try:
                 self.pool = await asyncpg.create_pool(
                     self.database_url,
                     min_size=5,
                     max_size=20,
                     max_inactive_connection_lifetime=300,
-                    command_timeout=60
+                    command_timeout=60,
+                    connection_class=PreparedConnection,
+                    init=_prepare_registered_statements
                 )
                 logger.info("Database connection pool initialized")
             except Exception as e:
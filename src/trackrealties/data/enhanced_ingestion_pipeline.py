@@ -7,6 +7,7 @@ from chunking JSON data semantically to generating embeddings and building a kno
 
 import logging
 import asyncio
+import time
 from typing import Dict, Any, List, Optional, Tuple, Set, Union
 from datetime import datetime
 import uuid
@@ -34,6 +35,9 @@ class IngestionResult:
     embeddings_generated: int
     graph_nodes_created: int
     errors: List[str] = field(default_factory=list)
+    # Wall-clock milliseconds spent on each record that reached the database
+    # step; batch-wide stages (chunking, embedding) are split evenly
+    per_record_ms: List[float] = field(default_factory=list)
 
 
 class EnhancedIngestionPipeline:
@@ -46,6 +50,7 @@ class EnhancedIngestionPipeline:
     
     def __init__(self,
                  batch_size: Optional[int] = None,
+                 embedding_batch_size: Optional[int] = None,
                  skip_embeddings: bool = False,
                  skip_graph: bool = False,
                  settings: Optional[Settings] = None):
@@ -54,6 +59,7 @@ class EnhancedIngestionPipeline:
         
         Args:
             batch_size: Number of records to process in a batch
+            embedding_batch_size: Number of chunk texts sent per embeddings API call
             skip_embeddings: Whether to skip embedding generation
             skip_graph: Whether to skip graph building
             settings: Application settings
@@ -61,6 +67,7 @@ class EnhancedIngestionPipeline:
         self.logger = logging.getLogger(__name__)
         self.settings = settings or get_settings()
         self.batch_size = batch_size or self.settings.ingestion_batch_size
+        self.embedding_batch_size = embedding_batch_size or self.settings.embedding_batch_size
         self.skip_embeddings = skip_embeddings
         self.skip_graph = skip_graph
         
@@ -88,7 +95,7 @@ class EnhancedIngestionPipeline:
                     self.embedder = OpenAIEmbedder(
                         model=self.settings.embedding_model,
                         dimensions=self.settings.embedding_dimensions,
-                        batch_size=self.settings.embedding_batch_size,
+                        batch_size=self.embedding_batch_size,
                         use_cache=True,
                         api_key=self.settings.embedding_api_key or self.settings.llm_api_key
                     )
@@ -140,21 +147,27 @@ class EnhancedIngestionPipeline:
             batch = data[i:i + self.batch_size]
             self.logger.info(f"Processing batch {i//self.batch_size + 1} ({len(batch)} records)")
             
+            # Chunk every record of the batch first so their embeddings can
+            # be requested together
+            batch_started = time.perf_counter()
+            chunked = []
             for record in batch:
                 try:
-                    # Chunk the record
                     chunks = self.chunker.chunk_json(record, "market")
-                    result.chunks_created += len(chunks)
-                    
-                    # Generate embeddings
-                    if not self.skip_embeddings and self.embedder:
-                        chunk_texts = [chunk.content for chunk in chunks]
-                        embeddings, token_counts = await self.embedder.generate_embeddings_batch(chunk_texts)
-                        # Update chunks with embeddings
-                        for chunk, embedding in zip(chunks, embeddings):
-                            chunk.embedding = embedding
-                        result.embeddings_generated += len(embeddings)
-                    
+                except Exception as e:
+                    self._record_failure(result, source, record, e)
+                    continue
+                result.chunks_created += len(chunks)
+                chunked.append((record, chunks))
+            
+            # Generate embeddings
+            if not self.skip_embeddings and self.embedder:
+                chunked = await self._embed_chunks(source, chunked, result)
+            shared_ms = (time.perf_counter() - batch_started) * 1000 / max(len(chunked), 1)
+            
+            for record, chunks in chunked:
+                record_started = time.perf_counter()
+                try:
                     # Save to database
                     db_result = await self.db_integration.save_market_data_to_database(
                         record, chunks
@@ -173,9 +186,8 @@ class EnhancedIngestionPipeline:
                         result.errors.append(f"Failed to save record: {db_result.get('error')}")
                         
                 except Exception as e:
-                    result.failed += 1
-                    result.errors.append(f"Error processing record: {str(e)}")
-                    log_error(e, {"source": source, "record": record})
+                    self._record_failure(result, source, record, e)
+                result.per_record_ms.append(shared_ms + (time.perf_counter() - record_started) * 1000)
         
         self.logger.info(
             f"Market data ingestion complete: {result.processed}/{result.total} processed, "
@@ -212,21 +224,27 @@ class EnhancedIngestionPipeline:
             batch = data[i:i + self.batch_size]
             self.logger.info(f"Processing batch {i//self.batch_size + 1} ({len(batch)} records)")
             
+            # Chunk every record of the batch first so their embeddings can
+            # be requested together
+            batch_started = time.perf_counter()
+            chunked = []
             for record in batch:
                 try:
-                    # Chunk the record
                     chunks = self.chunker.chunk_json(record, "property")
-                    result.chunks_created += len(chunks)
-                    
-                    # Generate embeddings
-                    if not self.skip_embeddings and self.embedder:
-                        chunk_texts = [chunk.content for chunk in chunks]
-                        embeddings, token_counts = await self.embedder.generate_embeddings_batch(chunk_texts)
-                        # Update chunks with embeddings
-                        for chunk, embedding in zip(chunks, embeddings):
-                            chunk.embedding = embedding
-                        result.embeddings_generated += len(embeddings)
-                    
+                except Exception as e:
+                    self._record_failure(result, source, record, e)
+                    continue
+                result.chunks_created += len(chunks)
+                chunked.append((record, chunks))
+            
+            # Generate embeddings
+            if not self.skip_embeddings and self.embedder:
+                chunked = await self._embed_chunks(source, chunked, result)
+            shared_ms = (time.perf_counter() - batch_started) * 1000 / max(len(chunked), 1)
+            
+            for record, chunks in chunked:
+                record_started = time.perf_counter()
+                try:
                     # Save to database
                     db_result = await self.db_integration.save_property_to_database(
                         record, chunks
@@ -245,9 +263,8 @@ class EnhancedIngestionPipeline:
                         result.errors.append(f"Failed to save record: {db_result.get('error')}")
                         
                 except Exception as e:
-                    result.failed += 1
-                    result.errors.append(f"Error processing record: {str(e)}")
-                    log_error(e, {"source": source, "record": record})
+                    self._record_failure(result, source, record, e)
+                result.per_record_ms.append(shared_ms + (time.perf_counter() - record_started) * 1000)
         
         self.logger.info(
             f"Property listings ingestion complete: {result.processed}/{result.total} processed, "
@@ -257,6 +274,53 @@ class EnhancedIngestionPipeline:
         
         return result
     
+    async def _embed_chunks(
+        self, source: str, chunked: List[Tuple[Dict[str, Any], List[Chunk]]], result: IngestionResult
+    ) -> List[Tuple[Dict[str, Any], List[Chunk]]]:
+        """
+        Embed the chunks of a batch of records with a single embedder call.
+        
+        The embedder sends the texts in requests of ``embedding_batch_size``,
+        so a record batch costs a few API round-trips instead of one per
+        record. If the combined call fails, records are retried one by one so
+        a bad record only fails itself.
+        
+        Args:
+            source: Source of the data
+            chunked: ``(record, chunks)`` pairs to embed
+            result: Ingestion result updated with embedding counts and failures
+            
+        Returns:
+            The pairs whose chunks were embedded
+        """
+        chunks = [chunk for _, record_chunks in chunked for chunk in record_chunks]
+        if not chunks:
+            return chunked
+        try:
+            embeddings, _ = await self.embedder.generate_embeddings_batch([chunk.content for chunk in chunks])
+        except Exception as e:
+            if len(chunked) == 1:
+                self._record_failure(result, source, chunked[0][0], e)
+                return []
+            self.logger.warning(f"Batch embedding failed, retrying record by record: {e}")
+            embedded = []
+            for pair in chunked:
+                embedded.extend(await self._embed_chunks(source, [pair], result))
+            return embedded
+        
+        # Update chunks with embeddings
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk.embedding = embedding
+        result.embeddings_generated += len(embeddings)
+        return chunked
+    
+    @staticmethod
+    def _record_failure(result: IngestionResult, source: str, record: Dict[str, Any], error: Exception) -> None:
+        """Count a record as failed and log the error."""
+        result.failed += 1
+        result.errors.append(f"Error processing record: {str(error)}")
+        log_error(error, {"source": source, "record": record})
+    
     async def validate_market_data(self, source: str, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate market data without saving to database.
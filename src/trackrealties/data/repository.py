@@ -103,6 +103,49 @@ class MessageRepository:
             data['metadata'] = json.loads(data['metadata'])
         return ConversationMessage(**data)
 
+    async def add_conversation_messages(self, messages: List[Dict[str, Any]]) -> List[ConversationMessage]:
+        """
+        Adds several messages to the conversation_messages table in one round-trip.
+
+        Each entry takes the keyword arguments of ``add_conversation_message``
+        plus an optional ``created_at``; rows without one are stamped with the
+        statement time. Messages are returned in the order given.
+        """
+        if not messages:
+            return []
+        rows = await self.conn.fetch(
+            """
+            INSERT INTO conversation_messages (
+                session_id, role, content, tools_used, validation_result,
+                confidence_score, processing_time_ms, token_count, metadata, created_at
+            )
+            SELECT session_id, role, content, tools_used, validation_result,
+                   confidence_score, processing_time_ms, token_count, metadata,
+                   COALESCE(created_at, NOW())
+            FROM unnest(
+                $1::uuid[], $2::text[], $3::text[], $4::jsonb[], $5::jsonb[],
+                $6::numeric[], $7::int[], $8::int[], $9::jsonb[], $10::timestamptz[]
+            ) WITH ORDINALITY AS m(
+                session_id, role, content, tools_used, validation_result,
+                confidence_score, processing_time_ms, token_count, metadata, created_at, position
+            )
+            ORDER BY position
+            RETURNING id, session_id, role, content, tools_used, validation_result, confidence_score, 
+                      processing_time_ms, token_count, metadata, created_at
+            """,
+            [m['session_id'] for m in messages],
+            [m['role'].value if isinstance(m['role'], Enum) else m['role'] for m in messages],
+            [m['content'] for m in messages],
+            [json.dumps(m.get('tools_used') or []) for m in messages],
+            [json.dumps(m['validation_result']) if m.get('validation_result') else None for m in messages],
+            [m.get('confidence_score') for m in messages],
+            [m.get('processing_time_ms') for m in messages],
+            [m.get('token_count') for m in messages],
+            [json.dumps(m.get('metadata') or {}) for m in messages],
+            [m.get('created_at') for m in messages]
+        )
+        return [ConversationMessage(**self._process_message_row(row)) for row in rows]
+
     async def get_conversation_history(
         self,
         session_id: UUID,
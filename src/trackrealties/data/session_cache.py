@@ -0,0 +1,68 @@
+"""
+In-process cache of active user sessions.
+
+Session lookups happen on every authenticated request; caching them briefly
+avoids a SELECT per request for the same session.
+"""
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional, Tuple
+from uuid import UUID
+
+from ..models.db import Session
+
+
+class SessionCache:
+    """
+    Bounded LRU of sessions with a time-to-live.
+
+    Only sessions that were found are cached, and an entry is never served
+    past its session's ``expires_at``. A session deactivated in the database
+    stays visible for up to ``ttl_seconds`` unless ``invalidate`` is called.
+    """
+
+    def __init__(self, max_entries: int = 50_000, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[UUID, Tuple[Session, float]]" = OrderedDict()
+
+    def get(self, session_id: UUID) -> Optional[Session]:
+        """Return the cached session, or None if absent or stale."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        session, cached_at = entry
+        if time.monotonic() - cached_at > self.ttl_seconds or self._has_expired(session):
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return session
+
+    def set(self, session: Session) -> None:
+        """Cache a session loaded from the database."""
+        self._entries[session.id] = (session, time.monotonic())
+        self._entries.move_to_end(session.id)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: UUID) -> None:
+        """Drop a session, e.g. after it is ended or updated."""
+        self._entries.pop(session_id, None)
+
+    async def get_or_load(
+        self, session_id: UUID, loader: Callable[[UUID], Awaitable[Optional[Session]]]
+    ) -> Optional[Session]:
+        """Return the cached session or load it with ``loader`` and cache the result."""
+        session = self.get(session_id)
+        if session is None:
+            session = await loader(session_id)
+            if session is not None:
+                self.set(session)
+        return session
+
+    @staticmethod
+    def _has_expired(session: Session) -> bool:
+        expires_at = session.expires_at
+        now = datetime.now(timezone.utc) if expires_at.tzinfo else datetime.utcnow()
+        return expires_at <= now
@@ -3,5 +3,15 @@ Utility functions for data processing.
 """
 
 from .field_mapping import normalize_property_data, normalize_market_data, normalize_batch_data
+from .json_records import iter_json_records, batched, load_json_file
+from .validation_cache import ValidationCache
 
-__all__ = ["normalize_property_data", "normalize_market_data", "normalize_batch_data"]
\ No newline at end of file
+__all__ = [
+    "normalize_property_data",
+    "normalize_market_data",
+    "normalize_batch_data",
+    "iter_json_records",
+    "batched",
+    "load_json_file",
+    "ValidationCache",
+]
\ No newline at end of file
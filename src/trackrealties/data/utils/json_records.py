@@ -0,0 +1,91 @@
+"""
+Record iteration for JSON data files.
+
+Large files are parsed incrementally with ijson (the ``perf`` extra) so only
+the records of the current batch are held in memory; without ijson, or for
+small files, the file is loaded in one go with orjson.
+"""
+
+import mmap
+import os
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+import orjson
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Files smaller than this are loaded whole, which is faster than incremental
+# parsing when memory is not a concern
+STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Parse a whole JSON file with orjson's native decoder.
+
+    The file is memory-mapped and parsed in place, so the only full-size
+    allocation is the parsed result rather than a copy of the file as well.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file; let orjson report the error
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _top_level_is_array(f) -> bool:
+    """Whether a binary JSON file starts with an array; rewinds the file."""
+    while True:
+        byte = f.read(1)
+        if not byte or not byte.isspace():
+            break
+    f.seek(0)
+    return byte == b"["
+
+
+def iter_json_records(file_path: str, require_array: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a JSON file.
+
+    A top-level array yields its elements; any other top-level value is
+    yielded as a single record.
+
+    Args:
+        file_path: Path to the JSON file
+        require_array: Reject files whose top level is not an array
+
+    Raises:
+        ValueError: If ``require_array`` is set and the file is not an array
+    """
+    if IJSON_AVAILABLE and os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES:
+        with open(file_path, "rb") as f:
+            is_array = _top_level_is_array(f)
+            if require_array and not is_array:
+                raise ValueError("File must contain a JSON array of records")
+            yield from ijson.items(f, "item" if is_array else "", use_float=True)
+        return
+
+    data = load_json_file(file_path)
+    if isinstance(data, list):
+        yield from data
+    elif require_array:
+        raise ValueError("File must contain a JSON array of records")
+    else:
+        yield data
+
+
+def batched(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group records into lists of ``size`` (the last may be shorter)."""
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
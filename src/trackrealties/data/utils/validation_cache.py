@@ -0,0 +1,48 @@
+"""
+On-disk cache of dry-run validation results.
+
+Entries are keyed by a hash of the input file's bytes plus the parameters
+that affect validation, so re-validating an unchanged file costs one read
+and hash instead of a parse and a validation pass.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+_READ_BLOCK_SIZE = 1 << 20
+
+
+class ValidationCache:
+    """Validation results stored as JSON files named by their cache key."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def key(self, file_path: str, *params: Any) -> str:
+        """BLAKE2b digest of the file contents and ``params``."""
+        digest = hashlib.blake2b(digest_size=32)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+                digest.update(block)
+        for param in params:
+            digest.update(b"\0" + str(param).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result, or None if there is no usable entry."""
+        try:
+            return orjson.loads((self.cache_dir / f"{key}.json").read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result; the file is replaced atomically."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(result, default=str))
+        os.replace(tmp_path, path)
@@ -2,21 +2,52 @@
 """
 Embedder implementations for the RAG module.
 """
+import asyncio
+import hashlib
 import logging
-from typing import List
+from collections import OrderedDict
+from typing import Dict, List, Set, Tuple
 from openai import AsyncOpenAI
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU of query embeddings keyed by SHA-256 of (model, text), shared
+# by every embedder instance so repeated queries skip the API round-trip.
+_QUERY_CACHE_MAX_SIZE = 4096
+_query_embedding_cache: "OrderedDict[bytes, Tuple[float, ...]]" = OrderedDict()
+
+
+def _query_cache_key(model: str, text: str) -> bytes:
+    return hashlib.sha256(f"{model}\0{text}".encode()).digest()
+
+
+def _cache_query_embedding(key: bytes, embedding: Tuple[float, ...]) -> None:
+    _query_embedding_cache[key] = embedding
+    if len(_query_embedding_cache) > _QUERY_CACHE_MAX_SIZE:
+        _query_embedding_cache.popitem(last=False)
+
 class DefaultEmbedder:
-    """Default embedder using OpenAI."""
+    """
+    Default embedder using OpenAI.
+
+    Uncached queries embedded concurrently are micro-batched: they are queued
+    for up to ``EMBEDDING_QUERY_BATCH_WAIT_MS`` (or until
+    ``EMBEDDING_QUERY_BATCH_MAX`` distinct texts are waiting) and sent in one
+    embeddings request. Concurrent requests for the same text share a result.
+    """
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.client = None
         self.model = settings.EMBEDDING_MODEL
         self.initialized = False
+        self.batch_max_size = settings.EMBEDDING_QUERY_BATCH_MAX
+        self.batch_wait_seconds = settings.EMBEDDING_QUERY_BATCH_WAIT_MS / 1000
+        # text -> future resolved with its embedding once the batch returns
+        self._pending: Dict[str, "asyncio.Future[Tuple[float, ...]]"] = {}
+        self._flush_timer: "asyncio.TimerHandle | None" = None
+        self._batch_tasks: Set[asyncio.Task] = set()
 
     async def initialize(self):
         """Initialize the OpenAI client."""
@@ -26,15 +57,59 @@ class DefaultEmbedder:
             self.logger.info(f"Initialized OpenAI embedder with model: {self.model}")
 
     async def embed_query(self, text: str) -> List[float]:
-        """Embed a single query."""
+        """Embed a single query, reusing cached embeddings for repeated text."""
+        key = _query_cache_key(self.model, text)
+        cached = _query_embedding_cache.get(key)
+        if cached is not None:
+            _query_embedding_cache.move_to_end(key)
+            return list(cached)
+
         if not self.initialized:
             await self.initialize()
-        
-        response = await self.client.embeddings.create(
-            input=[text],
-            model=self.model
-        )
-        return response.data[0].embedding
+
+        future = self._pending.get(text)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[text] = future
+            if len(self._pending) >= self.batch_max_size:
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = loop.call_later(self.batch_wait_seconds, self._flush_pending)
+
+        # Shielded so a cancelled caller doesn't cancel the result for others
+        return list(await asyncio.shield(future))
+
+    def _flush_pending(self) -> None:
+        """Send the queued query texts as one embeddings request."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._embed_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _embed_batch(self, batch: Dict[str, "asyncio.Future[Tuple[float, ...]]"]) -> None:
+        texts = list(batch)
+        try:
+            response = await self.client.embeddings.create(
+                input=texts,
+                model=self.model
+            )
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, data in zip(texts, response.data):
+            embedding = tuple(data.embedding)
+            _cache_query_embedding(_query_cache_key(self.model, text), embedding)
+            future = batch[text]
+            if not future.done():
+                future.set_result(embedding)
 
     async def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Embed a list of documents."""
@@ -0,0 +1,255 @@
+"""
+In-memory embedding index for the RAG module.
+
+Holds chunk embeddings as one contiguous, L2-normalised ``float32`` matrix with
+parallel per-row metadata lists, so a query is scored against every chunk with a
+single matrix-vector product instead of a per-query database scan.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def parse_embedding(value: Union[str, Sequence[float], np.ndarray]) -> np.ndarray:
+    """Convert a pgvector value (text like ``'[0.1,0.2]'`` or a sequence) to ``float32``."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def metadata_text(value: Any) -> Optional[str]:
+    """
+    Text form of a metadata value, as Postgres ``metadata->>key`` returns it.
+
+    Strings are returned as-is, missing/``null`` values as ``None`` and
+    everything else as JSON text, so filters compare the same way in SQL and
+    in memory.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def cosine_scores(matrix: np.ndarray, query: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Score L2-normalised rows of ``matrix`` against a normalised ``query``.
+
+    This is a single BLAS matrix-vector product; passing ``out`` reuses a
+    preallocated buffer instead of allocating a new score array per query.
+    """
+    return np.matmul(matrix, query, out=out)
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetric per-vector int8 quantisation.
+
+    Returns the int8 codes and the ``float32`` scale of each vector, so that
+    ``codes * scale`` approximates the input.
+    """
+    scales = np.abs(vectors).max(axis=-1) / 127.0
+    scales = np.where(scales == 0, 1.0, scales).astype(np.float32)
+    codes = np.rint(vectors / np.expand_dims(scales, -1)).astype(np.int8)
+    return codes, scales
+
+
+def quantized_cosine_scores(
+    codes: np.ndarray,
+    scales: np.ndarray,
+    query: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Approximate :func:`cosine_scores` for int8-quantised rows.
+
+    The query is quantised the same way, dot products are accumulated in int32
+    and rescaled by the row and query scales.
+    """
+    query_codes, query_scale = quantize_int8(query)
+    dots = np.einsum("ij,j->i", codes, query_codes, dtype=np.int32)
+    out = np.multiply(dots, scales, out=out, dtype=np.float32)
+    out *= query_scale
+    return out
+
+
+class InMemoryEmbeddingIndex:
+    """
+    Structure-of-arrays store of chunk embeddings and their metadata.
+
+    Rows are appended incrementally; the backing matrix grows geometrically so
+    inserts are amortised O(D) rather than a full reload. Scores are written
+    into a reused buffer, so a single index must not be searched from several
+    threads at once.
+
+    With ``quantization="int8"`` rows are stored as int8 codes plus one scale
+    per row, a quarter of the float32 footprint, at the cost of slightly
+    approximate similarities.
+    """
+
+    QUANTIZATION_MODES = ("none", "int8")
+
+    def __init__(self, initial_capacity: int = 1024, quantization: str = "none"):
+        if quantization not in self.QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization mode: {quantization}")
+        self._initial_capacity = initial_capacity
+        self.quantization = quantization
+        self._matrix: Optional[np.ndarray] = None
+        self._row_scales: Optional[np.ndarray] = None
+        self._scores: Optional[np.ndarray] = None
+        self._size = 0
+        self.ids: List[str] = []
+        self.contents: List[str] = []
+        self.result_types: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.sources: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        """Drop all rows and mark the index as not loaded."""
+        self._matrix = None
+        self._row_scales = None
+        self._scores = None
+        self._size = 0
+        self.ids.clear()
+        self.contents.clear()
+        self.result_types.clear()
+        self.titles.clear()
+        self.sources.clear()
+        self.metadata.clear()
+        self.loaded = False
+
+    def _reserve(self, dimensions: int, extra: int):
+        needed = self._size + extra
+        dtype = np.int8 if self.quantization == "int8" else np.float32
+        if self._matrix is None:
+            capacity = max(self._initial_capacity, needed)
+            self._matrix = np.empty((capacity, dimensions), dtype=dtype)
+            self._row_scales = np.empty(capacity, dtype=np.float32)
+            self._scores = np.empty(capacity, dtype=np.float32)
+            return
+        if self._matrix.shape[1] != dimensions:
+            raise ValueError(
+                f"Embedding dimension mismatch: index has {self._matrix.shape[1]}, got {dimensions}"
+            )
+        capacity = self._matrix.shape[0]
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            grown = np.empty((capacity, dimensions), dtype=dtype)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+            grown_scales = np.empty(capacity, dtype=np.float32)
+            grown_scales[:self._size] = self._row_scales[:self._size]
+            self._row_scales = grown_scales
+            self._scores = np.empty(capacity, dtype=np.float32)
+
+    def add(self, rows: Iterable[Dict[str, Any]]):
+        """
+        Append rows to the index.
+
+        Each row needs ``result_id``, ``content`` and ``embedding``; ``result_type``,
+        ``title``, ``source`` and ``metadata`` are optional.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+
+        vectors = np.stack([parse_embedding(row["embedding"]) for row in rows])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+
+        self._reserve(vectors.shape[1], len(rows))
+        start, end = self._size, self._size + len(rows)
+        if self.quantization == "int8":
+            self._matrix[start:end], self._row_scales[start:end] = quantize_int8(vectors)
+        else:
+            self._matrix[start:end] = vectors
+        self._size = end
+
+        for row in rows:
+            metadata = row.get("metadata") or {}
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            self.ids.append(row["result_id"])
+            self.contents.append(row["content"])
+            self.result_types.append(row.get("result_type", "document"))
+            self.titles.append(row.get("title"))
+            self.sources.append(row.get("source", "Vector Index"))
+            self.metadata.append(metadata)
+
+    def search(
+        self,
+        query_embedding: Union[Sequence[float], np.ndarray],
+        limit: int = 10,
+        threshold: float = 0.0,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Return ``(row, similarity)`` pairs for the top ``limit`` rows above ``threshold``.
+
+        Filters match ``metadata[key]`` against the string form of each value,
+        mirroring the ``metadata->>'key' = value`` SQL predicate.
+        """
+        if not self._size or limit <= 0:
+            return []
+
+        query = parse_embedding(query_embedding)
+        norm = np.linalg.norm(query)
+        if not norm:
+            return []
+        query = query / norm
+
+        # Metadata filters are applied before scoring, so only matching rows
+        # are multiplied against the query
+        rows = self._filter_rows(filters) if filters else None
+        if rows is None:
+            matrix = self._matrix[:self._size]
+            row_scales = self._row_scales[:self._size]
+        elif rows.size:
+            matrix = self._matrix[rows]
+            row_scales = self._row_scales[rows]
+        else:
+            return []
+
+        out = self._scores[:len(matrix)]
+        if self.quantization == "int8":
+            scores = quantized_cosine_scores(matrix, row_scales, query, out=out)
+        else:
+            scores = cosine_scores(matrix, query, out=out)
+
+        candidates = np.flatnonzero(scores > threshold)
+        if candidates.size > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        if rows is None:
+            return [(int(row), float(scores[row])) for row in order]
+        return [(int(rows[i]), float(scores[i])) for i in order]
+
+    def _filter_rows(self, filters: Dict[str, Any]) -> np.ndarray:
+        """Indices of the rows whose metadata matches every filter."""
+        # Compared like ``metadata->>key = value`` in SQL, so a missing or
+        # null value on either side never matches
+        wanted = [(key, metadata_text(value)) for key, value in filters.items()]
+        if any(text is None for _, text in wanted):
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(
+            np.fromiter(
+                (
+                    all(metadata_text(meta.get(key)) == text for key, text in wanted)
+                    for meta in self.metadata
+                ),
+                dtype=bool,
+                count=self._size,
+            )
+        )
@@ -6,18 +6,45 @@ for the TrackRealties AI Platform.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 import asyncio
 
 from ..core.database import db_pool
 from ..core.config import get_settings
 from ..models.search import SearchResult, SearchQuery, SearchFilters
 from ..rag.embedders import DefaultEmbedder
+from ..rag.embedding_index import metadata_text
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def metadata_filter_clause(
+    filters: Optional[Dict[str, Any]], first_param: int
+) -> Tuple[str, List[str]]:
+    """
+    Build a ``WHERE`` clause matching chunk metadata against ``filters``.
+
+    Keys and values are both bound as query parameters starting at
+    ``$first_param``, so the filter is applied inside the KNN scan and
+    caller-supplied keys never reach the SQL text. Non-string values are
+    compared in their JSON text form, as ``metadata->>key`` returns them.
+
+    Returns:
+        The clause (empty without filters) and its parameter values
+    """
+    if not filters:
+        return "", []
+    clauses = []
+    values: List[str] = []
+    for key, value in filters.items():
+        param = first_param + len(values)
+        clauses.append(f"metadata->>${param} = ${param + 1}")
+        values.append(str(key))
+        values.append(metadata_text(value))
+    return "WHERE " + " AND ".join(clauses), values
+
+
 class VectorSearch:
     """
     Vector-based semantic search using pgvector.
@@ -64,37 +91,31 @@ class VectorSearch:
         query_embedding = await self.embedder.embed_query(query)
         query_embedding_str = str(query_embedding)
 
-        # Build the filter query
-        filter_clauses = []
-        filter_values = []
-        if filters:
-            for key, value in filters.items():
-                filter_clauses.append(f"metadata->>'{key}' = ${len(filter_values) + 3}")
-                filter_values.append(value)
-        
-        filter_query = " AND ".join(filter_clauses)
-        if filter_query:
-            filter_query = "AND " + filter_query
+        # Build the filter query; $1-$3 are embedding, threshold and limit
+        where_clause, filter_values = metadata_filter_clause(filters, first_param=4)
 
         async with db_pool.acquire() as conn:
             # The l2_distance operator is <->
             # The inner_product operator is <#>
             # The cosine_distance operator is <=>
+            # Ordering by the raw distance lets the ivfflat index answer the KNN
+            # scan; the similarity threshold is applied to the k nearest rows.
             # Query both property_chunks and market_chunks and combine them
             property_results = await conn.fetch(
                 f"""
-                SELECT
-                    id,
-                    content,
-                    1 - (embedding <=> $1) AS similarity
-                FROM
-                    property_chunks
-                WHERE
-                    1 - (embedding <=> $1) > $2
-                    {filter_query}
-                ORDER BY
-                    similarity DESC
-                LIMIT $3
+                SELECT * FROM (
+                    SELECT
+                        id,
+                        content,
+                        1 - (embedding <=> $1) AS similarity
+                    FROM
+                        property_chunks
+                    {where_clause}
+                    ORDER BY
+                        embedding <=> $1
+                    LIMIT $3
+                ) AS knn
+                WHERE similarity > $2
                 """,
                 query_embedding_str,
                 threshold,
@@ -104,18 +125,19 @@ class VectorSearch:
 
             market_results = await conn.fetch(
                 f"""
-                SELECT
-                    id,
-                    content,
-                    1 - (embedding <=> $1) AS similarity
-                FROM
-                    market_chunks
-                WHERE
-                    1 - (embedding <=> $1) > $2
-                    {filter_query}
-                ORDER BY
-                    similarity DESC
-                LIMIT $3
+                SELECT * FROM (
+                    SELECT
+                        id,
+                        content,
+                        1 - (embedding <=> $1) AS similarity
+                    FROM
+                        market_chunks
+                    {where_clause}
+                    ORDER BY
+                        embedding <=> $1
+                    LIMIT $3
+                ) AS knn
+                WHERE similarity > $2
                 """,
                 query_embedding_str,
                 threshold,
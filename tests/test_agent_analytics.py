@@ -0,0 +1,28 @@
+"""
+Unit tests for the Real Estate Agent analytics tools.
+"""
+from src.trackrealties.analytics.agent import AgentAnalyticsTools
+
+
+def test_perform_cma_averages_known_comparables():
+    result = AgentAnalyticsTools.perform_cma("subject", ["prop1", "prop2", "unknown"])
+
+    assert result["estimated_value"] == 325000
+    assert result["price_per_sqft"] == round((300000 / 1500 + 350000 / 1600) / 2, 2)
+
+
+def test_perform_cma_caches_by_comparable_set():
+    AgentAnalyticsTools._perform_cma_cached.cache_clear()
+
+    first = AgentAnalyticsTools.perform_cma("subject", ["prop1", "prop3"])
+    first["estimated_value"] = -1
+    second = AgentAnalyticsTools.perform_cma("subject", ["prop3", "prop1"])
+
+    assert second["estimated_value"] == 310000
+    assert AgentAnalyticsTools._perform_cma_cached.cache_info().hits == 1
+
+
+def test_perform_cma_counts_duplicate_comparables():
+    result = AgentAnalyticsTools.perform_cma("subject", ["prop1", "prop1", "prop4"])
+
+    assert result["estimated_value"] == round((300000 * 2 + 400000) / 3, 2)
@@ -0,0 +1,19 @@
+"""
+Unit tests for the analytics routes' CMA listing query.
+"""
+from src.trackrealties.api.routes.analytics import _CMA_LISTING_COLUMNS
+from src.trackrealties.models.property import PropertyListing
+
+
+def test_cma_listing_columns_cover_required_listing_fields():
+    aliases = {
+        column.split(" AS ")[-1].strip().strip('"')
+        for column in _CMA_LISTING_COLUMNS.split(",")
+    }
+    required = {
+        field.alias or name
+        for name, field in PropertyListing.model_fields.items()
+        if field.is_required()
+    }
+
+    assert required <= aliases
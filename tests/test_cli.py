@@ -0,0 +1,98 @@
+"""
+Unit tests for the CLI commands in cli.py.
+"""
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.trackrealties.data.utils import ValidationCache
+
+# cli.py is shadowed by the cli/ package, so it is loaded from its path
+_CLI_PATH = Path(__file__).resolve().parents[1] / "src" / "trackrealties" / "cli.py"
+
+
+@pytest.fixture
+def cli_module(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("src.trackrealties._cli_script", _CLI_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "validation_cache", ValidationCache(str(tmp_path / "cache")))
+    return module
+
+
+def test_enhanced_ingest_dry_run_validates_and_caches(cli_module, tmp_path):
+    path = tmp_path / "listings.json"
+    path.write_text(json.dumps([
+        {"property_id": "1", "property_type": "house", "status": "active", "price": 350000},
+        {"property_id": "2", "price": "unknown"},
+    ]))
+    max_chunk_size = cli_module.settings.max_chunk_size
+    args = ["enhanced-ingest", str(path), "--data-type", "property", "--dry-run", "--max-chunk-size", "1500"]
+
+    first = CliRunner().invoke(cli_module.cli, args)
+
+    assert first.exit_code == 0, first.output
+    assert "Total Records: 2" in first.output
+    assert "Valid Records: 1" in first.output
+    assert "Success Rate: 50.00%" in first.output
+    assert "max_size=1500" in first.output
+    assert cli_module.settings.max_chunk_size == max_chunk_size
+
+    second = CliRunner().invoke(cli_module.cli, args)
+
+    assert second.exit_code == 0, second.output
+    assert "Using cached validation results" in second.output
+    assert "Loading data" not in second.output
+    assert "Valid Records: 1" in second.output
+
+
+@pytest.mark.asyncio
+async def test_ingest_in_batches_reads_a_batch_only_when_a_slot_is_free(cli_module, monkeypatch):
+    from src.trackrealties.data.enhanced_ingestion_pipeline import IngestionResult
+
+    monkeypatch.setattr(cli_module, "_BATCH_START_JITTER_SECONDS", 0)
+    read = []
+    in_flight = []
+
+    def records():
+        for i in range(6):
+            read.append(i)
+            yield {"id": i}
+
+    async def ingest(source, batch):
+        in_flight.append(len(read))
+        await asyncio.sleep(0)
+        return IngestionResult(total=len(batch), processed=len(batch), failed=0, chunks_created=0,
+                               embeddings_generated=0, graph_nodes_created=0)
+
+    result = await cli_module._ingest_in_batches(ingest, "test", records(), batch_size=1, max_in_flight=2)
+
+    assert result.total == result.processed == 6
+    # Each batch starts with at most two batches read ahead of the finished ones
+    assert max(count - done for done, count in enumerate(in_flight)) <= 2
+
+
+@pytest.mark.asyncio
+async def test_ingest_in_batches_stops_reading_after_a_failed_batch(cli_module, monkeypatch):
+    from src.trackrealties.data.enhanced_ingestion_pipeline import IngestionResult
+
+    monkeypatch.setattr(cli_module, "_BATCH_START_JITTER_SECONDS", 0)
+
+    async def ingest(source, batch):
+        if batch[0]["id"] == 0:
+            raise RuntimeError("embedding failed")
+        return IngestionResult(total=len(batch), processed=len(batch), failed=0, chunks_created=0,
+                               embeddings_generated=0, graph_nodes_created=0)
+
+    records = [{"id": i} for i in range(10)]
+    result = await cli_module._ingest_in_batches(ingest, "test", records, batch_size=2, max_in_flight=1)
+
+    assert (result.total, result.failed) == (2, 2)
+    assert result.errors[0] == "Error processing batch: embedding failed"
+    assert "ingestion stopped" in result.errors[-1]
@@ -0,0 +1,106 @@
+"""
+Unit tests for the Comparative Market Analysis engine.
+"""
+import gc
+
+import numpy as np
+import pytest
+
+from src.trackrealties.analytics import cma_engine
+from src.trackrealties.analytics.cma_engine import ComparativeMarketAnalysis
+from src.trackrealties.models.property import PropertyListing
+
+
+def _listing(listing_id, price, sqft=None, bedrooms=None, bathrooms=None, year_built=None, zip_code="78701"):
+    return PropertyListing(
+        id=listing_id,
+        formattedAddress=f"{listing_id} Main St",
+        city="Austin",
+        state="TX",
+        zipCode=zip_code,
+        propertyType="Single Family",
+        status="Active",
+        price=price,
+        squareFootage=sqft,
+        bedrooms=bedrooms,
+        bathrooms=bathrooms,
+        yearBuilt=year_built,
+        source="test",
+    )
+
+
+def test_generate_cma_applies_adjustments():
+    subject = _listing("subject", 400000, sqft=2000, bedrooms=3, bathrooms=2, year_built=2000)
+    comps = [
+        _listing("comp_1", 380000, sqft=1900, bedrooms=3, bathrooms=2, year_built=1995),
+        _listing("comp_2", 420000, sqft=2100, bedrooms=4, bathrooms=2, year_built=2005, zip_code="78702"),
+        _listing("comp_3", 390000),
+    ]
+
+    report = ComparativeMarketAnalysis().generate_cma(subject, comps)
+
+    first, second, third = report["comparable_properties"]
+    assert first["adjustments"] == pytest.approx({
+        "squareFootage": 100 * (380000 / 1900) * 0.8,
+        "bedrooms": 0,
+        "bathrooms": 0,
+        "age": -5000,
+    })
+    assert second["adjustments"]["bedrooms"] == -15000
+    assert second["adjustments"]["location"] == 0
+    assert third["adjustments"] == {}
+    assert third["adjusted_price"] == 390000
+    assert third["price_per_sqft"] == 0
+
+    adjusted = [comp["adjusted_price"] for comp in report["comparable_properties"]]
+    assert report["value_range"]["low"] == min(adjusted)
+    assert report["value_range"]["high"] == max(adjusted)
+    assert report["estimated_value"] == pytest.approx(sum(adjusted) / 3, abs=0.01)
+    assert report["confidence_score"] == round(report["confidence_score"], 2)
+
+
+def test_generate_cma_requires_comparables():
+    subject = _listing("subject", 400000)
+
+    with pytest.raises(ValueError):
+        ComparativeMarketAnalysis().generate_cma(subject, [])
+
+
+def test_confidence_score_uses_price_dispersion():
+    engine = ComparativeMarketAnalysis()
+
+    assert engine._calculate_confidence_score(np.array([100.0, 100.0])) == 0.6
+    assert engine._calculate_confidence_score(np.array([100.0, 100.0, 100.0])) == 1.0
+    assert engine._calculate_confidence_score(np.array([90.0, 100.0, 110.0])) == pytest.approx(1 - np.sqrt(200 / 3) / 100)
+
+
+def test_listing_columns_are_cached_per_listing():
+    listing = _listing("comp", 300000, sqft=1500, bedrooms=0)
+    key = id(listing)
+
+    columns = cma_engine._listing_columns(listing)
+
+    assert cma_engine._listing_columns(listing) is columns
+    np.testing.assert_array_equal(columns, [300000.0, 1500.0, np.nan, np.nan, np.nan])
+
+    del listing, columns
+    gc.collect()
+    assert key not in cma_engine._LISTING_COLUMNS
+
+
+def test_generate_cma_batch_matches_list_entry_point():
+    subject = _listing("subject", 400000, sqft=2000, bedrooms=3, bathrooms=2, year_built=2000)
+    comps = [
+        _listing("comp_1", 380000, sqft=1900, bedrooms=3, bathrooms=2, year_built=1995),
+        _listing("comp_2", 420000, sqft=2100, bedrooms=4, bathrooms=2, year_built=2005, zip_code="78702"),
+    ]
+    batch = cma_engine.PropertyListingBatch.from_listings(comps)
+
+    engine = ComparativeMarketAnalysis()
+    from_batch = engine.generate_cma_batch(subject, batch)
+    from_list = engine.generate_cma(subject, comps)
+
+    assert len(batch) == 2 and batch[1] is comps[1]
+    np.testing.assert_array_equal(batch.prices, [380000.0, 420000.0])
+    assert from_batch["estimated_value"] == from_list["estimated_value"]
+    assert from_batch["comparable_properties"][1]["adjustments"] == from_list["comparable_properties"][1]["adjustments"]
@@ -1,4 +1,5 @@
-from src.trackrealties.agents.context import ContextManager
+from src.trackrealties.agents.context import ContextManager, Message
+from src.trackrealties.models.enums import MessageRole
 
 
 def test_context_persistence():
@@ -9,3 +10,36 @@ def test_context_persistence():
 
     ctx2 = cm.get_or_create_context("s2", user_id="u1", user_role="investor")
     assert ctx2.user_preferences.get("budget") == "$100k"
+
+
+def test_context_stats_track_messages_and_roles():
+    cm = ContextManager()
+    ctx = cm.get_or_create_context("s1", user_id="u1", user_role="investor")
+    ctx.add_message(Message(session_id="s1", role=MessageRole.USER, content="hi"))
+    ctx.add_message(Message(session_id="s1", role=MessageRole.USER, content="again"))
+    cm.get_or_create_context("s2", user_id="u2")
+
+    stats = cm.get_context_stats()
+    assert stats["total_contexts"] == 2
+    assert stats["average_messages_per_context"] == 1.0
+    assert stats["role_distribution"] == {"investor": 1, "unknown": 1}
+
+    cm.get_or_create_user_profile("u2", "buyer")
+    cm.clear_context("s1")
+    stats = cm.get_context_stats()
+    assert stats["total_contexts"] == 1
+    assert stats["average_messages_per_context"] == 0.0
+    assert stats["role_distribution"] == {"investor": 1, "buyer": 1}
+
+
+def test_context_stats_count_expired_contexts_without_evicting_them():
+    cm = ContextManager(default_expiration_hours=-1)
+    cm.get_or_create_context("s1", user_id="u1", user_role="investor")
+    cm.get_or_create_context("s2", user_id="u2", user_role="buyer")
+    cm.contexts["s2"].extend_expiration(hours=1)
+
+    stats = cm.get_context_stats()
+
+    assert stats["total_contexts"] == 2
+    assert stats["active_contexts"] == 1
+    assert "s1" in cm.contexts
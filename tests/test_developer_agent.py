@@ -39,3 +39,17 @@ async def test_developer_agent_run():
     assert response.content == "This is a test response from the developer agent."
     assert response.validation_result is not None
     mock_rag_pipeline.generate_response.assert_called_once()
+
+
+def test_construction_cost_estimate_batch_matches_rates():
+    """
+    Tests vectorised construction cost estimation across parcels.
+    """
+    import numpy as np
+    from src.trackrealties.agents.tools import ConstructionCostEstimationTool
+
+    costs = ConstructionCostEstimationTool.estimate_costs(
+        np.array([1000, 1000, 2000]), np.array(["low", "unknown", "high"])
+    )
+
+    np.testing.assert_array_equal(costs, [150000, 250000, 800000])
@@ -0,0 +1,69 @@
+"""
+Unit tests for query embedding batching in DefaultEmbedder.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.trackrealties.rag import embedders
+from src.trackrealties.rag.embedders import DefaultEmbedder
+
+
+class _FakeEmbeddings:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    async def create(self, input, model):
+        self.calls.append(list(input))
+        if self.fail:
+            raise RuntimeError("embedding API down")
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(text))]) for text in input])
+
+
+def _embedder(monkeypatch, fail=False):
+    monkeypatch.setattr(embedders, "_query_embedding_cache", embedders.OrderedDict())
+    embedder = DefaultEmbedder()
+    embedder.client = SimpleNamespace(embeddings=_FakeEmbeddings(fail))
+    embedder.initialized = True
+    return embedder
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_request(monkeypatch):
+    embedder = _embedder(monkeypatch)
+
+    results = await asyncio.gather(
+        embedder.embed_query("a"), embedder.embed_query("bb"), embedder.embed_query("a")
+    )
+
+    assert results == [[1.0], [2.0], [1.0]]
+    assert embedder.client.embeddings.calls == [["a", "bb"]]
+    # Results are cached, so a repeat skips the API
+    assert await embedder.embed_query("bb") == [2.0]
+    assert len(embedder.client.embeddings.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting(monkeypatch):
+    embedder = _embedder(monkeypatch)
+    embedder.batch_max_size = 2
+    embedder.batch_wait_seconds = 60
+
+    results = await asyncio.wait_for(
+        asyncio.gather(embedder.embed_query("a"), embedder.embed_query("bb")), timeout=1
+    )
+
+    assert results == [[1.0], [2.0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_reaches_every_caller(monkeypatch):
+    embedder = _embedder(monkeypatch, fail=True)
+
+    results = await asyncio.gather(
+        embedder.embed_query("a"), embedder.embed_query("bb"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
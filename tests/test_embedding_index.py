@@ -0,0 +1,83 @@
+"""
+Unit tests for the in-memory embedding index.
+"""
+from src.trackrealties.rag.embedding_index import InMemoryEmbeddingIndex
+
+
+def _rows():
+    return [
+        {"result_id": "property_1", "content": "a", "embedding": "[1, 0, 0]", "metadata": {"city": "Austin"}},
+        {"result_id": "property_2", "content": "b", "embedding": [0.9, 0.1, 0], "metadata": '{"city": "Dallas"}'},
+        {"result_id": "market_1", "content": "c", "embedding": [0, 1, 0], "metadata": {"city": "Austin"}},
+    ]
+
+
+def test_index_ranks_by_cosine_similarity():
+    index = InMemoryEmbeddingIndex(initial_capacity=1)
+    index.add(_rows())
+
+    results = index.search([1.0, 0.0, 0.0], limit=2, threshold=0.5)
+
+    assert [index.ids[row] for row, _ in results] == ["property_1", "property_2"]
+    assert results[0][1] > results[1][1]
+
+
+def test_index_applies_metadata_filters_and_threshold():
+    index = InMemoryEmbeddingIndex()
+    index.add(_rows())
+
+    results = index.search([1.0, 0.0, 0.0], limit=5, threshold=-1.0, filters={"city": "Austin"})
+
+    assert [index.ids[row] for row, _ in results] == ["property_1", "market_1"]
+    assert index.search([1.0, 0.0, 0.0], limit=5, threshold=0.995) == [(0, 1.0)]
+
+
+def test_index_appends_incrementally():
+    index = InMemoryEmbeddingIndex(initial_capacity=1)
+    index.add(_rows()[:1])
+    index.add(_rows()[1:])
+
+    assert len(index) == 3
+    assert index.ids == ["property_1", "property_2", "market_1"]
+
+
+def test_int8_index_matches_float_ranking():
+    float_index = InMemoryEmbeddingIndex()
+    int8_index = InMemoryEmbeddingIndex(quantization="int8")
+    float_index.add(_rows())
+    int8_index.add(_rows())
+
+    query = [0.95, 0.2, 0.1]
+    expected = float_index.search(query, limit=3, threshold=-1.0)
+    actual = int8_index.search(query, limit=3, threshold=-1.0)
+
+    assert [row for row, _ in actual] == [row for row, _ in expected]
+    for (_, approx), (_, exact) in zip(actual, expected):
+        assert abs(approx - exact) < 0.02
+
+
+def test_filtered_search_reports_index_rows():
+    for quantization in InMemoryEmbeddingIndex.QUANTIZATION_MODES:
+        index = InMemoryEmbeddingIndex(quantization=quantization)
+        index.add(_rows())
+
+        results = index.search([0.0, 1.0, 0.0], limit=1, threshold=-1.0, filters={"city": "Austin"})
+
+        assert [row for row, _ in results] == [2]
+        assert index.search([0.0, 1.0, 0.0], filters={"city": "Houston"}) == []
+
+
+def test_filters_compare_values_in_json_text_form():
+    index = InMemoryEmbeddingIndex()
+    index.add([
+        {"result_id": "a", "content": "a", "embedding": [1, 0], "metadata": {"pool": True, "beds": 3}},
+        {"result_id": "b", "content": "b", "embedding": [1, 0], "metadata": {"pool": "True", "beds": "3"}},
+    ])
+
+    def ids(filters):
+        return [index.ids[row] for row, _ in index.search([1.0, 0.0], threshold=-1.0, filters=filters)]
+
+    assert ids({"pool": True}) == ["a"]
+    assert ids({"pool": "true"}) == ["a"]
+    assert ids({"beds": 3}) == ["a", "b"]
+    assert ids({"missing": None}) == []
@@ -0,0 +1,72 @@
+"""
+Unit tests for embedding fan-in in the enhanced ingestion pipeline.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src.trackrealties.data.enhanced_ingestion_pipeline import EnhancedIngestionPipeline
+
+
+class _FakeChunker:
+    def chunk_json(self, record, data_type):
+        return [SimpleNamespace(content=f"{record['id']}-{i}", embedding=None) for i in range(2)]
+
+
+class _FakeEmbedder:
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    async def generate_embeddings_batch(self, texts):
+        self.calls.append(list(texts))
+        if any(text.startswith(f"{self.fail_on}-") for text in texts):
+            raise RuntimeError("embedding failed")
+        return [[float(len(text))] for text in texts], [1] * len(texts)
+
+
+class _FakeDatabase:
+    def __init__(self):
+        self.saved = []
+
+    async def save_property_to_database(self, record, chunks):
+        self.saved.append((record["id"], [chunk.embedding for chunk in chunks]))
+        return {"success": True}
+
+
+def _pipeline(embedder):
+    pipeline = EnhancedIngestionPipeline(batch_size=10, skip_graph=True)
+    pipeline.chunker = _FakeChunker()
+    pipeline.embedder = embedder
+    pipeline.db_integration = _FakeDatabase()
+    pipeline.initialized = True
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_batch_chunks_are_embedded_in_one_call():
+    embedder = _FakeEmbedder()
+    pipeline = _pipeline(embedder)
+
+    result = await pipeline.ingest_property_listings("test", [{"id": "a"}, {"id": "b"}, {"id": "c"}])
+
+    assert embedder.calls == [["a-0", "a-1", "b-0", "b-1", "c-0", "c-1"]]
+    assert result.processed == 3
+    assert result.embeddings_generated == 6
+    assert pipeline.db_integration.saved[1] == ("b", [[3.0], [3.0]])
+    assert len(result.per_record_ms) == 3
+    assert all(ms >= 0 for ms in result.per_record_ms)
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_embedding_only_fails_bad_record(monkeypatch):
+    monkeypatch.setattr(
+        "src.trackrealties.data.enhanced_ingestion_pipeline.log_error", lambda error, context: None
+    )
+    pipeline = _pipeline(_FakeEmbedder(fail_on="b"))
+
+    result = await pipeline.ingest_property_listings("test", [{"id": "a"}, {"id": "b"}, {"id": "c"}])
+
+    assert result.processed == 2
+    assert result.failed == 1
+    assert [record_id for record_id, _ in pipeline.db_integration.saved] == ["a", "c"]
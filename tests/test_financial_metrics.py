@@ -0,0 +1,109 @@
+"""
+Unit tests for the core financial calculator.
+"""
+import numpy as np
+import pytest
+
+from src.trackrealties.analytics.financial_metrics import FinancialCalculator
+
+
+def _npv(cash_flows, rate):
+    return sum(cf / (1 + rate) ** i for i, cf in enumerate(cash_flows))
+
+
+def test_calculate_irr_single_period():
+    assert FinancialCalculator.calculate_irr([-100, 110]) == pytest.approx(0.10)
+
+
+def test_calculate_irr_zeroes_npv():
+    cash_flows = [-100000, 12000, 12500, 13000, 13500, 120000]
+
+    irr = FinancialCalculator.calculate_irr(cash_flows)
+
+    assert _npv(cash_flows, irr) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_calculate_irr_newton_path_matches_roots_path():
+    cash_flows = [-1000.0] + [60.0] * 60
+
+    roots_irr = FinancialCalculator.calculate_irr(cash_flows[:50])
+    newton_irr = FinancialCalculator._newton_irr(np.asarray(cash_flows[:50]))
+
+    assert roots_irr == pytest.approx(newton_irr, abs=1e-8)
+    assert _npv(cash_flows, FinancialCalculator.calculate_irr(cash_flows)) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_irr_newton_kernel_matches_numpy_path():
+    from src.trackrealties.analytics._irr_numba import _irr_newton_kernel
+
+    cash_flows = np.asarray([-1000.0] + [60.0] * 60)
+
+    assert _irr_newton_kernel(cash_flows, 100) == pytest.approx(
+        FinancialCalculator._newton_irr(cash_flows), abs=1e-10
+    )
+
+
+def test_calculate_mortgage_payment_batch_matches_scalar():
+    loans = [300000, 250000, 0, 100000]
+    rates = [6.5, 0.0, 5.0, 7.25]
+    terms = [30, 15, 30, 0]
+
+    payments = FinancialCalculator.calculate_mortgage_payment_batch(loans, rates, terms)
+
+    expected = [
+        FinancialCalculator.calculate_mortgage_payment(loan, rate, term)
+        for loan, rate, term in zip(loans, rates, terms)
+    ]
+    np.testing.assert_allclose(payments, expected)
+
+
+def test_newton_irr_returns_zero_when_rate_leaves_domain():
+    # No real IRR exists; the Newton step overshoots below -100%
+    assert FinancialCalculator._newton_irr(np.asarray([-100.0, 300.0, -250.0])) == 0.0
+
+
+def test_calculate_npv_discounts_each_period():
+    npv = FinancialCalculator.calculate_npv(1000, [300, 400, 500], 0.08)
+
+    assert npv == pytest.approx(-1000 + 300 / 1.08 + 400 / 1.08 ** 2 + 500 / 1.08 ** 3)
+
+
+def test_round_floats_rounds_nested_report():
+    from src.trackrealties.analytics.financial_metrics import round_floats
+
+    report = {"value": 1.23456, "items": [{"price": 2.5551}, 3], "label": "x", "count": 7}
+
+    assert round_floats(report) == {"value": 1.23, "items": [{"price": 2.56}, 3], "label": "x", "count": 7}
+
+
+def test_financial_metrics_is_slotted_and_frozen():
+    import dataclasses
+
+    from src.trackrealties.analytics.financial_metrics import FinancialMetrics
+
+    metrics = FinancialMetrics(
+        roi=10.0, irr=8.0, npv=1000.0, cash_on_cash_return=6.0, cap_rate=5.5,
+        debt_service_coverage_ratio=1.3, break_even_occupancy=80.0, payback_period=9,
+    )
+
+    assert not hasattr(metrics, "__dict__")
+    assert hash(metrics) == hash(dataclasses.replace(metrics))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metrics.roi = 12.0
+
+
+def test_projection_kernels_agree():
+    from src.trackrealties.analytics._projections import (
+        _project_cashflows_kernel,
+        _project_cashflows_numpy,
+        project_many,
+    )
+
+    expected = _project_cashflows_numpy(300000.0, 2000.0, 0.04, 0.03, 10)
+
+    np.testing.assert_allclose(_project_cashflows_kernel(300000.0, 2000.0, 0.04, 0.03, 10), expected)
+    np.testing.assert_allclose(expected[0], [312000.0, 12000.0 + 24000.0])
+
+    many = project_many(np.array([[300000.0, 2000.0, 0.04, 0.03], [200000.0, 1500.0, 0.0, 0.0]]), 10)
+    np.testing.assert_allclose(many[0], expected)
+    np.testing.assert_allclose(many[1, -1], [200000.0, 1500.0 * 12 * 10])
@@ -0,0 +1,42 @@
+"""
+Unit tests for the cached health check route.
+"""
+import asyncio
+
+import pytest
+
+from src.trackrealties.api.routes import health
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    calls = []
+
+    async def fake_check():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return True
+
+    monkeypatch.setattr(health, "test_connection", fake_check)
+    monkeypatch.setattr(health, "test_graph_connection", fake_check)
+    monkeypatch.setattr(health, "_cached_status", None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probes_share_one_check(probes):
+    statuses = await asyncio.gather(*(health.health_check() for _ in range(5)))
+
+    assert all(status is statuses[0] for status in statuses)
+    assert statuses[0].status == "healthy"
+    # One database and one graph check
+    assert len(probes) == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_status_is_rechecked(probes, monkeypatch):
+    first = await health.health_check()
+    monkeypatch.setattr(health, "HEALTH_CACHE_TTL_SECONDS", 0.0)
+
+    assert await health.health_check() is not first
+    assert len(probes) == 4
@@ -39,3 +39,36 @@ async def test_investor_agent_run():
     assert response.content == "This is a test response from the investor agent."
     assert response.validation_result is not None
     mock_rag_pipeline.generate_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_investor_agent_run_tools_parallel_isolates_failures():
+    """
+    Tests that parallel tool dispatch preserves order and isolates errors.
+    """
+    agent = InvestorAgent(deps=AgentDependencies(rag_pipeline=create_autospec(RAGPipeline)))
+
+    results = await agent.run_tools_parallel([
+        {"name": "graph_search", "arguments": {"query": "Austin"}},
+        {"name": "roi_projection", "arguments": {"purchase_price": 100000}},
+        {"name": "missing_tool"},
+    ])
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+    assert results[2] == {"success": False, "error": "Unknown tool: missing_tool"}
+
+
+@pytest.mark.asyncio
+async def test_tool_execute_batch_preserves_order_and_isolates_failures():
+    """
+    Tests that a tool's batch execution returns per-input results in order.
+    """
+    agent = InvestorAgent(deps=AgentDependencies(rag_pipeline=create_autospec(RAGPipeline)))
+    tool = agent.tools["graph_search"]
+
+    results = await tool.execute_batch([{"query": "Austin"}, {}, {"query": "Dallas"}])
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+    assert results[2]["success"] is True
@@ -0,0 +1,56 @@
+"""
+Unit tests for JSON record iteration used by the ingestion commands.
+"""
+import json
+
+import pytest
+
+from src.trackrealties.data.utils import json_records
+from src.trackrealties.data.utils.json_records import batched, iter_json_records
+
+
+def _write(tmp_path, value):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps(value))
+    return str(path)
+
+
+@pytest.fixture(params=[False, True], ids=["load", "stream"])
+def streaming(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(json_records, "STREAMING_THRESHOLD_BYTES", 0)
+    return request.param
+
+
+def test_iter_json_records_yields_array_elements(tmp_path, streaming):
+    path = _write(tmp_path, [{"id": 1, "price": 1.5}, {"id": 2, "price": 2.0}])
+
+    assert list(iter_json_records(path)) == [{"id": 1, "price": 1.5}, {"id": 2, "price": 2.0}]
+
+
+def test_iter_json_records_handles_single_object(tmp_path, streaming):
+    path = _write(tmp_path, {"id": 1})
+
+    assert list(iter_json_records(path)) == [{"id": 1}]
+    with pytest.raises(ValueError):
+        list(iter_json_records(path, require_array=True))
+
+
+def test_batched_groups_records():
+    assert list(batched(iter(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
+
+
+def test_load_json_file_parses_whole_file(tmp_path):
+    path = _write(tmp_path, {"records": [1, 2.5, None]})
+
+    assert json_records.load_json_file(path) == {"records": [1, 2.5, None]}
+
+
+def test_load_json_file_rejects_empty_file(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        json_records.load_json_file(str(path))
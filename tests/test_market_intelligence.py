@@ -0,0 +1,116 @@
+"""
+Unit tests for the market intelligence engine.
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.trackrealties.analytics.market_intelligence import MarketIntelligenceEngine
+
+
+def test_calculate_market_volatility_is_population_std_of_returns():
+    prices = [100.0, 110.0, 99.0, 0.0, 120.0, None]
+    market_data = [SimpleNamespace(median_price=price, sales_volume=None, date=None) for price in prices]
+
+    volatility = MarketIntelligenceEngine().calculate_market_volatility(market_data)
+
+    # The return out of the zero price is skipped and the missing price is ignored
+    assert volatility == pytest.approx(np.std([0.1, -0.1, -1.0]))
+
+
+def test_calculate_market_volatility_needs_two_prices():
+    engine = MarketIntelligenceEngine()
+
+    assert engine.calculate_market_volatility(_points([100.0])) == 0.0
+
+
+def _points(prices, volumes=None, start=None, step_days=30):
+    from datetime import datetime, timedelta
+
+    start = start or datetime.now() - timedelta(days=step_days * len(prices))
+    volumes = volumes or [None] * len(prices)
+    return [
+        SimpleNamespace(median_price=price, sales_volume=volume, date=start + timedelta(days=step_days * i))
+        for i, (price, volume) in enumerate(zip(prices, volumes))
+    ]
+
+
+def test_analyze_market_trends_uses_recent_window_in_date_order():
+    points = _points([100.0, 200.0, 300.0, 306.0, 330.0], volumes=[10, 0, 20, 25, 30])
+    # Out-of-order input is analysed chronologically
+    points = [points[3], points[0], points[4], points[1], points[2]]
+
+    trend = MarketIntelligenceEngine().analyze_market_trends(points, timeframe_days=100)
+
+    # Last 100 days hold the final three points
+    assert trend.price_change_percent == pytest.approx(10.0)
+    assert trend.volume_change_percent == pytest.approx(50.0)
+    assert trend.trend_direction == 'up'
+
+
+def test_forecast_property_value_compounds_monthly_rate():
+    from datetime import datetime
+
+    points = _points([100.0, 105.0, 110.25], start=datetime(2024, 1, 1), step_days=31)
+
+    forecast = MarketIntelligenceEngine().forecast_property_value(1000.0, points, forecast_months=2)
+
+    assert forecast["monthly_rate"] == pytest.approx(5.0)
+    assert forecast["forecasted_value"] == pytest.approx(1102.5)
+    assert forecast["trend"] == "appreciating"
+
+
+def test_volatility_kernel_matches_numpy_path():
+    from src.trackrealties.analytics._kernels import _volatility_kernel, _volatility_numpy
+
+    prices = np.array([100.0, 110.0, 99.0, 0.0, 120.0, 130.0])
+
+    assert _volatility_kernel(prices) == pytest.approx(_volatility_numpy(prices))
+    assert _volatility_kernel(np.array([0.0, 5.0])) == 0.0
+
+
+def test_series_arrays_are_cached_per_list():
+    engine = MarketIntelligenceEngine()
+    points = _points([100.0, 110.0, 120.0])
+
+    first = engine._series_arrays(points)
+
+    assert engine._series_arrays(points) is first
+    points.append(_points([130.0])[0])
+    assert engine._series_arrays(points) is not first
+
+
+def test_generate_market_summary_reports_latest_dated_point():
+    points = _points([100.0, 110.0, 120.0])
+    for point in points:
+        point.location = None
+        point.inventory_count = 5
+        point.days_on_market = 30
+    points.reverse()
+
+    summary = MarketIntelligenceEngine().generate_market_summary(points)
+
+    assert summary["median_price"] == 120.0
+    assert summary["location"] == "N/A"
+    assert summary["latest_date"] == points[0].date.isoformat()
+
+
+def test_analyze_market_trends_reuses_result_for_same_window():
+    engine = MarketIntelligenceEngine()
+    points = _points([100.0, 110.0, 120.0])
+
+    trend = engine.analyze_market_trends(points)
+
+    assert engine.analyze_market_trends(points) is trend
+    assert engine.analyze_market_trends(list(points)) == trend
+    assert engine.analyze_market_trends(points[:1]).forecast_confidence == 0.0
+
+
+def test_chronological_order_handles_sorted_unsorted_and_undated():
+    from src.trackrealties.analytics.market_intelligence import _chronological_order
+
+    assert _chronological_order(np.array([1.0, 2.0, 2.0, 3.0])).tolist() == [0, 1, 2, 3]
+    assert _chronological_order(np.array([3.0, 1.0, 2.0])).tolist() == [1, 2, 0]
+    assert _chronological_order(np.array([1.0, np.nan, 2.0])).tolist() == [0, 2]
+    assert _chronological_order(np.array([])).tolist() == []
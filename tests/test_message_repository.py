@@ -0,0 +1,55 @@
+"""
+Unit tests for the conversation message repository.
+"""
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.trackrealties.data.repository import MessageRepository
+from src.trackrealties.models.db import MessageRole
+
+
+class _RecordingConnection:
+    """Stands in for an asyncpg connection, echoing inserted rows back."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        columns = ("session_id", "role", "content", "tools_used", "validation_result",
+                   "confidence_score", "processing_time_ms", "token_count", "metadata", "created_at")
+        return [
+            dict(zip(columns, row), id=uuid4(), created_at=row[-1] or datetime.now(timezone.utc))
+            for row in zip(*args)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_add_conversation_messages_inserts_all_rows_in_one_query():
+    conn = _RecordingConnection()
+    session_id = uuid4()
+    sent_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    messages = await MessageRepository(conn).add_conversation_messages([
+        {"session_id": session_id, "role": MessageRole.USER, "content": "hi", "created_at": sent_at},
+        {"session_id": session_id, "role": MessageRole.ASSISTANT, "content": "hello", "metadata": {"streamed": True}},
+    ])
+
+    assert len(conn.calls) == 1
+    _, args = conn.calls[0]
+    assert args[1] == ["user", "assistant"]
+    assert [json.loads(m) for m in args[8]] == [{}, {"streamed": True}]
+    assert [m.content for m in messages] == ["hi", "hello"]
+    assert messages[0].created_at == sent_at
+    assert messages[1].metadata == {"streamed": True}
+
+
+@pytest.mark.asyncio
+async def test_add_conversation_messages_skips_empty_batch():
+    conn = _RecordingConnection()
+
+    assert await MessageRepository(conn).add_conversation_messages([]) == []
+    assert conn.calls == []
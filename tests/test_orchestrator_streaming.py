@@ -0,0 +1,35 @@
+"""
+Unit tests for stream chunk coalescing in the agent orchestrator.
+"""
+import asyncio
+
+import pytest
+
+from src.trackrealties.agents.orchestrator import STREAM_BUFFER_CHARS, _coalesce_chunks
+
+
+async def _produce(items):
+    for delay, chunk in items:
+        await asyncio.sleep(delay)
+        yield chunk
+
+
+async def _collect(items):
+    return [chunk async for chunk in _coalesce_chunks(_produce(items))]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_passes_first_chunk_and_flushes_on_stall():
+    chunks = await _collect([(0, "a"), (0, "b"), (0, "c"), (0.1, "d"), (0, "e")])
+
+    # "b" and "c" are flushed by the hold timeout while "d" is still pending
+    assert chunks == ["a", "bc", "de"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_when_buffer_is_full():
+    big = "x" * (STREAM_BUFFER_CHARS // 2 + 1)
+
+    chunks = await _collect([(0, "a"), (0, big), (0, big), (0, big)])
+
+    assert chunks == ["a", big * 2, big]
@@ -0,0 +1,85 @@
+"""
+Unit tests for per-connection prepared statements.
+"""
+from types import SimpleNamespace
+
+import asyncpg
+import pytest
+
+from src.trackrealties.core import database
+from src.trackrealties.core.database import PreparedConnection, register_prepared_statement
+
+
+@pytest.fixture
+def registered():
+    """Register test statements, removing them from the global registry afterwards."""
+    names = []
+
+    def register(name, query):
+        names.append(register_prepared_statement(name, query))
+        return name
+
+    yield register
+    for name in names:
+        database._PREPARED_STATEMENTS.pop(name, None)
+
+
+def _connection(prepare):
+    connection = SimpleNamespace(_prepared={}, prepare=prepare)
+    connection.prepared = lambda name: PreparedConnection.prepared(connection, name)
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_prepared_statements_are_prepared_once_per_connection(registered):
+    name = registered("test_select_one", "SELECT 1")
+    prepared_queries = []
+
+    async def prepare(query):
+        prepared_queries.append(query)
+        return object()
+
+    connection = _connection(prepare)
+
+    first = await connection.prepared(name)
+
+    assert await connection.prepared(name) is first
+    assert prepared_queries == ["SELECT 1"]
+
+
+@pytest.mark.asyncio
+async def test_pool_init_hook_skips_statements_that_fail_to_prepare(registered, monkeypatch):
+    monkeypatch.setattr(database, "_PREPARED_STATEMENTS", {})
+    registered("test_missing_table", "SELECT * FROM missing_table")
+    registered("test_select_one", "SELECT 1")
+
+    async def prepare(query):
+        if "missing_table" in query:
+            raise asyncpg.exceptions.UndefinedTableError('relation "missing_table" does not exist')
+        return object()
+
+    connection = _connection(prepare)
+
+    await database._prepare_registered_statements(connection)
+
+    assert list(connection._prepared) == ["test_select_one"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pool_initialize_creates_one_pool(monkeypatch):
+    import asyncio
+
+    created = []
+
+    async def create_pool(*args, **kwargs):
+        await asyncio.sleep(0)
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(database.asyncpg, "create_pool", create_pool)
+    pool = database.DatabasePool("postgresql://test")
+
+    await asyncio.gather(pool.initialize(), pool.initialize())
+
+    assert len(created) == 1
+    assert pool.pool is created[0]
@@ -0,0 +1,41 @@
+"""
+Unit tests for EnhancedRAGPipeline initialization.
+"""
+import asyncio
+
+import pytest
+
+from rag_pipeline_integration import EnhancedRAGPipeline, OptimizedHybridSearch, OptimizedVectorSearch
+
+
+@pytest.mark.asyncio
+async def test_concurrent_initialize_runs_once(monkeypatch):
+    pipeline = EnhancedRAGPipeline()
+    calls = []
+
+    async def fake_initialize():
+        calls.append(1)
+        await asyncio.sleep(0)
+
+    for component in (pipeline.vector_search, pipeline.graph_search):
+        monkeypatch.setattr(component, "initialize", fake_initialize)
+
+    await asyncio.gather(*(pipeline.initialize() for _ in range(5)))
+
+    assert pipeline.initialized
+    assert pipeline.hybrid_search.initialized
+    assert len(calls) == 2
+
+
+def test_hybrid_search_shares_the_pipeline_engines():
+    pipeline = EnhancedRAGPipeline()
+
+    assert pipeline.hybrid_search.vector_search is pipeline.vector_search
+    assert pipeline.hybrid_search.graph_search is pipeline.graph_search
+
+
+def test_vector_search_engines_share_one_memory_index():
+    standalone = OptimizedHybridSearch()
+
+    assert standalone.vector_search.memory_index is EnhancedRAGPipeline().vector_search.memory_index
+    assert OptimizedVectorSearch().memory_index is standalone.vector_search.memory_index
@@ -0,0 +1,16 @@
+"""
+Unit tests for RAG search helpers.
+"""
+from src.trackrealties.rag.search import metadata_filter_clause
+
+
+def test_metadata_filter_clause_binds_keys_and_values():
+    clause, values = metadata_filter_clause({"city": "Austin", "beds": 3, "pool": True}, first_param=4)
+
+    assert clause == "WHERE metadata->>$4 = $5 AND metadata->>$6 = $7 AND metadata->>$8 = $9"
+    assert values == ["city", "Austin", "beds", "3", "pool", "true"]
+
+
+def test_metadata_filter_clause_without_filters():
+    assert metadata_filter_clause(None, first_param=4) == ("", [])
+    assert metadata_filter_clause({}, first_param=4) == ("", [])
@@ -0,0 +1,100 @@
+"""
+Unit tests for the rate limiting middleware.
+"""
+import pytest
+
+from src.trackrealties.api.middleware import RateLimitMiddleware
+
+
+class _FakeRedis:
+    """Stands in for the async Redis client, recording pipelined commands."""
+
+    def __init__(self):
+        self.counts = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incrby(self, key, amount):
+        self.commands.append(("incrby", key, amount))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for command, key, value in self.commands:
+            if command == "incrby":
+                self.redis.counts[key] = self.redis.counts.get(key, 0) + value
+                results.append(self.redis.counts[key])
+            else:
+                results.append(True)
+        return results
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_defers_to_redis_when_local_bucket_is_empty(monkeypatch):
+    monkeypatch.setattr("src.trackrealties.api.middleware.time.time", lambda: 120.0)
+    middleware = RateLimitMiddleware(app=None, requests_per_minute=2)
+    middleware.redis_client = _FakeRedis()
+
+    results = [await middleware._check_rate_limit("ip:1.2.3.4") for _ in range(3)]
+
+    # The first two are admitted locally; the third reports all three at once
+    assert results == [True, True, False]
+    assert middleware.redis_client.round_trips == 1
+    assert middleware.redis_client.counts == {"rate_limit:ip:1.2.3.4:2": 3}
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_syncs_local_admissions_periodically(monkeypatch):
+    monkeypatch.setattr("src.trackrealties.api.middleware.time.time", lambda: 120.0)
+    middleware = RateLimitMiddleware(app=None, requests_per_minute=100)
+    middleware.redis_client = _FakeRedis()
+
+    for _ in range(2 * middleware.REDIS_SYNC_EVERY + 1):
+        assert await middleware._check_rate_limit("ip:1.2.3.4")
+
+    assert middleware.redis_client.round_trips == 2
+    assert middleware.redis_client.counts == {"rate_limit:ip:1.2.3.4:2": 2 * middleware.REDIS_SYNC_EVERY}
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_holds_across_workers_sharing_redis(monkeypatch):
+    now = [120.0]
+    monkeypatch.setattr("src.trackrealties.api.middleware.time.time", lambda: now[0])
+    redis = _FakeRedis()
+    first = RateLimitMiddleware(app=None, requests_per_minute=20)
+    second = RateLimitMiddleware(app=None, requests_per_minute=20)
+    first.redis_client = second.redis_client = redis
+
+    # The first worker uses up the shared window, reporting every request
+    assert all([await first._check_rate_limit("ip:1.2.3.4") for _ in range(20)])
+    # The second worker still has local tokens, but Redis refuses its first sync
+    results = [await second._check_rate_limit("ip:1.2.3.4") for _ in range(second.REDIS_SYNC_EVERY)]
+    assert results == [True] * (second.REDIS_SYNC_EVERY - 1) + [False]
+
+    # From then on every request is checked against Redis, and refused
+    round_trips = redis.round_trips
+    assert not any([await second._check_rate_limit("ip:1.2.3.4") for _ in range(5)])
+    assert redis.round_trips == round_trips + 5
+
+    # A new window admits the client again
+    now[0] = 180.0
+    assert await second._check_rate_limit("ip:1.2.3.4")
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_allows_requests_without_redis():
+    middleware = RateLimitMiddleware(app=None)
+    middleware.redis_client = None
+
+    assert await middleware._check_rate_limit("ip:1.2.3.4")
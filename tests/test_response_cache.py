@@ -0,0 +1,47 @@
+"""
+Unit tests for the semantic agent response cache.
+"""
+from src.trackrealties.agents.base import AgentResponse
+from src.trackrealties.agents.response_cache import SemanticResponseCache
+
+
+def test_semantic_cache_hits_similar_queries_per_role():
+    cache = SemanticResponseCache(threshold=0.95, max_entries=2)
+    response = AgentResponse(content="Austin prices are rising.")
+    cache.set("investor", [1.0, 0.0, 0.0], response)
+
+    assert cache.get("investor", [0.99, 0.01, 0.0]) is response
+    assert cache.get("investor", [0.0, 1.0, 0.0]) is None
+    assert cache.get("buyer", [1.0, 0.0, 0.0]) is None
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache = SemanticResponseCache(threshold=0.95, max_entries=2)
+    cache.set("investor", [1.0, 0.0, 0.0], AgentResponse(content="a"))
+    cache.set("investor", [0.0, 1.0, 0.0], AgentResponse(content="b"))
+    cache.get("investor", [1.0, 0.0, 0.0])
+    cache.set("investor", [0.0, 0.0, 1.0], AgentResponse(content="c"))
+
+    assert cache.get("investor", [0.0, 1.0, 0.0]) is None
+    assert cache.get("investor", [1.0, 0.0, 0.0]).content == "a"
+    assert cache.get("investor", [0.0, 0.0, 1.0]).content == "c"
+
+
+def test_semantic_cache_expires_entries():
+    cache = SemanticResponseCache(ttl_seconds=-1)
+    cache.set("investor", [1.0, 0.0], AgentResponse(content="stale"))
+
+    assert cache.get("investor", [1.0, 0.0]) is None
+
+
+def test_semantic_cache_reuses_freed_rows():
+    cache = SemanticResponseCache(threshold=0.95, max_entries=2)
+    for i in range(20):
+        vector = [0.0] * 20
+        vector[i] = 1.0
+        cache.set("investor", vector, AgentResponse(content=str(i)))
+
+    entries = cache._entries["investor"]
+    assert len(entries.matrix) == 16
+    assert cache.get("investor", [0.0] * 18 + [1.0, 0.0]).content == "18"
+    assert cache.get("investor", [1.0] + [0.0] * 19) is None
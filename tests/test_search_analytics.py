@@ -0,0 +1,37 @@
+"""
+Unit tests for search analytics reporting.
+"""
+import pytest
+
+from src.trackrealties.analytics.search import InMemoryAnalyticsStore, SearchAnalytics
+
+
+@pytest.mark.asyncio
+async def test_performance_report_aggregates_per_strategy_and_failures():
+    analytics = SearchAnalytics()
+    for i, (strategy, response_time, results) in enumerate([
+        ("vector", 1.0, [object()]),
+        ("graph", 3.0, []),
+        ("vector", 2.0, []),
+    ]):
+        await analytics.log_search_execution(f"q{i}", strategy, results, response_time)
+
+    report = await analytics.generate_performance_report()
+
+    assert report["strategy_performance"] == {
+        "vector": {"count": 2, "avg_response_time": 1.5},
+        "graph": {"count": 1, "avg_response_time": 3.0},
+    }
+    assert report["failure_analysis"] == {"failed_count": 2, "failed_queries": ["q1", "q2"]}
+    assert "failed queries" in report["recommendations"]["message"]
+
+
+@pytest.mark.asyncio
+async def test_store_keeps_only_most_recent_searches():
+    store = InMemoryAnalyticsStore(max_logs=2)
+    analytics = SearchAnalytics(store)
+    for i, (strategy, response_time) in enumerate([("vector", 10.0), ("graph", 1.0), ("vector", 3.0)]):
+        await analytics.log_search_execution(f"q{i}", strategy, [object()], response_time)
+
+    assert [entry["query"] for entry in await store.get_all_searches()] == ["q1", "q2"]
+    assert await store.get_strategy_totals() == {"vector": (1, 3.0), "graph": (1, 1.0)}
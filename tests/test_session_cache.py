@@ -0,0 +1,68 @@
+"""
+Unit tests for the in-process session cache.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.trackrealties.data.session_cache import SessionCache
+from src.trackrealties.models.db import Session, UserRole
+
+
+def _session(expires_in=timedelta(hours=1)):
+    return Session(id=uuid4(), user_role=UserRole.INVESTOR, expires_at=datetime.now(timezone.utc) + expires_in)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_only_loads_once():
+    cache = SessionCache()
+    session = _session()
+    loads = []
+
+    async def loader(session_id):
+        loads.append(session_id)
+        return session
+
+    assert await cache.get_or_load(session.id, loader) is session
+    assert await cache.get_or_load(session.id, loader) is session
+    assert loads == [session.id]
+
+
+@pytest.mark.asyncio
+async def test_missing_sessions_are_not_cached():
+    cache = SessionCache()
+    loads = []
+
+    async def loader(session_id):
+        loads.append(session_id)
+        return None
+
+    session_id = uuid4()
+    assert await cache.get_or_load(session_id, loader) is None
+    assert await cache.get_or_load(session_id, loader) is None
+    assert len(loads) == 2
+
+
+def test_stale_and_expired_sessions_are_dropped():
+    cache = SessionCache(ttl_seconds=-1)
+    session = _session()
+    cache.set(session)
+    assert cache.get(session.id) is None
+
+    cache = SessionCache()
+    expired = _session(expires_in=timedelta(seconds=-1))
+    cache.set(expired)
+    assert cache.get(expired.id) is None
+
+
+def test_lru_eviction_and_invalidate():
+    cache = SessionCache(max_entries=1)
+    first, second = _session(), _session()
+    cache.set(first)
+    cache.set(second)
+
+    assert cache.get(first.id) is None
+    assert cache.get(second.id) is second
+    cache.invalidate(second.id)
+    assert cache.get(second.id) is None
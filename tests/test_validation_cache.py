@@ -0,0 +1,41 @@
+"""
+Unit tests for the on-disk dry-run validation cache.
+"""
+from src.trackrealties.data.utils.validation_cache import ValidationCache
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text)
+    return str(path)
+
+
+def test_key_depends_on_contents_and_params(tmp_path):
+    cache = ValidationCache(str(tmp_path / "cache"))
+    path = _write(tmp_path, "[1, 2]")
+    key = cache.key(path, "market_data")
+
+    assert cache.key(path, "market_data") == key
+    assert cache.key(path, "property_listing") != key
+
+    _write(tmp_path, "[1, 3]")
+    assert cache.key(path, "market_data") != key
+
+
+def test_get_returns_stored_result_and_none_on_miss(tmp_path):
+    cache = ValidationCache(str(tmp_path / "cache"))
+    key = cache.key(_write(tmp_path, "[]"))
+
+    assert cache.get(key) is None
+
+    cache.set(key, {"total": 2, "valid": 1, "errors": ["bad price"]})
+
+    assert cache.get(key) == {"total": 2, "valid": 1, "errors": ["bad price"]}
+
+
+def test_get_ignores_corrupt_entry(tmp_path):
+    cache = ValidationCache(str(tmp_path / "cache"))
+    cache.cache_dir.mkdir()
+    (cache.cache_dir / "abc.json").write_text("{not json")
+
+    assert cache.get("abc") is None